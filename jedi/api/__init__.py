@@ -17,6 +17,7 @@ from jedi.parser_utils import get_executable_nodes
 from jedi import debug
 from jedi import settings
 from jedi import cache
+from jedi import profiler
 from jedi.file_io import KnownContentFileIO
 from jedi.api import classes
 from jedi.api import interpreter
@@ -135,6 +136,16 @@ class Script:
         cache.clear_time_caches()
         debug.reset_time()
 
+    def get_cache_statistics(self):
+        """
+        Returns the number of entries, the estimated size in bytes and the
+        hits and misses of every cache, including the caches of this script.
+        See :func:`jedi.cache.get_statistics`.
+
+        :rtype: dict
+        """
+        return cache.get_statistics(self._inference_state)
+
     # Cache the module, this is mostly useful for testing, since this shouldn't
     # be called multiple times.
     @cache.memoize_method
@@ -191,6 +202,7 @@ class Script:
             self._inference_state.environment,
         )
 
+    @profiler.profile('api', name='Script.complete')
     @validate_line_column
     def complete(self, line=None, column=None, *, fuzzy=False):
         """
@@ -214,6 +226,7 @@ class Script:
             )
             return completion.complete()
 
+    @profiler.profile('api', name='Script.infer')
     @validate_line_column
     def infer(self, line=None, column=None, *, only_stubs=False, prefer_stubs=False):
         self._inference_state.reset_recursion_limitations()
@@ -259,6 +272,7 @@ class Script:
         # the API.
         return helpers.sorted_definitions(set(defs))
 
+    @profiler.profile('api', name='Script.goto')
     @validate_line_column
     def goto(self, line=None, column=None, *, follow_imports=False, follow_builtin_imports=False,
              only_stubs=False, prefer_stubs=False):
@@ -353,6 +367,7 @@ class Script:
         """
         return self._search_func(string, complete=True, **kwargs)
 
+    @profiler.profile('api', name='Script.help')
     @validate_line_column
     def help(self, line=None, column=None):
         """
@@ -397,6 +412,7 @@ class Script:
                 return [classes.Name(self._inference_state, name)]
         return []
 
+    @profiler.profile('api', name='Script.get_references')
     @validate_line_column
     def get_references(self, line=None, column=None, **kwargs):
         """
@@ -428,6 +444,7 @@ class Script:
             return helpers.sorted_definitions(definitions)
         return _references(**kwargs)
 
+    @profiler.profile('api', name='Script.get_signatures')
     @validate_line_column
     def get_signatures(self, line=None, column=None):
         """
@@ -466,6 +483,7 @@ class Script:
         return [classes.Signature(self._inference_state, signature, call_details)
                 for signature in definitions.get_signatures()]
 
+    @profiler.profile('api', name='Script.get_context')
     @validate_line_column
     def get_context(self, line=None, column=None):
         """
@@ -4,10 +4,14 @@ static analysis. The Python binary in that environment is going to be executed.
 """
 import os
 import sys
+import pickle
 import hashlib
 import filecmp
+import tempfile
 from collections import namedtuple
 from shutil import which
+from jedi import debug
+from jedi import settings
 from jedi.cache import memoize_method, time_cache
 from jedi.inference.compiled.subprocess import CompiledSubprocess, InferenceStateSameProcess, InferenceStateSubprocess
 import parso
@@ -16,6 +20,7 @@ _SUPPORTED_PYTHONS = ['3.12', '3.11', '3.10', '3.9', '3.8', '3.7', '3.6']
 _SAFE_PATHS = ['/usr/bin', '/usr/local/bin']
 _CONDA_VAR = 'CONDA_PREFIX'
 _CURRENT_VERSION = '%s.%s' % (sys.version_info.major, sys.version_info.minor)
+_PERSISTED_INFO_VERSION = 2
 
 class InvalidPythonEnvironment(Exception):
     """
@@ -24,7 +29,11 @@ class InvalidPythonEnvironment(Exception):
     """
 
 class _BaseEnvironment:
-    pass
+
+    @memoize_method
+    def get_grammar(self):
+        version_string = '%s.%s' % (self.version_info.major, self.version_info.minor)
+        return parso.load_grammar(version=version_string)
 
 class Environment(_BaseEnvironment):
     """
@@ -33,11 +42,49 @@ class Environment(_BaseEnvironment):
     functions instead. It is then returned by that function.
     """
     _subprocess = None
+    _persisted_info = None
 
     def __init__(self, executable, env_vars=None):
         self._start_executable = executable
         self._env_vars = env_vars
-        self._get_subprocess()
+        info = _load_persisted_info(executable, env_vars)
+        if info is None:
+            # Initialize the environment
+            self._get_subprocess()
+        else:
+            # The interpreter did not change since we last asked it, there's
+            # no need to start a subprocess just to get its version.
+            self._persisted_info = info
+            self._set_info(info[:3])
+
+    def _set_info(self, info):
+        # Since it could change and might not be the same(?) as the one given,
+        # set it here.
+        self.executable = info[0]  # matches ``sys.executable``
+        self.path = info[1]  # matches ``sys.prefix``
+        self.version_info = _VersionInfo(*info[2])
+
+    def _get_subprocess(self):
+        if self._subprocess is not None and not self._subprocess.is_crashed:
+            return self._subprocess
+
+        try:
+            self._subprocess = CompiledSubprocess(self._start_executable, env_vars=self._env_vars)
+            if self._persisted_info is None:
+                info = self._subprocess._send(None, _get_info)
+        except Exception as exc:
+            raise InvalidPythonEnvironment('Could not get version information for %r: %r' % (self._start_executable, exc))
+
+        if self._persisted_info is None:
+            self._set_info(info)
+        return self._subprocess
+
+    def get_inference_state_subprocess(self, inference_state):
+        compiled_subprocess = self._get_subprocess()
+        # A new inference state is created for every API call, which makes
+        # this a good moment for a restart.
+        compiled_subprocess.check_memory()
+        return InferenceStateSubprocess(inference_state, compiled_subprocess)
 
     def __repr__(self):
         version = '.'.join((str(i) for i in self.version_info))
@@ -51,7 +98,16 @@ class Environment(_BaseEnvironment):
 
         :returns: list of str
         """
-        return self._get_subprocess().get_sys_path()
+        if self._persisted_info is not None:
+            return list(self._persisted_info[3])
+
+        sys_path = self._get_subprocess().get_sys_path()
+        _save_persisted_info(
+            self._start_executable,
+            self._env_vars,
+            (self.executable, self.path, tuple(self.version_info), sys_path)
+        )
+        return sys_path
 
 class _SameEnvironmentMixin:
 
@@ -69,6 +125,89 @@ class InterpreterEnvironment(_SameEnvironmentMixin, _BaseEnvironment):
         super().__init__()
         self._get_subprocess = lambda: InferenceStateSameProcess(self)
 
+def _get_info():
+    return (sys.executable, sys.prefix, sys.version_info[:3])
+
+def _get_persisted_info_path(executable, env_vars):
+    key = repr((os.path.abspath(executable), sorted((env_vars or {}).items())))
+    file_name = hashlib.sha256(key.encode('utf-8')).hexdigest() + '.pkl'
+    return os.path.join(settings.cache_directory, 'environments', file_name)
+
+def _get_interpreter_stamp(executable, env_vars):
+    """
+    Returns a value that changes as soon as the interpreter behind
+    ``executable`` is replaced, the virtualenv around it is recreated or the
+    ``PYTHONPATH`` that it would be started with is modified.
+    """
+    stat = os.stat(executable)
+    pyvenv_cfg = os.path.join(os.path.dirname(os.path.dirname(executable)), 'pyvenv.cfg')
+    try:
+        with open(pyvenv_cfg, 'rb') as f:
+            pyvenv_content = f.read()
+    except OSError:
+        pyvenv_content = None
+    python_path = (os.environ if env_vars is None else env_vars).get('PYTHONPATH')
+    return stat.st_mtime_ns, stat.st_size, pyvenv_content, python_path
+
+def _get_site_packages_stamp(sys_path):
+    """
+    Returns a value that changes when packages are installed or removed, i.e.
+    when the site-packages directories or the ``.pth`` files in them change.
+    """
+    stamp = []
+    for path in sys_path:
+        if os.path.basename(path) not in ('site-packages', 'dist-packages'):
+            continue
+        try:
+            pth_files = tuple(sorted(
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in os.scandir(path)
+                if entry.name.endswith('.pth')
+            ))
+            stamp.append((path, os.stat(path).st_mtime_ns, pth_files))
+        except OSError:
+            stamp.append((path, None, ()))
+    return tuple(stamp)
+
+def _load_persisted_info(executable, env_vars):
+    """
+    Returns the ``(executable, prefix, version_info, sys_path)`` that were
+    persisted for this interpreter or None if they are missing or outdated.
+    """
+    try:
+        stamp = _get_interpreter_stamp(executable, env_vars)
+        with open(_get_persisted_info_path(executable, env_vars), 'rb') as f:
+            version, persisted_stamp, site_packages_stamp, info = pickle.load(f)
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        return None
+
+    if version != _PERSISTED_INFO_VERSION or persisted_stamp != stamp:
+        return None
+    # Installing a package might add paths (e.g. via .pth files), the cached
+    # sys path is outdated in that case.
+    if _get_site_packages_stamp(info[3]) != site_packages_stamp:
+        return None
+    return info
+
+def _save_persisted_info(executable, env_vars, info):
+    path = _get_persisted_info_path(executable, env_vars)
+    try:
+        stamp = _get_interpreter_stamp(executable, env_vars)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temporary file first, other processes might be reading
+        # the same file concurrently.
+        fd, tmp_path = tempfile.mkstemp(dir=directory)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(
+                (_PERSISTED_INFO_VERSION, stamp, _get_site_packages_stamp(info[3]), info),
+                f,
+                pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, path)
+    except OSError as e:
+        debug.warning('Unable to persist environment information for %s: %s', executable, e)
+
 def _get_virtual_env_from_var(env_var='VIRTUAL_ENV'):
     """Get virtualenv environment from VIRTUAL_ENV environment variable.
 
@@ -6,18 +6,64 @@ available:
 - ``time_cache`` can be used to cache something for just a limited time span,
   which can be useful if there's user interaction and the user cannot react
   faster than a certain time.
+- ``LRUCache`` is a size bounded cache that can be invalidated as a whole by
+  starting a new generation.
+
+:func:`get_statistics` reports the size and the hit rate of all of those
+caches and of the caches of an inference state.
 
 This module is one of the reasons why |jedi| is not thread-safe. As you can see
 there are global variables, which are holding the cache information. Some of
 these variables are being cleaned after every API usage.
 """
+import sys
 import time
+from collections import Counter, OrderedDict
+from threading import Lock
 from functools import wraps
 from typing import Any, Dict, Tuple
 from jedi import settings
 from parso.cache import parser_cache
 _time_caches: Dict[str, Dict[Any, Tuple[float, Any]]] = {}
 
+
+class CacheStatistics:
+    """
+    Hit and miss counters of caches, by cache name. Lookups are only counted
+    while statistics are enabled (see :func:`enable_statistics`), callers
+    check ``CacheStatistics.enabled`` first. The counters are never reset, so
+    they can be exported as monotonic counters.
+    """
+    enabled = False
+
+    def __init__(self):
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self._lock = Lock()
+
+    def count_hit(self, name):
+        with self._lock:
+            self.hits[name] += 1
+
+    def count_miss(self, name):
+        with self._lock:
+            self.misses[name] += 1
+
+
+# The counters of the global caches. The caches of an inference state are
+# counted in its own ``cache_statistics``.
+cache_statistics = CacheStatistics()
+
+
+def enable_statistics():
+    """Starts counting the hits and misses of caches."""
+    CacheStatistics.enabled = True
+
+
+def disable_statistics():
+    CacheStatistics.enabled = False
+
+
 def clear_time_caches(delete_all: bool=False) -> None:
     """ Jedi caches many things, that should be completed after each completion
     finishes.
@@ -51,8 +97,12 @@ def signature_time_cache(time_add_setting):
             if key in cache:
                 expiry, value = cache[key]
                 if current_time < expiry:
+                    if CacheStatistics.enabled:
+                        cache_statistics.count_hit('time_caches')
                     return value
 
+            if CacheStatistics.enabled:
+                cache_statistics.count_miss('time_caches')
             value = func(*args, **kwargs)
             expiry = current_time + getattr(settings, time_add_setting)
             cache[key] = (expiry, value)
@@ -60,19 +110,186 @@ def signature_time_cache(time_add_setting):
         return wrapper
     return decorator
 
+def _get_memoize_method_dct(obj):
+    # object.__getattribute__ avoids custom __getattr__ implementations like
+    # the ones of wrappers, which would return the cache of the wrapped object.
+    try:
+        dct = object.__getattribute__(obj, '__dict__')
+    except AttributeError:
+        # Classes with __slots__ need to define a ``_memoize_method_dct`` slot.
+        try:
+            return object.__getattribute__(obj, '_memoize_method_dct')
+        except AttributeError:
+            cache_dict = {}
+            object.__setattr__(obj, '_memoize_method_dct', cache_dict)
+            return cache_dict
+    return dct.setdefault('_memoize_method_dct', {})
+
 def memoize_method(method):
     """A normal memoize function."""
-    cache_name = '_cache_' + method.__name__
-
     @wraps(method)
     def wrapper(self, *args, **kwargs):
-        if not hasattr(self, cache_name):
-            setattr(self, cache_name, {})
-        cache = getattr(self, cache_name)
-
+        cache_dict = _get_memoize_method_dct(self)
+        dct = cache_dict.setdefault(method, {})
         key = (args, frozenset(kwargs.items()))
-        if key not in cache:
-            cache[key] = method(self, *args, **kwargs)
-        return cache[key]
+        try:
+            result = dct[key]
+        except KeyError:
+            if CacheStatistics.enabled:
+                cache_statistics.count_miss('memoize_method')
+            result = method(self, *args, **kwargs)
+            dct[key] = result
+            return result
+        if CacheStatistics.enabled:
+            cache_statistics.count_hit('memoize_method')
+        return result
 
     return wrapper
+
+class LRUCache:
+    """
+    A cache that holds at most ``max_size`` entries and evicts the least
+    recently used ones first. All entries belong to a generation; calling
+    :meth:`new_generation` drops everything that was cached before.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Raises :exc:`KeyError` if the key is not cached."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def new_generation(self):
+        self.generation += 1
+        self._entries.clear()
+
+    def get_statistics(self):
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'generation': self.generation,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+def _estimate_size(obj, depth=2):
+    """
+    A rough estimate of the bytes used by a cache. Containers are followed
+    ``depth`` levels deep, objects that are referenced from somewhere else
+    (like values and tree nodes) are therefore only partially counted.
+    """
+    size = sys.getsizeof(obj)
+    if depth <= 0:
+        return size
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += _estimate_size(key, depth - 1) + _estimate_size(value, depth - 1)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for value in obj:
+            size += _estimate_size(value, depth - 1)
+    return size
+
+
+def _get_cache_entry(name, entries, size=None, statistics=None):
+    if size is None:
+        size = _estimate_size(entries)
+    return {
+        'entries': len(entries),
+        'bytes': size,
+        'hits': None if statistics is None else statistics.hits[name],
+        'misses': None if statistics is None else statistics.misses[name],
+    }
+
+
+def get_statistics(inference_state=None):
+    """
+    Returns a dict of cache name to a dict with the number of ``entries``, the
+    estimated ``bytes`` and the ``hits`` and ``misses`` of that cache.
+
+    Global caches are always part of the result, the caches of an inference
+    state (e.g. ``Script._inference_state``) only if it's given. Caches that
+    are spread over many objects (like ``memoize_method``) report ``None``
+    for entries and bytes, caches that don't count their lookups report
+    ``None`` for hits and misses. Hits and misses are only counted while
+    :func:`enable_statistics` is in effect.
+    """
+    from jedi.api import completion_cache
+    from jedi.inference.gradual import typeshed
+
+    statistics = {
+        'parser_cache': _get_cache_entry(
+            'parser_cache',
+            parser_cache,
+            sum(_estimate_size(c, depth=1) for c in parser_cache.values()),
+        ),
+        'time_caches': _get_cache_entry(
+            'time_caches',
+            _time_caches,
+            sum(_estimate_size(c) for c in _time_caches.values()),
+            cache_statistics,
+        ),
+        'completion_cache': _get_cache_entry('completion_cache', completion_cache._cache),
+        'typeshed_version_cache': _get_cache_entry(
+            'typeshed_version_cache',
+            typeshed._version_cache,
+            statistics=cache_statistics,
+        ),
+        'memoize_method': {
+            'entries': None,
+            'bytes': None,
+            'hits': cache_statistics.hits['memoize_method'],
+            'misses': cache_statistics.misses['memoize_method'],
+        },
+        'memoize_default': {
+            'entries': None,
+            'bytes': None,
+            'hits': cache_statistics.hits['memoize_default'],
+            'misses': cache_statistics.misses['memoize_default'],
+        },
+    }
+
+    if inference_state is not None:
+        for name in ('memoize_cache', 'generic_class_cache'):
+            statistics[name] = _get_cache_entry(
+                name,
+                getattr(inference_state, name),
+                statistics=inference_state.cache_statistics,
+            )
+        for name in ('stub_module_cache', 'compiled_cache', 'mixed_cache', 'access_cache'):
+            statistics[name] = _get_cache_entry(name, getattr(inference_state, name))
+        statistics['module_cache'] = _get_cache_entry(
+            'module_cache',
+            inference_state.module_cache._name_cache,
+        )
+
+        lru_cache = inference_state.compiled_subprocess.access_result_cache
+        lru_statistics = lru_cache.get_statistics()
+        statistics['access_result_cache'] = {
+            'entries': lru_statistics['size'],
+            'bytes': _estimate_size(lru_cache._entries),
+            'hits': lru_statistics['hits'],
+            'misses': lru_statistics['misses'],
+        }
+    return statistics
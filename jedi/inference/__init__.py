@@ -67,6 +67,8 @@ from jedi.file_io import FileIO
 
 from jedi import debug
 from jedi import settings
+from jedi import profiler
+from jedi.cache import CacheStatistics
 from jedi.inference import imports
 from jedi.inference import recursion
 from jedi.inference.cache import inference_state_function_cache
@@ -81,6 +83,19 @@ from jedi.inference.imports import follow_error_node_imports_if_possible
 from jedi.plugins import plugin_manager
 
 
+def _get_execute_dispatch_key(value, arguments):
+    # Plugins are dispatched by the name of the executed value. Functions and
+    # classes from the syntax tree are by far the most executed values, for
+    # them the name is read from the tree instead of creating a name object.
+    tree_node = getattr(value, 'tree_node', None)
+    if tree_node is not None and tree_node.type in ('funcdef', 'classdef'):
+        return tree_node.name.value
+    try:
+        return value.name.string_name
+    except AttributeError:
+        return None
+
+
 class InferenceState:
     def __init__(self, project, environment=None, script_path=None):
         if environment is None:
@@ -92,11 +107,13 @@ class InferenceState:
 
         self.latest_grammar = parso.load_grammar(version='3.12')
         self.memoize_cache = {}  # for memoize decorators
+        self.cache_statistics = CacheStatistics()
         self.module_cache = imports.ModuleCache()  # does the job of `sys.modules`.
         self.stub_module_cache = {}  # Dict[Tuple[str, ...], Optional[ModuleValue]]
         self.compiled_cache = {}  # see `inference.compiled.create()`
         self.inferred_element_counts = {}
         self.mixed_cache = {}  # see `inference.compiled.mixed._create()`
+        self.generic_class_cache = {}  # see `gradual.base.GenericClass.create_cached()`
         self.analysis = []
         self.dynamic_params_depth = 0
         self.do_dynamic_params_search = settings.dynamic_params
@@ -113,7 +130,8 @@ class InferenceState:
             self, import_names, sys_path, prefer_stubs=prefer_stubs)
 
     @staticmethod
-    @plugin_manager.decorate()
+    @profiler.profile('inference', name='execute')
+    @plugin_manager.decorate(get_dispatch_key=_get_execute_dispatch_key)
     def execute(value, arguments):
         debug.dbg('execute: %s %s', value, arguments)
         with debug.increase_indent_cm():
@@ -143,6 +161,7 @@ class InferenceState:
         """Convenience function"""
         return self.project._get_sys_path(self, **kwargs)
 
+    @profiler.profile('inference', name='infer')
     def infer(self, context, name):
         def_ = name.get_definition(import_name_always=True)
         if def_ is not None:
@@ -180,6 +199,7 @@ class InferenceState:
 
         return helpers.infer_call_of_leaf(context, name)
 
+    @profiler.profile('parse', get_args=lambda self, code=None, path=None, **kwargs: {'path': path})
     def parse_and_get_code(self, code=None, path=None,
                            use_latest_grammar=False, file_io=None, **kwargs):
         if code is None:
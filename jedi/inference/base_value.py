@@ -17,11 +17,14 @@ from jedi.inference.utils import safe_property
 from jedi.inference.cache import inference_state_as_method_param_cache
 from jedi.cache import memoize_method
 sentinel = object()
+# Replaced by the one and only empty ValueSet at the end of this module.
+NO_VALUES = None
 
 class HasNoContext(Exception):
     pass
 
 class HelperValueMixin:
+    __slots__ = ()
 
     def py__getattribute__(self, name_or_str, name_context=None, position=None, analysis_errors=True):
         """
@@ -47,10 +50,21 @@ class HelperValueMixin:
                 )
             return NO_VALUES
 
+    def merge_types_of_iterate(self, contextualized_node=None, is_async=False):
+        return ValueSet.from_sets(
+            lazy_value.infer()
+            for lazy_value in self.iterate(contextualized_node, is_async)
+        )
+
+    @memoize_method
+    def as_context(self, *args, **kwargs):
+        return self._as_context(*args, **kwargs)
+
 class Value(HelperValueMixin):
     """
     To be implemented by subclasses.
     """
+    __slots__ = ('inference_state', 'parent_context', '_memoize_method_dct')
     tree_node = None
     array_type = None
     api_type = 'not_defined_please_report_bug'
@@ -107,18 +121,20 @@ def iterate_values(values, contextualized_node=None, is_async=False):
     all values that the iterate functions yield.
     """
     return ValueSet.from_sets(
-        value.iterate(contextualized_node, is_async)
+        value.merge_types_of_iterate(contextualized_node, is_async)
         for value in values
-        if value.is_instance()
     )
 
 class _ValueWrapperBase(HelperValueMixin):
+    # Lazy wrappers memoize the wrapped value with memoize_method.
+    __slots__ = ('_memoize_method_dct',)
 
     def __getattr__(self, name):
         assert name != '_wrapped_value', 'Problem with _get_wrapped_value'
         return getattr(self._wrapped_value, name)
 
 class LazyValueWrapper(_ValueWrapperBase):
+    __slots__ = ('inference_state',)
 
     def __init__(self, inference_state):
         self.inference_state = inference_state
@@ -127,6 +143,7 @@ class LazyValueWrapper(_ValueWrapperBase):
         return '<%s>' % self.__class__.__name__
 
 class ValueWrapper(_ValueWrapperBase):
+    __slots__ = ('_wrapped_value', 'inference_state', 'parent_context')
 
     def __init__(self, wrapped_value):
         self._wrapped_value = wrapped_value
@@ -137,6 +154,7 @@ class ValueWrapper(_ValueWrapperBase):
         return '%s(%s)' % (self.__class__.__name__, self._wrapped_value)
 
 class TreeValue(Value):
+    __slots__ = ('tree_node', '_value_cache')
 
     def __init__(self, inference_state, parent_context, tree_node):
         super().__init__(inference_state, parent_context)
@@ -156,6 +174,7 @@ class TreeValue(Value):
         raise NotImplementedError
 
 class ContextualizedNode:
+    __slots__ = ('context', 'node')
 
     def __init__(self, context, node):
         self.context = context
@@ -165,23 +184,64 @@ class ContextualizedNode:
         return '<%s: %s in %s>' % (self.__class__.__name__, self.node, self.context)
 
 class ValueSet:
+    """
+    An immutable set of values. Since value sets are created all the time
+    during inference, creating them is kept cheap: There's only one empty
+    value set (``NO_VALUES``) and unions with an empty set or with itself
+    return the existing object instead of allocating a new one.
+    """
+    __slots__ = ('_set',)
+
+    def __new__(cls, iterable=()):
+        return cls._from_frozen_set(frozenset(iterable))
 
-    def __init__(self, iterable):
-        self._set = frozenset(iterable)
-        for value in iterable:
-            assert not isinstance(value, ValueSet)
+    @classmethod
+    def _from_frozen_set(cls, frozenset_):
+        if not frozenset_ and cls is ValueSet and NO_VALUES is not None:
+            return NO_VALUES
+        self = object.__new__(cls)
+        self._set = frozenset_
+        return self
 
     @classmethod
     def from_sets(cls, sets):
         """
         Used to work with an iterable of set.
         """
-        return cls(set().union(*sets))
+        result = None
+        aggregated = None
+        for set_ in sets:
+            if not isinstance(set_, ValueSet):
+                set_ = cls(set_)
+            if not set_._set:
+                continue
+            if result is None:
+                # Avoid copying anything as long as there's only one
+                # non-empty set.
+                result = set_
+            elif aggregated is None:
+                if set_._set != result._set:
+                    aggregated = set(result._set)
+                    aggregated |= set_._set
+            else:
+                aggregated |= set_._set
+
+        if aggregated is not None:
+            return cls._from_frozen_set(frozenset(aggregated))
+        if result is None:
+            return cls._from_frozen_set(frozenset())
+        return result
 
     def __or__(self, other):
+        if not other._set or self is other:
+            return self
+        if not self._set:
+            return other
         return self._from_frozen_set(self._set | other._set)
 
     def __and__(self, other):
+        if self is other:
+            return self
         return self._from_frozen_set(self._set & other._set)
 
     def __iter__(self):
@@ -210,4 +270,16 @@ class ValueSet:
 
     def __hash__(self):
         return hash(self._set)
+
+    # Value sets are immutable. Copies and unpickled sets must not go through
+    # the default protocol, which calls ``__new__`` without arguments (and
+    # therefore gets ``NO_VALUES``) and then sets ``_set`` on the result.
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (list(self._set),)
 NO_VALUES = ValueSet([])
@@ -5,9 +5,22 @@
 """
 from functools import wraps
 from jedi import debug
+from jedi.cache import CacheStatistics, cache_statistics
 _NO_DEFAULT = object()
 _RECURSION_SENTINEL = object()
 
+def _count_lookup(inference_state, hit):
+    if inference_state is None:
+        # Caches that are stored on the function are shared by all inference
+        # states.
+        statistics, name = cache_statistics, 'memoize_default'
+    else:
+        statistics, name = inference_state.cache_statistics, 'memoize_cache'
+    if hit:
+        statistics.count_hit(name)
+    else:
+        statistics.count_miss(name)
+
 def _memoize_default(default=_NO_DEFAULT, inference_state_is_first_arg=False, second_arg_is_inference_state=False):
     """ This is a typical memoization decorator, BUT there is one difference:
     To prevent recursion it sets defaults.
@@ -32,11 +45,15 @@ def _memoize_default(default=_NO_DEFAULT, inference_state_is_first_arg=False, se
                 cache = function.__dict__.setdefault('_memoize_default_cache', {})
 
             if key in cache:
+                if CacheStatistics.enabled:
+                    _count_lookup(inference_state, True)
                 return cache[key]
 
             if key in cache:
                 return cache[key]
 
+            if CacheStatistics.enabled:
+                _count_lookup(inference_state, False)
             if default is not _NO_DEFAULT:
                 cache[key] = default
 
@@ -69,7 +86,11 @@ def inference_state_method_generator_cache():
             key = (func, args, frozenset(kwargs.items()))
             cache = inference_state.memoize_cache
             if key in cache:
+                if CacheStatistics.enabled:
+                    inference_state.cache_statistics.count_hit('memoize_cache')
                 return cache[key]
+            if CacheStatistics.enabled:
+                inference_state.cache_statistics.count_miss('memoize_cache')
 
             generator = func(inference_state, *args, **kwargs)
             cache[key] = _RECURSION_SENTINEL
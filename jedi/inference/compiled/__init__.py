@@ -3,6 +3,9 @@
 
 from jedi.inference.compiled.value import CompiledValue, CompiledName, \
     CompiledValueFilter, CompiledValueName, create_from_access_path
+from jedi.inference.compiled.access import AccessPath
+from jedi.inference.compiled.snapshot import SnapshotAccessHandle, load_snapshot, \
+    record_snapshot_in_background
 from jedi.inference.base_value import LazyValueWrapper
 
 
@@ -64,7 +67,33 @@ def load_module(inference_state, dotted_name, **kwargs):
     # and again and it's really slow.
     if dotted_name.startswith('tensorflow.'):
         return None
+    from jedi.inference.compiled.subprocess import InferenceStateSameProcess
+    # There's no subprocess to avoid for interpreters and their modules might
+    # have been modified at runtime.
+    use_snapshot = not isinstance(inference_state.compiled_subprocess,
+                                  InferenceStateSameProcess)
+    if use_snapshot:
+        value = _load_module_from_snapshot(inference_state, dotted_name, **kwargs)
+        if value is not None:
+            return value
+
     access_path = inference_state.compiled_subprocess.load_module(dotted_name=dotted_name, **kwargs)
     if access_path is None:
         return None
+    if use_snapshot:
+        record_snapshot_in_background(inference_state, dotted_name, kwargs.get('sys_path'))
     return create_from_access_path(inference_state, access_path)
+
+
+def _load_module_from_snapshot(inference_state, dotted_name, sys_path=None, **kwargs):
+    snapshot = load_snapshot(inference_state, dotted_name, sys_path)
+    if snapshot is None:
+        return None
+
+    def load_real_handle():
+        access_path = inference_state.compiled_subprocess.load_module(
+            dotted_name=dotted_name, sys_path=sys_path, **kwargs)
+        return access_path.accesses[-1][1]
+
+    handle = SnapshotAccessHandle(load_real_handle, snapshot['root'])
+    return create_from_access_path(inference_state, AccessPath([(dotted_name, handle)]))
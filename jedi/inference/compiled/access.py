@@ -8,7 +8,9 @@ import warnings
 import re
 import builtins
 import typing
+from contextlib import contextmanager
 from pathlib import Path
+from threading import RLock
 from typing import Optional, Tuple
 from jedi.inference.compiled.getattr_static import getattr_static
 ALLOWED_GETITEM_TYPES = (str, list, tuple, bytes, bytearray, dict)
@@ -25,11 +27,88 @@ _OPERATORS.update(COMPARISON_OPERATORS)
 ALLOWED_DESCRIPTOR_ACCESS = (types.FunctionType, types.GetSetDescriptorType, types.MemberDescriptorType, MethodDescriptorType, WrapperDescriptorType, ClassMethodDescriptorType, staticmethod, classmethod)
 SignatureParam = namedtuple('SignatureParam', 'name has_default default default_string has_annotation annotation annotation_string kind_name')
 
+# The environment subprocess answers requests of different inference states
+# in parallel, but there's only one sys.path.
+_sys_path_lock = RLock()
+
+@contextmanager
+def replaced_sys_path(sys_path):
+    """
+    Replaces :data:`sys.path` while the block is executed, if ``sys_path`` is
+    not None. Other threads that replace it wait until the block is done.
+    """
+    with _sys_path_lock:
+        if sys_path is None:
+            yield
+            return
+        temp, sys.path = sys.path, sys_path
+        try:
+            yield
+        finally:
+            sys.path = temp
+
+def safe_getattr(obj, name, default=_sentinel):
+    try:
+        attr, is_get_descriptor = getattr_static(obj, name)
+    except AttributeError:
+        if default is _sentinel:
+            raise
+        return default
+    else:
+        if isinstance(attr, ALLOWED_DESCRIPTOR_ACCESS):
+            # In case of descriptors that have get methods we cannot return
+            # it's value, because that would mean code execution.
+            return getattr(obj, name)
+    return attr
+
+def get_api_type(obj):
+    if inspect.isclass(obj):
+        return 'class'
+    elif inspect.ismodule(obj):
+        return 'module'
+    elif inspect.isbuiltin(obj) or inspect.ismethod(obj) \
+            or inspect.ismethoddescriptor(obj) or inspect.isfunction(obj):
+        return 'function'
+    # Everything else...
+    return 'instance'
+
+def create_access(inference_state, obj):
+    return inference_state.compiled_subprocess.get_or_create_access_handle(obj)
+
+def load_module(inference_state, dotted_name, sys_path):
+    with replaced_sys_path(sys_path):
+        try:
+            __import__(dotted_name)
+        except ImportError:
+            # If a module is "corrupt" or not really a Python module or whatever.
+            warnings.warn(
+                "Module %s not importable in path %s." % (dotted_name, sys_path),
+                UserWarning,
+                stacklevel=2,
+            )
+            return None
+        except Exception:
+            # Since __import__ pretty much makes code execution possible, just
+            # catch any error here and print it.
+            warnings.warn(
+                "Cannot import:\n%s" % traceback.format_exc(), UserWarning, stacklevel=2
+            )
+            return None
+
+    # Just access the cache after import, because of #59 as well as the very
+    # complicated import structure of Python.
+    module = sys.modules[dotted_name]
+    return create_access_path(inference_state, module)
+
 class AccessPath:
 
     def __init__(self, accesses):
         self.accesses = accesses
 
+def create_access_path(inference_state, obj):
+    access = create_access(inference_state, obj)
+    return AccessPath(access.get_access_path_tuples())
+
 class DirectObjectAccess:
 
     def __init__(self, inference_state, obj):
@@ -39,6 +118,97 @@ class DirectObjectAccess:
     def __repr__(self):
         return '%s(%s)' % (self.__class__.__name__, self.get_repr())
 
+    def py__doc__(self):
+        return inspect.getdoc(self._obj) or ''
+
+    def py__name__(self):
+        if not _is_class_instance(self._obj) or \
+                inspect.ismethoddescriptor(self._obj):  # slots
+            cls = self._obj
+        else:
+            try:
+                cls = self._obj.__class__
+            except AttributeError:
+                # happens with numpy.core.umath._UFUNC_API (you get it
+                # automatically by doing `import numpy`.
+                return None
+
+        try:
+            return cls.__name__
+        except AttributeError:
+            return None
+
+    def get_access_path_tuples(self):
+        accesses = [create_access(self._inference_state, o) for o in self._get_objects_path()]
+        return [(access.py__name__(), access) for access in accesses]
+
+    def _get_objects_path(self):
+        def get():
+            obj = self._obj
+            yield obj
+            try:
+                obj = obj.__objclass__
+            except AttributeError:
+                pass
+            else:
+                yield obj
+
+            try:
+                # Returns a dotted string path.
+                imp_plz = obj.__module__
+            except AttributeError:
+                # Unfortunately in some cases like `int` there's no __module__
+                if not inspect.ismodule(obj):
+                    yield builtins
+            else:
+                if imp_plz is None:
+                    # Happens for example in `(_ for _ in []).send.__module__`.
+                    yield builtins
+                else:
+                    try:
+                        yield sys.modules[imp_plz]
+                    except KeyError:
+                        # __module__ can be something arbitrary that doesn't exist.
+                        yield builtins
+
+        return list(reversed(list(get())))
+
+    def get_repr(self):
+        if inspect.ismodule(self._obj):
+            return repr(self._obj)
+        # Try to avoid execution of the property.
+        if safe_getattr(self._obj, '__module__', default='') == 'builtins':
+            return repr(self._obj)
+
+        type_ = type(self._obj)
+        if type_ == type:
+            return type.__repr__(self._obj)
+
+        if safe_getattr(type_, '__module__', default='') == 'builtins':
+            # Allow direct execution of repr for builtins.
+            return repr(self._obj)
+        return object.__repr__(self._obj)
+
+    def get_api_type(self):
+        return get_api_type(self._obj)
+
+    def dir(self):
+        return dir(self._obj)
+
+    def has_iter(self):
+        try:
+            iter(self._obj)
+            return True
+        except TypeError:
+            return False
+
+    def is_descriptor(self, name):
+        """
+        Returns True if the attribute ``name`` is a descriptor with a
+        ``__get__`` method. Raises :exc:`AttributeError` if it doesn't exist.
+        """
+        return getattr_static(self._obj, name)[1]
+
     def get_annotation_name_and_args(self):
         """
         Returns Tuple[Optional[str], Tuple[AccessPath, ...]]
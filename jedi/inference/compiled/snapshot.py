@@ -0,0 +1,293 @@
+"""
+Snapshots of the introspection results of compiled modules.
+
+Builtins and C extensions can only be introspected in the environment
+subprocess, which is slow to start and slow to talk to. Since the results only
+change if the interpreter or the extension itself changes, they are recorded
+once per interpreter and module version and stored in the cache directory.
+Recording happens in a background thread, so the first import of a module
+doesn't wait for it, and loaded snapshots are kept in memory for all
+inference states of the process.
+
+A snapshot is a tree of plain dicts (one per object) that can be pickled
+without any :class:`.DirectObjectAccess` in it. :class:`SnapshotAccessHandle`
+then answers the same questions an ``AccessHandle`` would, without starting the
+subprocess. Everything that has not been recorded is forwarded to a real
+access handle, which is created lazily.
+"""
+import os
+import inspect
+import pickle
+import hashlib
+import tempfile
+from threading import Lock, Thread
+from jedi import debug
+from jedi import settings
+from jedi.inference.compiled.access import DirectObjectAccess, SignatureParam
+SNAPSHOT_VERSION = 2
+_MAX_RECORDED_OBJECTS = 5000
+_RECORDED_METHODS = ('get_repr', 'get_api_type', 'py__doc__', 'has_iter')
+# (executable, version, sys_path, dotted_name) -> (executable stamp, file stamp, snapshot)
+_loaded_snapshots = {}
+_recording = set()
+_recording_lock = Lock()
+
+def record_module(inference_state, module, dotted_name):
+    """
+    Executed in the subprocess. Returns the snapshot of a compiled module.
+    """
+    counter = [0]
+
+    def record(obj, depth):
+        counter[0] += 1
+        access = DirectObjectAccess(inference_state, obj)
+        results = {}
+        for method_name in _RECORDED_METHODS:
+            try:
+                results[method_name] = getattr(access, method_name)()
+            except Exception:
+                # Not recording it means that the subprocess is asked later.
+                pass
+        params = _get_plain_signature_params(obj)
+        if params is not None:
+            results['get_signature_params'] = params
+
+        record_ = {'results': results, 'members': None}
+        if depth < 2 and results.get('get_api_type') in ('module', 'class'):
+            try:
+                names = access.dir()
+            except Exception:
+                # The subprocess is asked for the members of this object.
+                return record_
+            members = {}
+            for name in names:
+                if counter[0] >= _MAX_RECORDED_OBJECTS:
+                    break
+                try:
+                    is_descriptor = access.is_descriptor(name)
+                    member = getattr(obj, name)
+                except Exception:
+                    continue
+                module_name = getattr(member, '__module__', None)
+                if inspect.ismodule(member) \
+                        or isinstance(module_name, str) and module_name != dotted_name:
+                    # Objects from other modules are resolved by the
+                    # subprocess, their parent access is a different one.
+                    member_record = None
+                else:
+                    member_record = record(member, depth + 1)
+                members[name] = (is_descriptor, member_record)
+            record_['members'] = members
+        return record_
+
+    return {
+        'file': getattr(module, '__file__', None),
+        'root': record(module, 0),
+    }
+
+def _get_plain_signature_params(obj):
+    """
+    Returns the signature params of ``obj`` like
+    ``DirectObjectAccess.get_signature_params`` or None. Defaults and
+    annotations are accesses into the subprocess, signatures with those
+    cannot be served from a snapshot and are not recorded.
+    """
+    try:
+        parameters = inspect.signature(obj).parameters.values()
+    except Exception:
+        return None
+
+    params = []
+    for p in parameters:
+        if p.default is not p.empty or p.annotation is not p.empty:
+            return None
+        params.append(SignatureParam(
+            name=p.name,
+            has_default=False,
+            default=None,
+            default_string=repr(p.default),
+            has_annotation=False,
+            annotation=None,
+            annotation_string=str(p.annotation),
+            kind_name=str(p.kind),
+        ))
+    return params
+
+def _get_snapshot_key(inference_state, dotted_name, sys_path):
+    environment = inference_state.environment
+    return (environment.executable, tuple(environment.version_info),
+            tuple(sys_path or ()), dotted_name)
+
+def _get_snapshot_path(key):
+    directory = hashlib.sha256(repr(key[:-1]).encode('utf-8')).hexdigest()
+    return os.path.join(settings.cache_directory, 'compiled', directory, key[-1] + '.pkl')
+
+def _get_file_stamp(path):
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def _get_executable_stamp(inference_state):
+    return _get_file_stamp(inference_state.environment.executable)
+
+def load_snapshot(inference_state, dotted_name, sys_path):
+    """
+    Returns the snapshot of a compiled module or None if there's no valid one.
+    """
+    key = _get_snapshot_key(inference_state, dotted_name, sys_path)
+    try:
+        executable_stamp, file_stamp, snapshot = _loaded_snapshots[key]
+    except KeyError:
+        try:
+            with open(_get_snapshot_path(key), 'rb') as f:
+                version, executable_stamp, file_stamp, snapshot = pickle.load(f)
+        except (OSError, EOFError, ValueError, TypeError, AttributeError,
+                pickle.UnpicklingError):
+            return None
+        if version != SNAPSHOT_VERSION:
+            return None
+        _loaded_snapshots[key] = executable_stamp, file_stamp, snapshot
+
+    if executable_stamp != _get_executable_stamp(inference_state) \
+            or file_stamp != _get_file_stamp(snapshot['file']):
+        return None
+    return snapshot
+
+def save_snapshot(inference_state, dotted_name, sys_path, snapshot):
+    key = _get_snapshot_key(inference_state, dotted_name, sys_path)
+    executable_stamp = _get_executable_stamp(inference_state)
+    file_stamp = _get_file_stamp(snapshot['file'])
+    _loaded_snapshots[key] = executable_stamp, file_stamp, snapshot
+
+    path = _get_snapshot_path(key)
+    try:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((SNAPSHOT_VERSION, executable_stamp, file_stamp, snapshot),
+                        f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        debug.warning('Unable to save the snapshot of %s: %s', dotted_name, e)
+
+def record_snapshot_in_background(inference_state, dotted_name, sys_path):
+    """
+    Records the snapshot of a compiled module in a background thread. The
+    module is only recorded once at a time, callers use the subprocess until
+    the snapshot exists.
+    """
+    key = _get_snapshot_key(inference_state, dotted_name, sys_path)
+    with _recording_lock:
+        if key in _recording:
+            return
+        _recording.add(key)
+
+    compiled_subprocess = inference_state.compiled_subprocess
+
+    def record():
+        try:
+            snapshot = compiled_subprocess.get_compiled_module_snapshot(
+                dotted_name, sys_path=sys_path)
+            if snapshot is not None:
+                save_snapshot(inference_state, dotted_name, sys_path, snapshot)
+        except Exception as e:
+            debug.warning('Unable to record the snapshot of %s: %s', dotted_name, e)
+        finally:
+            with _recording_lock:
+                _recording.discard(key)
+
+    Thread(target=record, daemon=True).start()
+
+def _get_unpickled_handle(handle):
+    return handle
+
+class SnapshotAccessHandle:
+    """
+    Has the same API as an ``AccessHandle``, but answers from a snapshot.
+    """
+
+    def __init__(self, load_real_handle, record, root=None, parent=None, path=()):
+        self._load_real_handle = load_real_handle
+        self._record = record
+        self._root = self if root is None else root
+        self._parent = parent
+        self._path = path
+        self._children = {}
+        self._real_handle = None
+
+    @property
+    def id(self):
+        return ('snapshot', id(self._root)) + self._path
+
+    def __repr__(self):
+        return '<%s of %s>' % (self.__class__.__name__, '.'.join(self._path) or 'module')
+
+    def _get_real_handle(self):
+        if self._real_handle is None:
+            debug.dbg('Compiled snapshot miss, using the subprocess for %s', self)
+            handle = self._root._load_real_handle()
+            for name in self._path:
+                handle = handle.getattr_paths(name)[-1]
+            self._real_handle = handle
+        return self._real_handle
+
+    def _get_child(self, name):
+        try:
+            return self._children[name]
+        except KeyError:
+            members = self._record['members']
+            if members is None or name not in members or members[name][1] is None:
+                return None
+            child = SnapshotAccessHandle(
+                None,
+                members[name][1],
+                root=self._root,
+                parent=self,
+                path=self._path + (name,),
+            )
+            self._children[name] = child
+            return child
+
+    def dir(self):
+        members = self._record['members']
+        if members is None:
+            return self._get_real_handle().dir()
+        return list(members)
+
+    def is_descriptor(self, name):
+        members = self._record['members']
+        if members is None or name not in members:
+            return self._get_real_handle().is_descriptor(name)
+        return members[name][0]
+
+    def getattr_paths(self, name, *args, **kwargs):
+        child = self._get_child(name)
+        if child is None:
+            return self._get_real_handle().getattr_paths(name, *args, **kwargs)
+        # Like for real handles, the path goes from the module to the child.
+        handles = [child]
+        handle = self
+        while handle is not None:
+            handles.insert(0, handle)
+            handle = handle._parent
+        return handles
+
+    def __reduce__(self):
+        # Snapshots only exist in this process, the subprocess gets the real
+        # access handle instead.
+        return _get_unpickled_handle, (self._get_real_handle(),)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        results = self._record['results']
+        if name in results:
+            result = results[name]
+            return lambda: result
+        return getattr(self._get_real_handle(), name)
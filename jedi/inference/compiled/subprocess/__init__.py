@@ -8,18 +8,23 @@ goals:
 """
 
 import collections
+import itertools
 import os
 import sys
 import queue
 import subprocess
+import time
 import traceback
 import weakref
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from threading import Thread
+from threading import Thread, Lock
 
 from jedi._compatibility import pickle_dump, pickle_load
 from jedi import debug
-from jedi.cache import memoize_method
+from jedi import settings
+from jedi import profiler
+from jedi.cache import memoize_method, LRUCache
 from jedi.inference.compiled.subprocess import functions
 from jedi.inference.compiled.access import DirectObjectAccess, AccessPath, \
     SignatureParam
@@ -50,6 +55,53 @@ def _enqueue_output(out, queue_):
         queue_.put(line)
 
 
+class _PendingRequests:
+    """
+    The reply queues of the requests that were sent to the subprocess, but
+    have not been answered yet. Once the subprocess is gone, all of them
+    receive None.
+    """
+    def __init__(self):
+        self.lock = Lock()
+        self.queues = {}
+        self.closed = False
+
+    def add(self, request_id):
+        reply_queue = queue.Queue(maxsize=1)
+        with self.lock:
+            if self.closed:
+                reply_queue.put(None)
+            else:
+                self.queues[request_id] = reply_queue
+        return reply_queue
+
+    def discard(self, request_id):
+        with self.lock:
+            self.queues.pop(request_id, None)
+
+
+def _read_replies(out, pending):
+    # This function must not reference the CompiledSubprocess, otherwise it
+    # would never be garbage collected and the process would never end.
+    while True:
+        try:
+            request_id, *reply = pickle_load(out)
+        except Exception:
+            # EOFError, but also errors of closed or broken streams.
+            break
+        with pending.lock:
+            reply_queue = pending.queues.pop(request_id, None)
+        if reply_queue is not None:
+            reply_queue.put(reply)
+
+    with pending.lock:
+        pending.closed = True
+        reply_queues = list(pending.queues.values())
+        pending.queues.clear()
+    for reply_queue in reply_queues:
+        reply_queue.put(None)
+
+
 def _add_stderr_to_debug(stderr_queue):
     while True:
         # Try to do some error reporting from the subprocess and print its
@@ -66,14 +118,15 @@ def _get_function(name):
     return getattr(functions, name)
 
 
-def _cleanup_process(process, thread):
+def _cleanup_process(process, *threads):
     try:
         process.kill()
         process.wait()
     except OSError:
         # Raised if the process is already killed.
         pass
-    thread.join()
+    for thread in threads:
+        thread.join()
     for stream in [process.stdin, process.stdout, process.stderr]:
         try:
             stream.close()
@@ -87,6 +140,23 @@ class _InferenceStateProcess:
         self._inference_state_weakref = weakref.ref(inference_state)
         self._inference_state_id = id(inference_state)
         self._handles = {}
+        self._access_result_cache = LRUCache(settings.access_result_cache_size)
+        self._access_result_generation = self.get_generation()
+
+    def get_generation(self):
+        """
+        Results of accesses are only valid as long as the generation doesn't
+        change.
+        """
+        return 0
+
+    @property
+    def access_result_cache(self):
+        generation = self.get_generation()
+        if generation != self._access_result_generation:
+            self._access_result_cache.new_generation()
+            self._access_result_generation = generation
+        return self._access_result_cache
 
     def get_or_create_access_handle(self, obj):
         id_ = id(obj)
@@ -117,15 +187,33 @@ class InferenceStateSameProcess(_InferenceStateProcess):
 
 class InferenceStateSubprocess(_InferenceStateProcess):
     def __init__(self, inference_state, compiled_subprocess):
+        self._compiled_subprocess = compiled_subprocess
         super().__init__(inference_state)
         self._used = False
-        self._compiled_subprocess = compiled_subprocess
+        self._handles_generation = self.get_generation()
+
+    def get_generation(self):
+        return self._compiled_subprocess.generation
 
     def __getattr__(self, name):
         func = _get_function(name)
 
         def wrapper(*args, **kwargs):
             self._used = True
+            if name == 'get_compiled_method_return':
+                # The first argument is the id of the handle the method is
+                # called on, it's not stable across restarts, the handle is.
+                handle = self.get_access_handle(args[0])
+                self._check_generation()
+                handle.refresh()
+                args = (handle.id,) + args[1:]
+                replay = partial(handle._workaround, *args[1:], **kwargs)
+            else:
+                self._check_generation()
+                for arg in args + tuple(kwargs.values()):
+                    if isinstance(arg, AccessHandle):
+                        arg.refresh()
+                replay = partial(wrapper, *args, **kwargs)
 
             result = self._compiled_subprocess.run(
                 self._inference_state_weakref(),
@@ -136,26 +224,37 @@ class InferenceStateSubprocess(_InferenceStateProcess):
             # IMO it should be possible to create a hook in pickle.load to
             # mess with the loaded objects. However it's extremely complicated
             # to work around this so just do it with this call. ~ dave
-            return self._convert_access_handles(result)
+            return self._convert_access_handles(result, replay)
 
         return wrapper
 
-    def _convert_access_handles(self, obj):
+    def _check_generation(self):
+        generation = self.get_generation()
+        if generation != self._handles_generation:
+            # The subprocess was restarted, the handles we know about don't
+            # exist anymore. They are recreated lazily, see AccessHandle.refresh.
+            self._handles.clear()
+            self._handles_generation = generation
+
+    def _convert_access_handles(self, obj, replay=None, path=()):
         if isinstance(obj, SignatureParam):
-            return SignatureParam(*self._convert_access_handles(tuple(obj)))
+            return SignatureParam(*self._convert_access_handles(tuple(obj), replay, path))
         elif isinstance(obj, tuple):
-            return tuple(self._convert_access_handles(o) for o in obj)
+            return tuple(self._convert_access_handles(o, replay, path + (i,))
+                         for i, o in enumerate(obj))
         elif isinstance(obj, list):
-            return [self._convert_access_handles(o) for o in obj]
+            return [self._convert_access_handles(o, replay, path + (i,))
+                    for i, o in enumerate(obj)]
         elif isinstance(obj, AccessHandle):
             try:
                 # Rewrite the access handle to one we're already having.
                 obj = self.get_access_handle(obj.id)
             except KeyError:
                 obj.add_subprocess(self)
+                obj.set_origin(replay, path, self.get_generation())
                 self.set_access_handle(obj)
         elif isinstance(obj, AccessPath):
-            return AccessPath(self._convert_access_handles(obj.accesses))
+            return AccessPath(self._convert_access_handles(obj.accesses, replay, path + ('accesses',)))
         return obj
 
     def __del__(self):
@@ -165,12 +264,26 @@ class InferenceStateSubprocess(_InferenceStateProcess):
 
 class CompiledSubprocess:
     is_crashed = False
+    # Is increased every time the process dies or is restarted, access
+    # handles and results of older generations are not valid anymore.
+    generation = 0
+    restart_count = 0
+    peak_memory = 0
+    # Asking for the RSS is a round trip to the process, it's only done once
+    # per interval (in seconds).
+    memory_check_interval = 1.0
+    _last_memory_check = float('-inf')
 
     def __init__(self, executable, env_vars=None):
         self._executable = executable
         self._env_vars = env_vars
         self._inference_state_deletion_queue = collections.deque()
         self._cleanup_callable = lambda: None
+        # Requests are identified by ids, so multiple threads can wait for
+        # replies of the same process at the same time.
+        self._request_ids = itertools.count()
+        self._pending_requests = _PendingRequests()
+        self._write_lock = Lock()
 
     def __repr__(self):
         pid = os.getpid()
@@ -205,12 +318,19 @@ class CompiledSubprocess:
         )
         t.daemon = True
         t.start()
+        self._reader_thread = reader = Thread(
+            target=_read_replies,
+            args=(process.stdout, self._pending_requests)
+        )
+        reader.daemon = True
+        reader.start()
         # Ensure the subprocess is properly cleaned up when the object
         # is garbage collected.
         self._cleanup_callable = weakref.finalize(self,
                                                   _cleanup_process,
                                                   process,
-                                                  t)
+                                                  t,
+                                                  reader)
         return process
 
     def run(self, inference_state, function, args=(), kwargs={}):
@@ -229,27 +349,84 @@ class CompiledSubprocess:
     def get_sys_path(self):
         return self._send(None, functions.get_sys_path, (), {})
 
+    def get_statistics(self):
+        return {
+            'generation': self.generation,
+            'restart_count': self.restart_count,
+            'peak_memory': self.peak_memory,
+        }
+
+    def check_memory(self):
+        """
+        Restarts the process if it uses more memory than
+        :data:`jedi.settings.compiled_subprocess_max_rss`. Access handles of
+        existing inference states are recreated lazily in the new process.
+        """
+        max_rss = settings.compiled_subprocess_max_rss
+        if max_rss is None or self.is_crashed:
+            return
+        now = time.monotonic()
+        if now - self._last_memory_check < self.memory_check_interval:
+            return
+        self._last_memory_check = now
+
+        rss = self._send(None, functions.get_rss)
+        if rss is None:
+            return
+        self.peak_memory = max(self.peak_memory, rss)
+        if rss > max_rss:
+            self._restart(rss)
+
+    def _restart(self, rss):
+        with self._write_lock:
+            if self._pending_requests.queues:
+                # Other threads are waiting for replies, only restart between
+                # requests. The next check will try again.
+                return
+            debug.dbg('Restart environment subprocess %s (rss=%s)', self._executable, rss)
+            self._cleanup_callable()
+            self._cleanup_callable = lambda: None
+            # Forget the memoized process, the next request starts a new one.
+            self.__dict__.pop('_memoize_method_dct', None)
+            self._pending_requests = _PendingRequests()
+            # The inference states only existed in the old process.
+            self._inference_state_deletion_queue.clear()
+            self.generation += 1
+            self.restart_count += 1
+
     def _kill(self):
         self.is_crashed = True
+        self.generation += 1
         self._cleanup_callable()
 
+    @profiler.profile(
+        'subprocess',
+        get_args=lambda self, inference_state_id, function, *args, **kwargs: {
+            'function': getattr(function, '__name__', function)
+        },
+    )
     def _send(self, inference_state_id, function, args=(), kwargs={}):
         if self.is_crashed:
             raise InternalError("The subprocess %s has crashed." % self._executable)
 
-        data = inference_state_id, function, args, kwargs
-        try:
-            pickle_dump(data, self._get_process().stdin, PICKLE_PROTOCOL)
-        except BrokenPipeError:
-            self._kill()
-            raise InternalError("The subprocess %s was killed. Maybe out of memory?"
-                                % self._executable)
-
-        try:
-            is_exception, traceback, result = pickle_load(self._get_process().stdout)
-        except EOFError as eof_error:
+        request_id = next(self._request_ids)
+        data = request_id, inference_state_id, function, args, kwargs
+        with self._write_lock:
+            process = self._get_process()
+            reply_queue = self._pending_requests.add(request_id)
+            try:
+                pickle_dump(data, process.stdin, PICKLE_PROTOCOL)
+            except BrokenPipeError:
+                self._pending_requests.discard(request_id)
+                self._kill()
+                raise InternalError("The subprocess %s was killed. Maybe out of memory?"
+                                    % self._executable)
+
+        reply = reply_queue.get()
+        if reply is None:
+            # The reader thread hit the end of stdout, the process is gone.
             try:
-                stderr = self._get_process().stderr.read().decode('utf-8', 'replace')
+                stderr = process.stderr.read().decode('utf-8', 'replace')
             except Exception as exc:
                 stderr = '<empty/not available (%r)>' % exc
             self._kill()
@@ -257,9 +434,10 @@ class CompiledSubprocess:
             raise InternalError(
                 "The subprocess %s has crashed (%r, stderr=%s)." % (
                     self._executable,
-                    eof_error,
+                    EOFError(),
                     stderr,
                 ))
+        is_exception, traceback, result = reply
 
         _add_stderr_to_debug(self._stderr_queue)
 
@@ -282,11 +460,25 @@ class CompiledSubprocess:
 
 
 class Listener:
-    def __init__(self):
+    def __init__(self, max_workers=4):
         self._inference_states = {}
         # TODO refactor so we don't need to process anymore just handle
         # controlling.
         self._process = _InferenceStateProcess(Listener)
+        self._max_workers = max_workers
+        # Requests of different inference states are independent and can run
+        # in parallel, requests of one inference state cannot.
+        self._inference_state_locks = {}
+        self._locks_lock = Lock()
+        self._stdout_lock = Lock()
+
+    def _get_inference_state_lock(self, inference_state_id):
+        with self._locks_lock:
+            try:
+                return self._inference_state_locks[inference_state_id]
+            except KeyError:
+                lock = self._inference_state_locks[inference_state_id] = Lock()
+                return lock
 
     def _get_inference_state(self, function, inference_state_id):
         from jedi.inference import InferenceState
@@ -307,8 +499,17 @@ class Listener:
     def _run(self, inference_state_id, function, args, kwargs):
         if inference_state_id is None:
             return function(*args, **kwargs)
-        elif function is None:
-            del self._inference_states[inference_state_id]
+
+        with self._get_inference_state_lock(inference_state_id):
+            return self._run_in_inference_state(inference_state_id, function, args, kwargs)
+
+    def _run_in_inference_state(self, inference_state_id, function, args, kwargs):
+        if function is None:
+            # The inference state might have been created in a process that
+            # has been restarted in the meantime.
+            self._inference_states.pop(inference_state_id, None)
+            with self._locks_lock:
+                del self._inference_state_locks[inference_state_id]
         else:
             inference_state = self._get_inference_state(function, inference_state_id)
 
@@ -332,19 +533,24 @@ class Listener:
         stdout = stdout.buffer
         stdin = stdin.buffer
 
-        while True:
-            try:
-                payload = pickle_load(stdin)
-            except EOFError:
-                # It looks like the parent process closed.
-                # Don't make a big fuss here and just exit.
-                exit(0)
-            try:
-                result = False, None, self._run(*payload)
-            except Exception as e:
-                result = True, traceback.format_exc(), e
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            while True:
+                try:
+                    request_id, *payload = pickle_load(stdin)
+                except EOFError:
+                    # It looks like the parent process closed.
+                    # Don't make a big fuss here and just exit.
+                    exit(0)
+                executor.submit(self._handle_request, stdout, request_id, payload)
+
+    def _handle_request(self, stdout, request_id, payload):
+        try:
+            result = False, None, self._run(*payload)
+        except Exception as e:
+            result = True, traceback.format_exc(), e
 
-            pickle_dump(result, stdout, PICKLE_PROTOCOL)
+        with self._stdout_lock:
+            pickle_dump((request_id,) + result, stdout, PICKLE_PROTOCOL)
 
 
 class AccessHandle:
@@ -356,6 +562,34 @@ class AccessHandle:
     def add_subprocess(self, subprocess):
         self._subprocess = subprocess
 
+    def set_origin(self, replay, path, generation):
+        """
+        Remembers how the handle was created: ``replay`` repeats the call that
+        returned it and ``path`` is where it is located in the result.
+        """
+        self._replay = replay
+        self._path = path
+        self._generation = generation
+
+    def refresh(self):
+        """
+        If the subprocess was restarted, the handle is recreated in the new
+        process by repeating the call that created it.
+        """
+        replay = self.__dict__.get('_replay')
+        if replay is None:
+            return
+        generation = self._subprocess.get_generation()
+        if generation == self._generation:
+            return
+
+        result = replay()
+        for step in self._path:
+            result = result.accesses if step == 'accesses' else result[step]
+        self.id = result.id
+        self._generation = self._subprocess.get_generation()
+        self._subprocess.set_access_handle(self)
+
     def __repr__(self):
         try:
             detail = self.access
@@ -382,10 +616,17 @@ class AccessHandle:
         happen. They are also the only unhashable objects that we're passing
         around.
         """
+        self.refresh()
         if args and isinstance(args[0], slice):
             return self._subprocess.get_compiled_method_return(self.id, name, *args, **kwargs)
         return self._cached_results(name, *args, **kwargs)
 
-    @memoize_method
     def _cached_results(self, name, *args, **kwargs):
-        return self._subprocess.get_compiled_method_return(self.id, name, *args, **kwargs)
+        cache = self._subprocess.access_result_cache
+        key = self.id, name, args, frozenset(kwargs.items())
+        try:
+            return cache.get(key)
+        except KeyError:
+            result = self._subprocess.get_compiled_method_return(self.id, name, *args, **kwargs)
+            cache.set(key, result)
+            return result
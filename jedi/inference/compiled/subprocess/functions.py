@@ -11,12 +11,19 @@ from jedi import debug
 from jedi import parser_utils
 from jedi.file_io import KnownContentFileIO, ZipFileIO
 
+def get_sys_path():
+    with access.replaced_sys_path(None):
+        return list(sys.path)
+
+def load_module(inference_state, **kwargs):
+    return access.load_module(inference_state, **kwargs)
+
 def get_module_info(inference_state, sys_path=None, full_name=None, **kwargs):
     """
     Returns Tuple[Union[NamespaceInfo, FileIO, None], Optional[bool]]
     """
     if sys_path is None:
-        sys_path = sys.path
+        sys_path = get_sys_path()
 
     module_name = full_name.split('.')[-1] if full_name else None
     
@@ -33,6 +40,37 @@ def get_module_info(inference_state, sys_path=None, full_name=None, **kwargs):
     finally:
         file.close()
 
+def get_rss():
+    """
+    Returns the resident set size of this process in bytes or None if it's not
+    possible to find out.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # This is the peak and not the current size, but it's never smaller.
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+def get_compiled_module_snapshot(inference_state, dotted_name, sys_path=None):
+    """
+    Records the introspection of a compiled module, see
+    :mod:`jedi.inference.compiled.snapshot`.
+    """
+    from jedi.inference.compiled.snapshot import record_module
+    with access.replaced_sys_path(sys_path):
+        try:
+            __import__(dotted_name)
+        except Exception:
+            return None
+    return record_module(inference_state, sys.modules[dotted_name], dotted_name)
+
 def _test_raise_error(inference_state, exception_type):
     """
     Raise an error to simulate certain problems for unit tests.
@@ -12,11 +12,30 @@ from jedi import debug
 from jedi import parser_utils
 
 class AbstractContext:
+    __slots__ = ('inference_state', 'predefined_names', '_name_cache', '_memoize_method_dct')
 
     def __init__(self, inference_state):
         self.inference_state = inference_state
         self.predefined_names = {}
 
+    def get_tree_name(self, name_class, tree_name):
+        """
+        Returns the name object of a parso name in this context. Name objects
+        are interned: filters are queried all the time and returning the same
+        objects saves allocations and makes memoization hit more often.
+        """
+        key = name_class, tree_name
+        try:
+            return self._name_cache[key]
+        except AttributeError:
+            # Most contexts never create names, so the cache is only created
+            # when it's needed.
+            self._name_cache = {}
+        except KeyError:
+            pass
+        name = self._name_cache[key] = name_class(self, tree_name)
+        return name
+
     def py__getattribute__(self, name_or_str, name_context=None, position=None, analysis_errors=True):
         """
         :param position: Position of the last statement -> tuple of line, column
@@ -35,6 +54,7 @@ class ValueContext(AbstractContext):
     """
     Should be defined, otherwise the API returns empty types.
     """
+    __slots__ = ('_value',)
 
     def __init__(self, value):
         super().__init__(value.inference_state)
@@ -44,12 +64,13 @@ class ValueContext(AbstractContext):
         return f'{self.__class__.__name__}({self._value!r})'
 
 class TreeContextMixin:
-    pass
+    __slots__ = ()
 
 class FunctionContext(TreeContextMixin, ValueContext):
-    pass
+    __slots__ = ()
 
 class ModuleContext(TreeContextMixin, ValueContext):
+    __slots__ = ()
 
     def get_value(self):
         """
@@ -60,12 +81,13 @@ class ModuleContext(TreeContextMixin, ValueContext):
         return self._value
 
 class NamespaceContext(TreeContextMixin, ValueContext):
-    pass
+    __slots__ = ()
 
 class ClassContext(TreeContextMixin, ValueContext):
-    pass
+    __slots__ = ()
 
 class CompForContext(TreeContextMixin, AbstractContext):
+    __slots__ = ('tree_node', 'parent_context')
 
     def __init__(self, parent_context, comp_for):
         super().__init__(parent_context.inference_state)
@@ -18,7 +18,7 @@ It works as follows:
 """
 from jedi import settings
 from jedi import debug
-from jedi.parser_utils import get_parent_scope
+from jedi.parser_utils import get_parent_scope, used_names_cache
 from jedi.inference.cache import inference_state_method_cache
 from jedi.inference.arguments import TreeArguments
 from jedi.inference.param import get_executed_param_names
@@ -30,6 +30,22 @@ from jedi.inference.references import get_module_contexts_containing_name
 from jedi.inference import recursion
 MAX_PARAM_SEARCHES = 20
 
+def _avoid_recursions(func):
+    def wrapper(function_value, param_index):
+        inf = function_value.inference_state
+        with recursion.execution_allowed(inf, function_value.tree_node) as allowed:
+            # We need to catch recursions that may occur, because an
+            # anonymous functions can create an anonymous parameter that is
+            # more or less self referencing.
+            if allowed:
+                inf.dynamic_params_depth += 1
+                try:
+                    return func(function_value, param_index)
+                finally:
+                    inf.dynamic_params_depth -= 1
+            return NO_VALUES
+    return wrapper
+
 @debug.increase_indent
 @_avoid_recursions
 def dynamic_param_lookup(function_value, param_index):
@@ -45,46 +61,163 @@ def dynamic_param_lookup(function_value, param_index):
     have to look for all calls to ``func`` to find out what ``foo`` possibly
     is.
     """
-    debug.dbg('Dynamic param lookup for %s param %i', function_value, param_index)
+    funcdef = function_value.tree_node
+
+    if not settings.dynamic_params:
+        return NO_VALUES
+
+    path = function_value.get_root_context().py__file__()
+    if path is not None and is_stdlib_path(path):
+        # We don't want to search for references in the stdlib. Usually people
+        # don't work with it (except if you are a core maintainer, sorry).
+        # This makes everything slower. Just disable it and run the tests,
+        # you will see the slowdown, especially in 3.6.
+        return NO_VALUES
+
+    if funcdef.type == 'lambdef':
+        string_name = _get_lambda_name(funcdef)
+        if string_name is None:
+            return NO_VALUES
+    else:
+        string_name = funcdef.name.value
+    debug.dbg('Dynamic param search in %s.', string_name, color='MAGENTA')
+
     module_context = function_value.get_root_context()
-    function_executions = _search_function_arguments(module_context, function_value.tree_node, function_value.name.string_name)
-    values = NO_VALUES
-    for name, value in function_executions:
-        if name.get_param_index() == param_index:
-            values |= value.infer()
+    arguments_list = _search_function_arguments(module_context, funcdef, string_name)
+    values = ValueSet.from_sets(
+        get_executed_param_names(
+            function_value, arguments
+        )[param_index].infer()
+        for arguments in arguments_list
+    )
+    debug.dbg('Dynamic param result finished', color='MAGENTA')
     return values
 
 @inference_state_method_cache(default=None)
 @to_list
 def _search_function_arguments(module_context, funcdef, string_name):
     """
-    Returns a list of param names.
+    Returns the arguments of all calls of the function.
     """
-    try:
-        executions = get_module_contexts_containing_name(
-            module_context.inference_state,
-            [module_context],
-            string_name
+    compare_node = funcdef
+    if string_name == '__init__':
+        cls = get_parent_scope(funcdef)
+        if cls.type == 'classdef':
+            string_name = cls.name.value
+            compare_node = cls
+
+    found_arguments = False
+    i = 0
+    inference_state = module_context.inference_state
+
+    if settings.dynamic_params_for_other_modules:
+        module_contexts = get_module_contexts_containing_name(
+            inference_state, [module_context], string_name,
+            # Limit the amounts of files to be opened massively.
+            limit_reduction=5,
         )
-    except KeyError:
-        # If a KeyError is raised, it means the function name was not found
-        # in any module, so we return an empty list.
-        return []
-
-    result = []
-    for execution in executions:
-        tree_node = execution.tree_node
-        for name, trailer in _get_possible_nodes(tree_node):
-            if name.value == string_name:
-                arguments = TreeArguments(module_context.inference_state, execution, trailer)
-                result += arguments.unpack()
-    return result
-
-def _get_possible_nodes(node):
-    for child in node.children:
-        if child.type == 'name':
-            trailer = child.get_next_sibling()
-            if trailer is not None and trailer.type == 'trailer' and trailer.children[0] == '(':
-                yield child, trailer
+    else:
+        module_contexts = [module_context]
+
+    for for_mod_context in module_contexts:
+        for name, trailer in _get_call_sites(for_mod_context.tree_node.get_used_names(), string_name):
+            i += 1
+
+            # This is a simple way to stop Jedi's dynamic param recursion
+            # from going wild: The deeper Jedi's in the recursion, the less
+            # code should be inferred. Once the recursion depth is bigger
+            # than MAX_PARAM_SEARCHES, stop the search.
+            if i * inference_state.dynamic_params_depth > MAX_PARAM_SEARCHES:
+                return
+
+            random_context = for_mod_context.create_context(name)
+            for arguments in _check_name_for_execution(
+                    inference_state, random_context, compare_node, name, trailer):
+                found_arguments = True
+                yield arguments
+
+        # If there are results after processing a module, we're probably
+        # good to process. This is a speed optimization.
+        if found_arguments:
+            return
+
+def _get_lambda_name(node):
+    stmt = node.parent
+    if stmt.type == 'expr_stmt':
+        first_operator = next(stmt.yield_operators(), None)
+        if first_operator == '=':
+            first = stmt.children[0]
+            if first.type == 'name':
+                return first.value
+
+    return None
+
+@used_names_cache
+def _get_call_sites(used_names, string_name):
+    """
+    Returns the ``(name, trailer)`` pairs of all calls ``string_name(...)`` in
+    a module, including method calls like ``foo.string_name(...)``. Whether
+    the callee is the searched function is checked later on, by inferring it.
+    """
+    call_sites = []
+    for name in used_names.get(string_name, ()):
+        bracket = name.get_next_leaf()
+        if bracket == '(' and bracket.parent.type == 'trailer':
+            call_sites.append((name, bracket.parent))
+    return call_sites
+
+def _check_name_for_execution(inference_state, context, compare_node, name, trailer):
+    """
+    Yields the arguments of the call ``name(...)`` if ``name`` really is the
+    searched function (or class), which also rules out method calls like
+    ``obj.f(...)`` of an unrelated ``f``.
+    """
+    from jedi.inference.value.function import BaseFunctionExecutionContext
+
+    def create_args(value):
+        arglist = trailer.children[1]
+        if arglist == ')':
+            arglist = None
+        args = TreeArguments(inference_state, context, arglist, trailer)
+        from jedi.inference.value.instance import InstanceArguments
+        if value.tree_node.type == 'classdef':
+            created_instance = instance.TreeInstance(
+                inference_state,
+                value.parent_context,
+                value,
+                args
+            )
+            return InstanceArguments(created_instance, args)
         else:
-            yield from _get_possible_nodes(child)
+            if value.is_bound_method():
+                args = InstanceArguments(value.instance, args)
+            return args
+
+    for value in inference_state.infer(context, name):
+        value_node = value.tree_node
+        if compare_node == value_node:
+            yield create_args(value)
+        elif isinstance(value.parent_context, BaseFunctionExecutionContext) \
+                and compare_node.type == 'funcdef':
+            # Here we're trying to find decorators by checking the first
+            # parameter. It's not very generic though. Should find a better
+            # solution that also applies to nested decorators.
+            param_names = value.parent_context.get_param_names()
+            if len(param_names) != 1:
+                continue
+            values = param_names[0].infer()
+            if [v.tree_node for v in values] == [compare_node]:
+                # Found a decorator.
+                module_context = context.get_root_context()
+                execution_context = value.as_context(create_args(value))
+                call_sites = _get_call_sites(module_context.tree_node.get_used_names(), param_names[0].string_name)
+                for name, trailer in call_sites:
+                    if value_node.start_pos < name.start_pos < value_node.end_pos:
+                        random_context = execution_context.create_context(name)
+                        yield from _check_name_for_execution(
+                            inference_state,
+                            random_context,
+                            compare_node,
+                            name,
+                            trailer
+                        )
@@ -3,21 +3,57 @@ Filters are objects that you can use to filter names in different scopes. They
 are needed for name resolution.
 """
 from abc import abstractmethod
-from typing import List, MutableMapping, Type
-import weakref
+from bisect import bisect_left
+from typing import Dict, List, Tuple, Type
 from parso.tree import search_ancestor
-from parso.python.tree import Name, UsedNamesMapping
+from parso.python.tree import Name
 from jedi.inference import flow_analysis
 from jedi.inference.base_value import ValueSet, ValueWrapper, LazyValueWrapper
-from jedi.parser_utils import get_cached_parent_scope, get_parso_cache_node
+from jedi.parser_utils import get_parso_cache_node, get_parent_scope, used_names_cache
 from jedi.inference.utils import to_list
 from jedi.inference.names import TreeNameDefinition, ParamName, AnonymousParamName, AbstractNameDefinition, NameWrapper
-_definition_name_cache: MutableMapping[UsedNamesMapping, List[Name]]
-_definition_name_cache = weakref.WeakKeyDictionary()
+_DefinitionIndex = Dict[object, Tuple[List[Tuple[int, int]], List[Name]]]
+_NO_DEFINITIONS: Tuple[List[Tuple[int, int]], List[Name]] = ([], [])
+
+@used_names_cache
+def _get_definition_names(used_names, name_key):
+    names = used_names.get(name_key, ())
+    return tuple(name for name in names if name.is_definition(include_setitem=True))
+
+@used_names_cache
+def _get_definition_index(used_names, name_key):
+    """
+    Returns the definitions of a name in a module, grouped by the scope they
+    are reachable from (a dict of scope node -> positions, names). Both lists
+    are sorted by position, so filtering by a position is a binary search.
+    Names in trailers (``foo.bar = 3``) are never reachable and left out.
+    """
+    index: _DefinitionIndex = {}
+    for name in used_names.get(name_key, ()):
+        if not name.is_definition(include_setitem=True):
+            continue
+        parent = name.parent
+        if parent.type == 'trailer':
+            continue
+        base_node = parent if parent.type in ('classdef', 'funcdef') else name
+        positions, names = index.setdefault(get_parent_scope(base_node), ([], []))
+        positions.append(name.start_pos)
+        names.append(name)
+
+    for positions, names in index.values():
+        if positions != sorted(positions):
+            names.sort(key=lambda name: name.start_pos)
+            positions.sort()
+    return index
 
 class AbstractFilter:
     _until_position = None
 
+    def _filter(self, names):
+        if self._until_position is not None:
+            return [n for n in names if n.start_pos < self._until_position]
+        return names
+
 class FilterWrapper:
     name_wrapper_class: Type[NameWrapper]
 
@@ -41,6 +77,16 @@ class _AbstractUsedNamesFilter(AbstractFilter):
         self._used_names = module_context.tree_node.get_used_names()
         self.parent_context = parent_context
 
+    def get(self, name):
+        return self._convert_names(self._filter(_get_definition_names(self._used_names, name)))
+
+    def _convert_names(self, names):
+        get_tree_name = self.parent_context.get_tree_name
+        return [get_tree_name(self.name_class, name) for name in names]
+
+    def values(self):
+        return self._convert_names(name for name_key in self._used_names for name in self._filter(_get_definition_names(self._used_names, name_key)))
+
     def __repr__(self):
         return '<%s: %s>' % (self.__class__.__name__, self.parent_context)
 
@@ -57,6 +103,25 @@ class ParserTreeFilter(_AbstractUsedNamesFilter):
         self._origin_scope = origin_scope
         self._until_position = until_position
 
+    def _filter(self, names):
+        given = set(names)
+        result = []
+        for name_key in dict.fromkeys(name.value for name in names):
+            index = _get_definition_index(self._used_names, name_key)
+            positions, candidates = index.get(self._parser_scope, _NO_DEFINITIONS)
+            if self._until_position is not None:
+                candidates = candidates[:bisect_left(positions, self._until_position)]
+            result += self._check_flows([name for name in candidates if name in given])
+        return result
+
+    def _check_flows(self, names):
+        for name in sorted(names, key=lambda name: name.start_pos, reverse=True):
+            check = flow_analysis.reachability_check(context=self._node_context, value_scope=self._parser_scope, node=name, origin_scope=self._origin_scope)
+            if check is not flow_analysis.UNREACHABLE:
+                yield name
+            if check is flow_analysis.REACHABLE:
+                break
+
 class _FunctionExecutionFilter(ParserTreeFilter):
 
     def __init__(self, parent_context, function_value, until_position, origin_scope):
@@ -73,7 +138,22 @@ class AnonymousFunctionExecutionFilter(_FunctionExecutionFilter):
     pass
 
 class GlobalNameFilter(_AbstractUsedNamesFilter):
-    pass
+
+    def get(self, name):
+        try:
+            names = self._used_names[name]
+        except KeyError:
+            return []
+        return self._convert_names(self._filter(names))
+
+    @to_list
+    def _filter(self, names):
+        for name in names:
+            if name.parent.type == 'global_stmt':
+                yield name
+
+    def values(self):
+        return self._convert_names(name for name_list in self._used_names.values() for name in self._filter(name_list))
 
 class DictFilter(AbstractFilter):
 
@@ -7,6 +7,7 @@ as annotations in future python versions.
 import re
 from inspect import Parameter
 from parso import ParserSyntaxError, parse
+from jedi.cache import CacheStatistics
 from jedi.inference.cache import inference_state_method_cache
 from jedi.inference.base_value import ValueSet, NO_VALUES
 from jedi.inference.gradual.base import DefineGenericBaseClass, GenericClass
@@ -18,6 +19,68 @@ from jedi.inference.param import get_executed_param_names
 from jedi import debug
 from jedi import parser_utils
 
+class _AnnotationCache:
+    """
+    The parts of annotations that only depend on the syntax tree of a module.
+    """
+    def __init__(self):
+        self.string_values = {}  # string node -> its value
+        self.forward_references = {}  # (scope node, string) -> node or None
+        self.type_comments = {}  # funcdef -> (param strings, return string) or None
+
+@parser_utils.used_names_cache
+def _create_annotation_cache(used_names):
+    return _AnnotationCache()
+
+def _get_annotation_cache(node):
+    return _create_annotation_cache(node.get_root_node().get_used_names())
+
+def _get_string_value(context, string_node):
+    string_values = _get_annotation_cache(string_node).string_values
+    try:
+        return string_values[string_node]
+    except KeyError:
+        value = context.inference_state.compiled_subprocess.safe_literal_eval(
+            string_node.value)
+        string_values[string_node] = value
+        return value
+
+def _get_forward_reference_node(context, string):
+    """
+    Parses a string annotation in the scope of ``context``. The resulting node
+    is cached, so inferring the same annotation again finds the results of
+    the previous inference.
+    """
+    forward_references = _get_annotation_cache(context.tree_node).forward_references
+    key = context.tree_node, string
+    try:
+        return forward_references[key]
+    except KeyError:
+        pass
+
+    try:
+        new_node = context.inference_state.grammar.parse(
+            string,
+            start_symbol='eval_input',
+            error_recovery=False
+        )
+    except ParserSyntaxError:
+        debug.warning('Annotation not parsed: %s' % string)
+        new_node = None
+    else:
+        module = context.tree_node.get_root_node()
+        parser_utils.move(new_node, module.end_pos[0])
+        new_node.parent = context.tree_node
+    forward_references[key] = new_node
+    return new_node
+
+def _infer_annotation_string(context, string):
+    node = _get_forward_reference_node(context, string)
+    if node is None:
+        return NO_VALUES
+    return infer_annotation(context, node)
+
+@inference_state_method_cache()
 def infer_annotation(context, annotation):
     """
     Inferes an annotation node. This means that it inferes the part of
@@ -27,16 +90,15 @@ def infer_annotation(context, annotation):
 
     Also checks for forward references (strings)
     """
-    from jedi.inference.gradual.typing import GenericClass
-
     def infer():
         if annotation.type == 'string':
-            annotation_str = context.inference_state.compiled_subprocess.safe_literal_eval(annotation.value)
-            return context.inference_state.parse_and_infer(
-                annotation_str,
-                context=context,
-                node=annotation
-            ).execute_annotation()
+            annotation_str = _get_string_value(context, annotation)
+            if not isinstance(annotation_str, str):
+                return NO_VALUES
+            node = _get_forward_reference_node(context, annotation_str)
+            if node is None:
+                return NO_VALUES
+            return context.infer_node(node).execute_annotation()
         else:
             return context.infer_node(annotation)
 
@@ -73,6 +135,30 @@ def _split_comment_param_declaration(decl_text):
         return [decl_text]
     return params
 
+def _get_type_comment(funcdef):
+    """
+    Returns the param and return annotations of a ``# type: (...) -> ...``
+    comment as strings, e.g. ``(['int', 'str'], 'bool')``, or None if the
+    function doesn't have one.
+    """
+    type_comments = _get_annotation_cache(funcdef).type_comments
+    try:
+        return type_comments[funcdef]
+    except KeyError:
+        pass
+
+    result = None
+    comment = parser_utils.get_following_comment_same_line(funcdef)
+    if comment is not None:
+        match = re.match(r"^#\s*type:\s*\(([^#]*)\)\s*->\s*([^#]*)", comment)
+        if match:
+            result = (
+                _split_comment_param_declaration(match.group(1)),
+                match.group(2).strip(),
+            )
+    type_comments[funcdef] = result
+    return result
+
 def _infer_param(function_value, param):
     """
     Infers the type of a function parameter, using type annotations.
@@ -80,11 +166,29 @@ def _infer_param(function_value, param):
     annotation = param.annotation
     if annotation is None:
         # Check for annotations in comments
-        annotation_comment = param.annotation_string
-        if annotation_comment is not None:
-            annotation_comment = annotation_comment.lstrip('(').rstrip(')')
-            return infer_annotation(function_value.parent_context, annotation_comment)
-        return NO_VALUES
+        type_comment = _get_type_comment(param.parent.parent)
+        if type_comment is None:
+            return NO_VALUES
+        params_comments = type_comment[0]
+        all_params = [child for child in param.parent.children
+                      if child.type == 'param']
+        index = all_params.index(param)
+        if len(params_comments) != len(all_params):
+            debug.warning(
+                "Comments length != Params length %s %s",
+                params_comments, all_params
+            )
+        if function_value.is_bound_method():
+            if index == 0:
+                # Assume it's self, which is already handled
+                return NO_VALUES
+            index -= 1
+        if index >= len(params_comments):
+            return NO_VALUES
+        return _infer_annotation_string(
+            function_value.parent_context,
+            params_comments[index]
+        )
 
     if annotation.type == 'lambdef':
         # Lambdas are allowed to have annotations, but they are not required to.
@@ -98,28 +202,31 @@ def infer_return_types(function, arguments):
     Infers the type of a function's return value,
     according to type annotations.
     """
+    context = function.get_default_param_context()
     annotation = function.tree_node.annotation
     if annotation is None:
-        # Check for return annotation in function comment
-        comment = clean_scope_docstring(function.tree_node)
-        match = re.search(r'^:return:(.+)$', comment, re.M)
-        if match:
+        # Check for a return annotation in a type comment or the docstring
+        type_comment = _get_type_comment(function.tree_node)
+        if type_comment is not None:
+            annotation_string = type_comment[1]
+        else:
+            comment = parser_utils.clean_scope_docstring(function.tree_node)
+            match = re.search(r'^:return:(.+)$', comment, re.M)
+            if match is None:
+                return NO_VALUES
             annotation_string = match.group(1).strip()
-            annotation = parse(annotation_string, version='3.7').children[0]
+        annotation = _get_forward_reference_node(context, annotation_string)
 
     if annotation is None:
         return NO_VALUES
 
-    context = function.get_default_param_context()
     inferred_annotation = infer_annotation(context, annotation)
 
     if function.is_coroutine():
-        from jedi.inference.gradual.typing import GenericClass
-        from jedi.inference.compiled import builtin_from_name
         coroutine = builtin_from_name(context.inference_state, 'coroutine')
-        return ValueSet([GenericClass(
+        return ValueSet([GenericClass.create_cached(
             coroutine,
-            generics=(inferred_annotation,)
+            TupleGenericManager((inferred_annotation,))
         )])
 
     return inferred_annotation
@@ -134,26 +241,92 @@ def infer_type_vars_for_execution(function, arguments, annotation_dict):
     2. Infer type vars with the execution state we have.
     3. Return the union of all type vars that have been found.
     """
-    from jedi.inference.gradual.typing import BaseTypingValue
-    from jedi.inference.gradual.type_var import TypeVar
+    context = function.get_default_param_context()
+
+    # Only arguments of params whose annotations contain type vars are
+    # inferred. The type vars then only depend on the types of those
+    # arguments, so executions with the same argument types (e.g. from
+    # different call sites) share the result.
+    signature = []
+    for executed_param_name in get_executed_param_names(function, arguments):
+        annotation_node = annotation_dict.get(executed_param_name.string_name)
+        if annotation_node is None or not find_unknown_type_vars(context, annotation_node):
+            continue
+
+        kind = executed_param_name.get_kind()
+        actual_value_set = executed_param_name.infer()
+        if kind is Parameter.VAR_POSITIONAL:
+            actual_value_set = actual_value_set.merge_types_of_iterate()
+        elif kind is Parameter.VAR_KEYWORD:
+            # TODO _dict_values is not public.
+            actual_value_set = actual_value_set.try_merge('_dict_values')
+        signature.append((annotation_node, actual_value_set))
+    if not signature:
+        return {}
+
+    cache = function.inference_state.memoize_cache
+    key = infer_type_vars_for_execution, function, tuple(signature)
+    try:
+        found_type_vars = cache[key]
+    except KeyError:
+        if CacheStatistics.enabled:
+            function.inference_state.cache_statistics.count_miss('memoize_cache')
+    else:
+        if CacheStatistics.enabled:
+            function.inference_state.cache_statistics.count_hit('memoize_cache')
+        return dict(found_type_vars)
 
     found_type_vars = {}
-    executed_param_names = get_executed_param_names(function, arguments)
-
-    for executed_param_name in executed_param_names:
-        p_name = executed_param_name.string_name
-        annotation = annotation_dict.get(p_name)
-        if annotation is not None:
-            annotation_values = annotation.infer()
-            for annotation_value in annotation_values:
-                if isinstance(annotation_value, BaseTypingValue):
-                    type_var_dict = annotation_value.infer_type_vars(executed_param_name.infer())
-                    for type_var_name, values in type_var_dict.items():
-                        if type_var_name not in found_type_vars:
-                            found_type_vars[type_var_name] = NO_VALUES
-                        found_type_vars[type_var_name] |= values
-
-    return found_type_vars
+    for annotation_node, actual_value_set in signature:
+        for annotation_value in context.infer_node(annotation_node):
+            merge_type_var_dicts(
+                found_type_vars,
+                annotation_value.infer_type_vars(actual_value_set),
+            )
+
+    cache[key] = found_type_vars
+    return dict(found_type_vars)
+
+def merge_type_var_dicts(base_dict, new_dict):
+    for type_var_name, values in new_dict.items():
+        if values:
+            try:
+                base_dict[type_var_name] |= values
+            except KeyError:
+                base_dict[type_var_name] = values
+
+def find_unknown_type_vars(context, node):
+    """
+    Returns the type vars used in an annotation node, in the order they
+    appear.
+    """
+    def check_node(node):
+        if node.type in ('atom_expr', 'power'):
+            trailer = node.children[-1]
+            if trailer.type == 'trailer' and trailer.children[0] == '[':
+                for subscript_node in _unpack_subscriptlist(trailer.children[1]):
+                    check_node(subscript_node)
+        else:
+            found[:] = _filter_type_vars(context.infer_node(node), found)
+
+    found = []  # We're not using a set, because the order matters.
+    check_node(node)
+    return found
+
+def _filter_type_vars(value_set, found=()):
+    new_found = list(found)
+    for type_var in value_set:
+        if isinstance(type_var, TypeVar) and type_var not in found:
+            new_found.append(type_var)
+    return new_found
+
+def _unpack_subscriptlist(subscriptlist):
+    if subscriptlist.type == 'subscriptlist':
+        for subscript in subscriptlist.children[::2]:
+            if subscript.type != 'subscript':
+                yield subscript
+    elif subscriptlist.type != 'subscript':
+        yield subscriptlist
 
 def _infer_type_vars_for_callable(arguments, lazy_params):
     """
@@ -1,3 +1,4 @@
+from jedi.cache import CacheStatistics, memoize_method
 from jedi.inference.cache import inference_state_method_cache
 from jedi.inference.base_value import ValueSet, NO_VALUES, Value, iterator_to_value_set, LazyValueWrapper, ValueWrapper
 from jedi.inference.compiled import builtin_from_name
@@ -56,6 +57,52 @@ class DefineGenericBaseClass(LazyValueWrapper):
     def get_generics(self):
         return self._generics_manager.to_tuple()
 
+    def _create_instance_with_generics(self, generics_manager):
+        raise NotImplementedError
+
+    def define_generics(self, type_var_dict):
+        from jedi.inference.gradual.type_var import TypeVar
+        changed = False
+        new_generics = []
+        for generic_set in self.get_generics():
+            values = NO_VALUES
+            for generic in generic_set:
+                if isinstance(generic, (DefineGenericBaseClass, TypeVar)):
+                    result = generic.define_generics(type_var_dict)
+                    values |= result
+                    if result != ValueSet({generic}):
+                        changed = True
+                else:
+                    values |= ValueSet([generic])
+            new_generics.append(values)
+
+        if not changed:
+            # There might not be any type vars that change. In that case just
+            # return itself, because it does not make sense to potentially lose
+            # cached results.
+            return ValueSet([self])
+
+        return ValueSet([self._create_instance_with_generics(
+            TupleGenericManager(tuple(new_generics))
+        )])
+
+def _get_cached_generic(inference_state, key, create):
+    """
+    Returns the generic value stored for ``key``, ``create()`` is only called
+    if there is none yet.
+    """
+    cache = inference_state.generic_class_cache
+    try:
+        value = cache[key]
+    except KeyError:
+        if CacheStatistics.enabled:
+            inference_state.cache_statistics.count_miss('generic_class_cache')
+        value = cache[key] = create()
+    else:
+        if CacheStatistics.enabled:
+            inference_state.cache_statistics.count_hit('generic_class_cache')
+    return value
+
 class GenericClass(DefineGenericBaseClass, ClassMixin):
     """
     A class that is defined with generics, might be something simple like:
@@ -70,6 +117,36 @@ class GenericClass(DefineGenericBaseClass, ClassMixin):
         self.inference_state = class_value.inference_state
         self.parent_context = class_value.parent_context
 
+    @classmethod
+    def create_cached(cls, class_value, generics_manager):
+        """
+        Returns the generic class for ``class_value`` specialized with the
+        generics of ``generics_manager``. Equal specializations (e.g. every
+        ``List[int]`` that is created while defining type vars) return the
+        same object, so they also share its memoized results.
+
+        Since specializations are unique, value sets of them compare equal
+        as well, which makes nested generics like ``List[List[int]]`` unique,
+        too.
+        """
+        return _get_cached_generic(
+            class_value.inference_state,
+            (class_value, generics_manager.get_key()),
+            lambda: cls(class_value, generics_manager),
+        )
+
+    def _get_wrapped_value(self):
+        return self._class_value
+
+    @memoize_method
+    @to_list
+    def py__bases__(self):
+        for base in self._wrapped_value.py__bases__():
+            yield _LazyGenericBaseClass(self, base, self._generics_manager)
+
+    def _create_instance_with_generics(self, generics_manager):
+        return GenericClass.create_cached(self._class_value, generics_manager)
+
 class _LazyGenericBaseClass:
 
     def __init__(self, class_value, lazy_base_class, generics_manager):
@@ -123,6 +200,18 @@ class BaseTypingClassWithGenerics(DefineGenericBaseClass):
         self.parent_context = parent_context
         self._tree_name = tree_name
 
+    @classmethod
+    def create_cached(cls, parent_context, tree_name, generics_manager):
+        """
+        Like :meth:`GenericClass.create_cached`, e.g. every ``Type[int]`` is
+        the same object.
+        """
+        return _get_cached_generic(
+            parent_context.inference_state,
+            (cls, parent_context, tree_name, generics_manager.get_key()),
+            lambda: cls(parent_context, tree_name, generics_manager),
+        )
+
     def __repr__(self):
         return '%s(%s%s)' % (self.__class__.__name__, self._tree_name.value, self._generics_manager)
 
@@ -10,7 +10,13 @@ from jedi.inference.value.iterable import SequenceLiteralValue
 from jedi.inference.helpers import is_string
 
 class _AbstractGenericManager:
-    pass
+    def get_key(self):
+        """
+        Returns a hashable key, managers with equal keys define the same
+        generics. Used to share generic classes, see
+        :meth:`jedi.inference.gradual.base.GenericClass.create_cached`.
+        """
+        raise NotImplementedError
 
 class LazyGenericManager(_AbstractGenericManager):
 
@@ -35,6 +41,11 @@ class LazyGenericManager(_AbstractGenericManager):
     def to_tuple(self):
         return self._tuple()
 
+    def get_key(self):
+        # Inferring the index would defeat the laziness, the same index in
+        # the same context defines the same generics anyway.
+        return self._context_of_index, self._index_value
+
 class TupleGenericManager(_AbstractGenericManager):
 
     def __init__(self, tup):
@@ -51,3 +62,6 @@ class TupleGenericManager(_AbstractGenericManager):
 
     def to_tuple(self):
         return self._tuple
+
+    def get_key(self):
+        return self._tuple
@@ -5,6 +5,7 @@ from collections import namedtuple
 from typing import Dict, Mapping, Tuple
 from pathlib import Path
 from jedi import settings
+from jedi.cache import CacheStatistics, cache_statistics
 from jedi.file_io import FileIO
 from jedi.parser_utils import get_cached_code_lines
 from jedi.inference.base_value import ValueSet, NO_VALUES
@@ -36,6 +37,8 @@ def _cache_stub_file_map(version_info):
     Returns a map of an importable name in Python to a stub file.
     """
     if version_info[:2] not in _version_cache:
+        if CacheStatistics.enabled:
+            cache_statistics.count_miss('typeshed_version_cache')
         v_string = '.'.join(str(i) for i in version_info[:2])
         stub_map = {}
         for directory in ['stdlib', f'stdlib/{v_string}', 'third_party']:
@@ -48,6 +51,9 @@ def _cache_stub_file_map(version_info):
             stub_map['django'] = PathInfo(DJANGO_INIT_PATH, True)
         
         _version_cache[version_info[:2]] = stub_map
+    else:
+        if CacheStatistics.enabled:
+            cache_statistics.count_hit('typeshed_version_cache')
     return _version_cache[version_info[:2]]
 
 def _try_to_load_stub(inference_state, import_names, python_value_set, parent_module_value, sys_path):
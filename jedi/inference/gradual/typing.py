@@ -33,6 +33,24 @@ class ProxyWithGenerics(BaseTypingClassWithGenerics):
 class ProxyTypingValue(BaseTypingValue):
     index_class = ProxyWithGenerics
 
+    def with_generics(self, generics_tuple):
+        return self.index_class.create_cached(
+            self.parent_context,
+            self._tree_name,
+            generics_manager=TupleGenericManager(generics_tuple)
+        )
+
+    def py__getitem__(self, index_value_set, contextualized_node):
+        return ValueSet(
+            self.index_class.create_cached(
+                self.parent_context,
+                self._tree_name,
+                generics_manager=LazyGenericManager(
+                    context_of_index=contextualized_node.context,
+                    index_value=index_value,
+                )
+            ) for index_value in index_value_set)
+
 class _TypingClassMixin(ClassMixin):
     pass
 
@@ -57,5 +57,23 @@ def infer_call_of_leaf(context, leaf, cut_own_trailer=False):
 
     return context.infer_node(power)
 
+def _get_safe_value_or_none(value, accept):
+    value = value.get_safe_value(default=None)
+    if isinstance(value, accept):
+        return value
+
+def get_int_or_none(value):
+    return _get_safe_value_or_none(value, int)
+
 class SimpleGetItemNotFound(Exception):
     pass
+
+def is_big_annoying_library(context):
+    string_names = context.get_root_context().string_names
+    if string_names is None:
+        return False
+
+    # Especially pandas and tensorflow are huge complicated Python libraries
+    # that get even slower than they already are when Jedi tries to undrstand
+    # dynamic features like decorators, ifs and other stuff.
+    return string_names[0] in ('pandas', 'numpy', 'tensorflow', 'matplotlib')
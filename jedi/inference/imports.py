@@ -14,6 +14,7 @@ from parso.python import tree
 from parso.tree import search_ancestor
 from jedi import debug
 from jedi import settings
+from jedi import profiler
 from jedi.file_io import FolderIO
 from jedi.parser_utils import get_cached_code_lines
 from jedi.inference import sys_path
@@ -155,7 +156,17 @@ class Importer:
                 pass
         return names
 
-@plugin_manager.decorate()
+def _get_import_dispatch_key(inference_state, import_names, *args, **kwargs):
+    # Plugins are dispatched by the top-level package name.
+    return import_names[0] if import_names else None
+
+@profiler.profile(
+    'import',
+    get_args=lambda inference_state, import_names, *args, **kwargs: {
+        'module': '.'.join(import_names)
+    },
+)
+@plugin_manager.decorate(get_dispatch_key=_get_import_dispatch_key)
 @import_module_decorator
 def import_module(inference_state, import_names, parent_module_value, sys_path):
     """
@@ -2,6 +2,7 @@ from jedi.inference.base_value import ValueSet, NO_VALUES
 from jedi.common import monkeypatch
 
 class AbstractLazyValue:
+    __slots__ = ('data', 'min', 'max')
 
     def __init__(self, data, min=1, max=1):
         self.data = data
@@ -13,16 +14,20 @@ class AbstractLazyValue:
 
 class LazyKnownValue(AbstractLazyValue):
     """data is a Value."""
+    __slots__ = ()
 
 class LazyKnownValues(AbstractLazyValue):
     """data is a ValueSet."""
+    __slots__ = ()
 
 class LazyUnknownValue(AbstractLazyValue):
+    __slots__ = ()
 
     def __init__(self, min=1, max=1):
         super().__init__(None, min, max)
 
 class LazyTreeValue(AbstractLazyValue):
+    __slots__ = ('context', '_predefined_names')
 
     def __init__(self, context, node, min=1, max=1):
         super().__init__(node, min, max)
@@ -30,4 +35,5 @@ class LazyTreeValue(AbstractLazyValue):
         self._predefined_names = dict(context.predefined_names)
 
 class MergedLazyValues(AbstractLazyValue):
-    """data is a list of lazy values."""
\ No newline at end of file
+    """data is a list of lazy values."""
+    __slots__ = ()
@@ -12,6 +12,7 @@ from jedi.inference.helpers import deep_ast_copy, infer_call_of_leaf
 from jedi.plugins import plugin_manager
 
 class AbstractNameDefinition:
+    __slots__ = ('_memoize_method_dct',)
     start_pos: Optional[Tuple[int, int]] = None
     string_name: str
     parent_context = None
@@ -39,6 +40,7 @@ class AbstractArbitraryName(AbstractNameDefinition):
     string literals, which is not really a name, but for Jedi we use this
     concept of Name for completions as well.
     """
+    __slots__ = ('inference_state', 'string_name', 'parent_context', 'start_pos')
     is_value_name = False
 
     def __init__(self, inference_state, string):
@@ -48,21 +50,24 @@ class AbstractArbitraryName(AbstractNameDefinition):
         self.start_pos = None  # AbstractArbitraryName doesn't have a start position
 
 class AbstractTreeName(AbstractNameDefinition):
+    __slots__ = ('parent_context', 'tree_name')
 
     def __init__(self, parent_context, tree_name):
         self.parent_context = parent_context
         self.tree_name = tree_name
 
 class ValueNameMixin:
-    pass
+    __slots__ = ()
 
 class ValueName(ValueNameMixin, AbstractTreeName):
+    __slots__ = ('_value',)
 
     def __init__(self, value, tree_name):
         super().__init__(value.parent_context, tree_name)
         self._value = value
 
 class TreeNameDefinition(AbstractTreeName):
+    __slots__ = ()
     _API_TYPES = dict(import_name='module', import_from='module', funcdef='function', param='param', classdef='class')
 
     def assignment_indexes(self):
@@ -101,9 +106,10 @@ class TreeNameDefinition(AbstractTreeName):
         return indexes
 
 class _ParamMixin:
-    pass
+    __slots__ = ()
 
 class ParamNameInterface(_ParamMixin):
+    __slots__ = ()
     api_type = 'param'
 
     def get_executed_param_name(self):
@@ -118,19 +124,22 @@ class ParamNameInterface(_ParamMixin):
         return self
 
 class BaseTreeParamName(ParamNameInterface, AbstractTreeName):
+    __slots__ = ()
     annotation_node = None
     default_node = None
 
 class _ActualTreeParamName(BaseTreeParamName):
+    __slots__ = ('function_value',)
 
     def __init__(self, function_value, tree_name):
         super().__init__(function_value.get_default_param_context(), tree_name)
         self.function_value = function_value
 
 class AnonymousParamName(_ActualTreeParamName):
-    pass
+    __slots__ = ()
 
 class ParamName(_ActualTreeParamName):
+    __slots__ = ('arguments',)
 
     def __init__(self, function_value, tree_name, arguments):
         super().__init__(function_value, tree_name)
@@ -171,10 +180,10 @@ class NameWrapper:
         return f'{self.__class__.__name__}({self._wrapped_name!r})'
 
 class StubNameMixin:
-    pass
+    __slots__ = ()
 
 class StubName(StubNameMixin, TreeNameDefinition):
-    pass
+    __slots__ = ()
 
 class ModuleName(ValueNameMixin, AbstractNameDefinition):
     start_pos = (1, 0)
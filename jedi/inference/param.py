@@ -8,6 +8,7 @@ from jedi.inference.value import iterable
 from jedi.inference.names import ParamName
 
 class ExecutedParamName(ParamName):
+    __slots__ = ('_lazy_value', '_is_default')
 
     def __init__(self, function_value, arguments, param_node, lazy_value, is_default=False):
         super().__init__(function_value, param_node.name, arguments=arguments)
@@ -5,6 +5,7 @@ docstrings and other things around decorators.
 from jedi.inference.base_value import ValueWrapper, ValueSet
 
 class Decoratee(ValueWrapper):
+    __slots__ = ('_original_value',)
 
     def __init__(self, wrapped_value, original_value):
         super().__init__(wrapped_value)
@@ -18,20 +18,101 @@ It is important to note that:
 
 1. Array modifications work only in the current module.
 2. Jedi only checks Array additions; ``list.pop``, etc are ignored.
+3. For literals that are assigned to a name, only modifications of a receiver
+   with the same name are checked (``self.arr.append`` for ``self.arr = []``),
+   unless the name might be aliased (``arr2 = arr``) or passed somewhere
+   (``foo(arr)``).
 """
+from typing import Dict, List, Optional, Tuple
+from parso.python.tree import Name
+from parso.tree import BaseNode
 from jedi import debug
 from jedi import settings
 from jedi.inference import recursion
-from jedi.inference.base_value import ValueSet, NO_VALUES, HelperValueMixin, ValueWrapper
+from jedi.inference.base_value import NO_VALUES, HelperValueMixin, ValueWrapper
 from jedi.inference.lazy_value import LazyKnownValues
 from jedi.inference.helpers import infer_call_of_leaf
 from jedi.inference.cache import inference_state_method_cache
+from jedi.parser_utils import used_names_cache
 _sentinel = object()
+_ADD_NAMES = ('append', 'extend', 'insert', 'add', 'update')
+_MutationSite = Tuple[str, Name, BaseNode, BaseNode]
 
 def check_array_additions(context, sequence):
     """ Just a mapper function for the internal _internal_check_array_additions """
+    if sequence.array_type not in ('list', 'set'):
+        # TODO also check for dict updates
+        return NO_VALUES
+
     return _internal_check_array_additions(context, sequence)
 
+@used_names_cache
+def _get_mutation_index(used_names):
+    """
+    Returns all calls of ``append``, ``extend``, ``insert``, ``add`` and
+    ``update`` in a module, keyed by the name of the receiver (``x`` for
+    ``foo.x.append(1)``). Calls on receivers that don't end with a name (e.g.
+    ``foo().append(1)``) are stored under ``None``.
+
+    Every entry is a tuple of ``(add_name, name, power, execution_trailer)``.
+    """
+    index: Dict[Optional[str], List[_MutationSite]] = {}
+    for add_name in _ADD_NAMES:
+        for name in used_names.get(add_name, ()):
+            trailer = name.parent
+            if trailer.type != 'trailer' or trailer.children[0] != '.':
+                continue
+            power = trailer.parent
+            trailer_pos = power.children.index(trailer)
+            try:
+                execution_trailer = power.children[trailer_pos + 1]
+            except IndexError:
+                continue
+            if execution_trailer.type != 'trailer' \
+                    or execution_trailer.children[0] != '(' \
+                    or execution_trailer.children[1] == ')':
+                continue
+
+            receiver = trailer.get_previous_leaf()
+            key = receiver.value if receiver.type == 'name' else None
+            index.setdefault(key, []).append((add_name, name, power, execution_trailer))
+
+    for sites in index.values():
+        sites.sort(key=lambda site: site[1].start_pos)
+    return index
+
+def _get_receiver_names(sequence):
+    """
+    Returns the names a literal is directly assigned to or None if it's not
+    the right side of a simple assignment.
+    """
+    atom = getattr(sequence, 'atom', None)
+    if atom is None:
+        return None
+    expr_stmt = atom.parent
+    if expr_stmt.type != 'expr_stmt' or expr_stmt.children[-1] is not atom \
+            or expr_stmt.children[1] != '=':
+        return None
+    return [name.value for name in expr_stmt.get_defined_names()]
+
+def _may_be_aliased(used_names, name_key):
+    """
+    Returns whether an object bound to the name might be modified through
+    another name, because the name is used in any other way than accessing
+    its attributes and items, comparing it or iterating over it. This covers
+    ``arr2 = arr``, ``foo(arr)``, ``return arr`` and the like.
+    """
+    for name in used_names.get(name_key, ()):
+        if name.is_definition():
+            continue
+        next_leaf = name.get_next_leaf()
+        if next_leaf.type == 'operator' and next_leaf.value in ('.', '['):
+            continue
+        if name.parent.type in ('comparison', 'not_test', 'if_stmt', 'while_stmt', 'for_stmt', 'del_stmt'):
+            continue
+        return True
+    return False
+
 @inference_state_method_cache(default=NO_VALUES)
 @debug.increase_indent
 def _internal_check_array_additions(context, sequence):
@@ -41,32 +122,73 @@ def _internal_check_array_additions(context, sequence):
     >>> a = [""]
     >>> a.append(1)
     """
-    from jedi.inference.helpers import infer_call_of_leaf
-    from jedi.inference.value import iterable
-
-    def check_additions(value_node):
-        additions = NO_VALUES
-        for name, trailer in value_node.get_defined_names_and_trailers():
-            if name.value in ('append', 'insert', 'extend'):
-                trailer_nodes = trailer.children[1:-1]  # Skip parentheses
-                if name.value == 'extend':
-                    additions |= ValueSet.from_sets(
-                        lazy_value.infer()
-                        for lazy_value in iterate_argument_clinic(context.inference_state, trailer_nodes, 'extend(iterable)')
-                    )
-                else:
-                    additions |= ValueSet.from_sets(
-                        infer_call_of_leaf(context, trailer_nodes[0])
-                        for _ in iterate_argument_clinic(context.inference_state, trailer_nodes, f'{name.value}(object)')
+    from jedi.inference import arguments
+
+    debug.dbg('Dynamic array search for %s' % sequence, color='MAGENTA')
+    module_context = context.get_root_context()
+    if not settings.dynamic_array_additions or module_context.is_compiled():
+        debug.dbg('Dynamic array search aborted.', color='MAGENTA')
+        return NO_VALUES
+
+    def find_additions(context, arglist, add_name):
+        params = list(arguments.TreeArguments(context.inference_state, context, arglist).unpack())
+        result = set()
+        if add_name in ['insert']:
+            params = params[1:]
+        if add_name in ['append', 'add', 'insert']:
+            for key, lazy_value in params:
+                result.add(lazy_value)
+        elif add_name in ['extend', 'update']:
+            for key, lazy_value in params:
+                result |= set(lazy_value.infer().iterate())
+        return result
+
+    used_names = module_context.tree_node.get_used_names()
+    index = _get_mutation_index(used_names)
+    receiver_names = _get_receiver_names(sequence)
+    if receiver_names is None \
+            or any(_may_be_aliased(used_names, name) for name in receiver_names):
+        sites = [site for sites in index.values() for site in sites]
+    else:
+        # Only calls on the names the literal is assigned to and on
+        # receivers that are not simple names can modify it.
+        sites = [site for key in receiver_names + [None] for site in index.get(key, ())]
+
+    temp_param_add, settings.dynamic_params_for_other_modules = \
+        settings.dynamic_params_for_other_modules, False
+
+    is_list = sequence.name.string_name == 'list'
+    search_names = (['append', 'extend', 'insert'] if is_list else ['add', 'update'])
+
+    added_types = set()
+    value_node = context.tree_node
+    for add_name, name, power, execution_trailer in sites:
+        if add_name not in search_names:
+            continue
+        if not (value_node.start_pos < name.start_pos < value_node.end_pos):
+            continue
+
+        random_context = context.create_context(name)
+
+        with recursion.execution_allowed(context.inference_state, power) as allowed:
+            if allowed:
+                found = infer_call_of_leaf(
+                    random_context,
+                    name,
+                    cut_own_trailer=True
+                )
+                if sequence in found:
+                    # The arrays match. Now add the results
+                    added_types |= find_additions(
+                        random_context,
+                        execution_trailer.children[1],
+                        add_name
                     )
-        return additions
-
-    added_values = NO_VALUES
-    for value in sequence.infer():
-        if value.is_instance() and isinstance(value, iterable.Sequence):
-            added_values |= check_additions(value.name.tree_name)
 
-    return added_values
+    # reset settings
+    settings.dynamic_params_for_other_modules = temp_param_add
+    debug.dbg('Dynamic array result %s', added_types, color='MAGENTA')
+    return added_types
 
 def get_dynamic_array_instance(instance, arguments):
     """Used for set() and list() instances."""
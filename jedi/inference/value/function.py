@@ -1,5 +1,6 @@
 from parso.python import tree
 from jedi import debug
+from jedi.cache import CacheStatistics
 from jedi.inference.cache import inference_state_method_cache, CachedMetaClass
 from jedi.inference import compiled
 from jedi.inference import recursion
@@ -9,7 +10,7 @@ from jedi.inference.signature import TreeSignature
 from jedi.inference.filters import ParserTreeFilter, FunctionExecutionFilter, AnonymousFunctionExecutionFilter
 from jedi.inference.names import ValueName, AbstractNameDefinition, AnonymousParamName, ParamName, NameWrapper
 from jedi.inference.base_value import ContextualizedNode, NO_VALUES, ValueSet, TreeValue, ValueWrapper
-from jedi.inference.lazy_value import LazyKnownValues, LazyKnownValue, LazyTreeValue
+from jedi.inference.lazy_value import LazyKnownValues, LazyKnownValue
 from jedi.inference.context import ValueContext, TreeContextMixin
 from jedi.inference.value import iterable
 from jedi import parser_utils
@@ -27,13 +28,23 @@ class LambdaName(AbstractNameDefinition):
         self.tree_name = lambda_value.tree_node.name
 
 class FunctionAndClassBase(TreeValue):
-    pass
+    __slots__ = ()
 
 class FunctionMixin:
+    __slots__ = ()
     api_type = 'function'
 
+    def py__call__(self, arguments):
+        function_execution = self.as_context(arguments)
+        return function_execution.infer()
+
+    def _as_context(self, arguments=None):
+        if arguments is None:
+            return AnonymousFunctionExecution(self)
+        return FunctionExecutionContext(self, arguments)
+
 class FunctionValue(FunctionMixin, FunctionAndClassBase, metaclass=CachedMetaClass):
-    pass
+    __slots__ = ()
 
 class FunctionNameInClass(NameWrapper):
 
@@ -73,6 +84,59 @@ class FunctionExecutionContext(BaseFunctionExecutionContext):
         super().__init__(function_value)
         self._arguments = arguments
 
+    def _get_argument_key(self):
+        """
+        Returns the values of all arguments as a hashable tuple of
+        ``(key, value_set)``, the key is None for positional arguments.
+
+        Only values that were passed directly are used. Returns None if an
+        argument still has to be inferred, building the key must not infer
+        anything.
+        """
+        argument_key = []
+        for key, lazy_value in self._arguments.unpack():
+            if isinstance(lazy_value, LazyKnownValue):
+                values = ValueSet([lazy_value.data])
+            elif isinstance(lazy_value, LazyKnownValues):
+                values = lazy_value.data
+            else:
+                return None
+            argument_key.append((key, values))
+        return tuple(argument_key)
+
+    def infer(self):
+        """
+        The return values of a function only depend on the values its params
+        are inferred to. Executions with the same argument values, e.g. from
+        different call sites, therefore share their result. Those don't count
+        against the execution limits either, since nothing is executed.
+        """
+        if self.inference_state.is_analysis:
+            # Analysis reports errors with the nodes of the call site.
+            return super().infer()
+
+        argument_key = self._get_argument_key()
+        if argument_key is None:
+            return super().infer()
+
+        cache = self.inference_state.memoize_cache
+        key = FunctionExecutionContext.infer, self._value, argument_key
+        try:
+            result = cache[key]
+        except KeyError:
+            if CacheStatistics.enabled:
+                self.inference_state.cache_statistics.count_miss('memoize_cache')
+        else:
+            if CacheStatistics.enabled:
+                self.inference_state.cache_statistics.count_hit('memoize_cache')
+            return result
+
+        # Recursive executions with the same argument values don't add
+        # anything.
+        cache[key] = NO_VALUES
+        result = cache[key] = super().infer()
+        return result
+
 class AnonymousFunctionExecution(BaseFunctionExecutionContext):
     pass
 
@@ -1,5 +1,7 @@
 from abc import abstractproperty
-from parso.tree import search_ancestor
+from typing import Dict, List
+from parso.python.tree import Name
+from parso.tree import BaseNode, search_ancestor
 from jedi import debug
 from jedi import settings
 from jedi.inference import compiled
@@ -14,7 +16,8 @@ from jedi.inference.arguments import ValuesArguments, TreeArgumentsWrapper
 from jedi.inference.value.function import FunctionValue, FunctionMixin, OverloadedFunctionValue, BaseFunctionExecutionContext, FunctionExecutionContext, FunctionNameInClass
 from jedi.inference.value.klass import ClassFilter
 from jedi.inference.value.dynamic_arrays import get_dynamic_array_instance
-from jedi.parser_utils import function_is_staticmethod, function_is_classmethod
+from jedi.parser_utils import function_is_staticmethod, function_is_classmethod, used_names_cache
+_SelfAttributeIndex = Dict[BaseNode, Dict[str, List[Name]]]
 
 class InstanceExecutedParamName(ParamName):
 
@@ -121,6 +124,17 @@ class BoundMethod(FunctionMixin, ValueWrapper):
         self.instance = instance
         self._class_context = class_context
 
+    def _get_arguments(self, arguments):
+        assert arguments is not None
+        return InstanceArguments(self.instance, arguments)
+
+    def _as_context(self, arguments=None):
+        if arguments is None:
+            return AnonymousMethodExecutionContext(self.instance, self)
+
+        arguments = self._get_arguments(arguments)
+        return MethodExecutionContext(self.instance, self, arguments)
+
     def __repr__(self):
         return '<%s: %s bound to %s>' % (self.__class__.__name__, self._wrapped_value, self.instance)
 
@@ -157,6 +171,28 @@ class InstanceClassFilter(AbstractFilter):
     def __repr__(self):
         return '<%s for %s>' % (self.__class__.__name__, self._class_filter)
 
+@used_names_cache
+def _get_self_attribute_index(used_names):
+    """
+    Returns all attribute assignments like ``foo.bar = 3`` of a module, keyed
+    by the classes they are in (including outer classes) and then by the
+    attribute name. Whether ``foo`` is actually ``self`` is not checked here.
+    """
+    index: _SelfAttributeIndex = {}
+    for name_key, names in used_names.items():
+        for name in names:
+            trailer = name.parent
+            if trailer.type != 'trailer' \
+                    or len(trailer.parent.children) != 2 \
+                    or trailer.children[0] != '.' \
+                    or not name.is_definition():
+                continue
+            classdef = search_ancestor(trailer, 'classdef')
+            while classdef is not None:
+                index.setdefault(classdef, {}).setdefault(name_key, []).append(name)
+                classdef = search_ancestor(classdef, 'classdef')
+    return index
+
 class SelfAttributeFilter(ClassFilter):
     """
     This class basically filters all the use cases where `self.*` was assigned.
@@ -166,6 +202,51 @@ class SelfAttributeFilter(ClassFilter):
         super().__init__(class_value=instance_class, node_context=node_context, origin_scope=origin_scope, is_instance=True)
         self._instance = instance
 
+    def _get_class_index(self):
+        return _get_self_attribute_index(self._used_names).get(self._parser_scope, {})
+
+    def get(self, name):
+        names = self._get_class_index().get(name, [])
+        return self._convert_names(self._filter_self_names(names))
+
+    def values(self):
+        return self._convert_names(
+            name
+            for names in self._get_class_index().values()
+            for name in self._filter_self_names(names)
+        )
+
+    def _filter(self, names):
+        if not names:
+            return []
+        return list(self._filter_self_names(
+            self._get_class_index().get(names[0].value, [])
+        ))
+
+    def _filter_self_names(self, names):
+        for name in names:
+            if self._access_possible(name):
+                # TODO filter non-self assignments instead of this bad
+                #      filter.
+                if self._is_in_right_scope(name.parent.parent.children[0], name):
+                    yield name
+
+    def _is_in_right_scope(self, self_name, name):
+        self_context = self._node_context.create_context(self_name)
+        names = self_context.goto(self_name, position=self_name.start_pos)
+        return any(
+            n.api_type == 'param'
+            and n.tree_name.get_definition().position_index == 0
+            and n.parent_context.tree_node is self._parser_scope
+            for n in names
+        )
+
+    def _convert_names(self, names):
+        return [SelfName(self._instance, self._node_context, name) for name in names]
+
+    def _check_flows(self, names):
+        return names
+
 class InstanceArguments(TreeArgumentsWrapper):
 
     def __init__(self, instance, arguments):
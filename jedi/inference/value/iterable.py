@@ -2,6 +2,10 @@
 Contains all classes and functions to deal with lists, dicts, generators and
 iterators in general.
 """
+from ast import literal_eval
+
+from jedi import settings
+from jedi.cache import memoize_method
 from jedi.inference import compiled
 from jedi.inference import analysis
 from jedi.inference.lazy_value import LazyKnownValue, LazyKnownValues, LazyTreeValue
@@ -89,29 +93,95 @@ class SequenceLiteralValue(Sequence):
 
     def py__simple_getitem__(self, index):
         """Here the index is an int/str. Raises IndexError/KeyError."""
-        if not isinstance(index, (int, str)):
-            raise TypeError("Index must be an integer or string")
-        
-        children = self.atom.children[1:-1]  # Exclude brackets
-        if isinstance(index, int):
-            if 0 <= index < len(children):
-                return self._defining_context.infer_node(children[index])
-            raise IndexError("List index out of range")
+        if isinstance(index, slice):
+            return ValueSet([self])
         else:
-            raise KeyError(f"Key '{index}' not found")
+            with reraise_getitem_errors(TypeError, KeyError, IndexError):
+                node = self.get_tree_entries()[index]
+            if node == ':' or node.type == 'subscript':
+                return NO_VALUES
+            return self._defining_context.infer_node(node)
 
     def py__iter__(self, contextualized_node=None):
         """
         While values returns the possible values for any array field, this
         function returns the value for a certain index.
         """
-        if self.array_type == 'dict':
-            children = self.atom.children[1:-1:2]  # Only keys, exclude brackets
+        return self._iterate_entries(self.get_tree_entries())
+
+    def merge_types_of_iterate(self, contextualized_node=None, is_async=False):
+        if is_async:
+            return super().merge_types_of_iterate(contextualized_node, is_async)
+        # The order of the entries doesn't matter for the union of their
+        # types, so huge literals only infer a sample.
+        return ValueSet.from_sets(
+            lazy_value.infer()
+            for lazy_value in self._iterate_entries(_sample_entries(self.get_tree_entries()))
+        )
+
+    def _iterate_entries(self, entries):
+        for node in entries:
+            if node == ':' or node.type == 'subscript':
+                # TODO this should probably use at least part of the code
+                #      of infer_subscript_list.
+                yield LazyKnownValue(Slice(self._defining_context, None, None, None))
+            else:
+                yield LazyTreeValue(self._defining_context, node)
+        yield from check_array_additions(self._defining_context, self)
+
+    def py__len__(self):
+        # This function is not really used often. It's more of a try.
+        return len(self.get_tree_entries())
+
+    @memoize_method
+    def get_tree_entries(self):
+        """
+        Returns the nodes of the entries, ``(key, value)`` tuples for dicts.
+        The result is cached, so indexing a large literal is cheap.
+        """
+        c = self.atom.children
+
+        if self.atom.type in self._TUPLE_LIKE:
+            return c[::2]
+
+        array_node = c[1]
+        if array_node in (']', '}', ')'):
+            return []  # Direct closing bracket, doesn't contain items.
+
+        if array_node.type == 'testlist_comp':
+            # filter out (for now) pep 448 single-star unpacking
+            return [value for value in array_node.children[::2]
+                    if value.type != "star_expr"]
+        elif array_node.type == 'dictorsetmaker':
+            kv = []
+            iterator = iter(array_node.children)
+            for key in iterator:
+                if key == "**":
+                    # dict with pep 448 double-star unpacking
+                    # for now ignoring the values imported by **
+                    next(iterator)
+                    next(iterator, None)  # Possible comma.
+                else:
+                    op = next(iterator, None)
+                    if op is None or op == ',':
+                        if key.type == "star_expr":
+                            # pep 448 single-star unpacking
+                            # for now ignoring values imported by *
+                            pass
+                        else:
+                            kv.append(key)  # A set.
+                    else:
+                        assert op == ':'  # A dict.
+                        kv.append((key, next(iterator)))
+                        next(iterator, None)  # Possible comma.
+            return kv
         else:
-            children = self.atom.children[1:-1]  # Exclude brackets
-        
-        for child in children:
-            yield LazyTreeValue(self._defining_context, child)
+            if array_node.type == "star_expr":
+                # pep 448 single-star unpacking
+                # for now ignoring values imported by *
+                return []
+            else:
+                return [array_node]
 
     def __repr__(self):
         return '<%s of %s>' % (self.__class__.__name__, self.atom)
@@ -124,31 +194,115 @@ class DictLiteralValue(_DictMixin, SequenceLiteralValue, _DictKeyMixin):
         self._defining_context = defining_context
         self.atom = atom
 
+    @memoize_method
+    def _get_key_index(self):
+        """
+        Returns a dict of constant keys (strings, numbers, ``True``, ...) to
+        the position and the value node of their entry, and a list of the
+        ``(position, key, value)`` entries whose keys need to be inferred.
+        Like in Python, the last entry with a key wins.
+        """
+        constant_keys = {}
+        other_entries = []
+        for position, (key_node, value_node) in enumerate(self.get_tree_entries()):
+            key = _get_constant_key(key_node)
+            if key is _NO_CONSTANT_KEY:
+                other_entries.append((position, key_node, value_node))
+            else:
+                constant_keys[key] = position, value_node
+        return constant_keys, other_entries
+
     def py__simple_getitem__(self, index):
         """Here the index is an int/str. Raises IndexError/KeyError."""
-        for key, value in self.exact_key_items():
-            if key == index:
-                return value
-        raise KeyError(f"Key '{index}' not found")
+        constant_keys, other_entries = self._get_key_index()
+        try:
+            constant_position, constant_value = constant_keys[index]
+        except (KeyError, TypeError):
+            constant_position, constant_value = -1, None
+
+        # Entries after the constant one might have the same key.
+        later_entries = [entry for entry in other_entries if entry[0] > constant_position]
+        if later_entries:
+            compiled_value_index = compiled.create_simple_object(self.inference_state, index)
+            for position, key, value in reversed(later_entries):
+                for k in self._defining_context.infer_node(key):
+                    for key_v in k.execute_operation(compiled_value_index, '=='):
+                        if key_v.get_safe_value():
+                            return self._defining_context.infer_node(value)
+
+        if constant_value is not None:
+            return self._defining_context.infer_node(constant_value)
+        raise SimpleGetItemNotFound('No key found in dictionary %s.' % self)
 
     def py__iter__(self, contextualized_node=None):
         """
         While values returns the possible values for any array field, this
         function returns the value for a certain index.
         """
-        for key, _ in self.exact_key_items():
-            yield LazyKnownValue(key)
+        for key, _ in self.get_tree_entries():
+            yield LazyTreeValue(self._defining_context, key)
+
+    def merge_types_of_iterate(self, contextualized_node=None, is_async=False):
+        if is_async:
+            return super().merge_types_of_iterate(contextualized_node, is_async)
+        keys = [key for key, _ in self.get_tree_entries()]
+        return ValueSet.from_sets(
+            self._defining_context.infer_node(key) for key in _sample_entries(keys)
+        )
 
     def exact_key_items(self):
         """
         Returns a generator of tuples like dict.items(), where the key is
         resolved (as a string) and the values are still lazy values.
         """
-        for key_node, value_node in zip(self.atom.children[1:-1:2], self.atom.children[2:-1:2]):
-            key = self._defining_context.infer_node(key_node)
-            value = LazyTreeValue(self._defining_context, value_node)
-            for key_value in key.infer():
-                yield key_value.get_safe_value(default=''), value
+        for key_node, value in self.get_tree_entries():
+            for key in self._defining_context.infer_node(key_node):
+                if is_string(key):
+                    yield key.get_safe_value(), LazyTreeValue(self._defining_context, value)
+
+
+def _sample_entries(nodes):
+    """
+    Returns at most :data:`jedi.settings.literal_iteration_sample_size` evenly
+    spread nodes, always including the first and the last one. Leaves with the
+    same code infer to the same values, so duplicates are left out before
+    anything is inferred. Only use this where the order of the entries
+    doesn't matter.
+    """
+    sample_size = settings.literal_iteration_sample_size
+    if sample_size is None or len(nodes) <= sample_size:
+        return nodes
+    step = (len(nodes) - 1) / max(sample_size - 1, 1)
+    sampled = []
+    seen_leaves = set()
+    for i in range(sample_size):
+        node = nodes[round(i * step)]
+        if node.type in ('number', 'string', 'keyword'):
+            key = node.type, node.value
+            if key in seen_leaves:
+                continue
+            seen_leaves.add(key)
+        sampled.append(node)
+    return sampled
+
+
+_NO_CONSTANT_KEY = object()
+_CONSTANT_KEYWORDS = {'True': True, 'False': False, 'None': None}
+
+
+def _get_constant_key(node):
+    """
+    Returns the value of a dict key that can be known without inference or
+    ``_NO_CONSTANT_KEY``.
+    """
+    if node.type == 'keyword':
+        return _CONSTANT_KEYWORDS.get(node.value, _NO_CONSTANT_KEY)
+    if node.type in ('string', 'number'):
+        try:
+            return literal_eval(node.value)
+        except (ValueError, SyntaxError, MemoryError):
+            pass
+    return _NO_CONSTANT_KEY
 
 class _FakeSequence(Sequence):
 
@@ -213,17 +367,17 @@ class Slice(LazyValueWrapper):
         Imitate CompiledValue.obj behavior and return a ``builtin.slice()``
         object.
         """
-        def get_int_or_none(lazy_value):
+        def get(lazy_value):
             if lazy_value is None:
                 return None
             value_set = lazy_value.infer()
             if len(value_set) != 1:
                 return None
-            value = list(value_set)[0]
-            return get_int_or_none(value.get_safe_value())
+            value, = value_set
+            return get_int_or_none(value)
 
-        start = get_int_or_none(self._start)
-        stop = get_int_or_none(self._stop)
-        step = get_int_or_none(self._step)
+        start = get(self._start)
+        stop = get(self._stop)
+        step = get(self._step)
 
         return slice(start, stop, step)
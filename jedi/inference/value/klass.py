@@ -41,7 +41,7 @@ from jedi.parser_utils import get_cached_parent_scope, expr_is_dotted, function_
 from jedi.inference.cache import inference_state_method_cache, CachedMetaClass, inference_state_method_generator_cache
 from jedi.inference import compiled
 from jedi.inference.lazy_value import LazyKnownValues, LazyTreeValue
-from jedi.inference.filters import ParserTreeFilter
+from jedi.inference.filters import ParserTreeFilter, _get_definition_index
 from jedi.inference.names import TreeNameDefinition, ValueName
 from jedi.inference.arguments import unpack_arglist, ValuesArguments
 from jedi.inference.base_value import ValueSet, iterator_to_value_set, NO_VALUES
@@ -64,8 +64,212 @@ class ClassFilter(ParserTreeFilter):
         self._class_value = class_value
         self._is_instance = is_instance
 
+    def _convert_names(self, names):
+        return [ClassName(class_value=self._class_value, tree_name=name, name_context=self._node_context, apply_decorators=not self._is_instance) for name in names]
+
+    def _equals_origin_scope(self):
+        node = self._origin_scope
+        while node is not None:
+            if node == self._parser_scope or node == self.parent_context:
+                return True
+            node = get_cached_parent_scope(self._parso_cache_node, node)
+        return False
+
+    def _access_possible(self, name):
+        # Filter for name mangling of private variables like __foo
+        return not name.value.startswith('__') or name.value.endswith('__') or self._equals_origin_scope()
+
+    def _filter(self, names):
+        names = super()._filter(names)
+        return [name for name in names if self._access_possible(name)]
+
+class _MergedClassFilter(ClassFilter):
+    """
+    The class filters of consecutive (non-compiled) classes of an MRO as one
+    filter. Like separate filters, ``get`` returns the names of the first
+    class that defines a name. Classes that don't define it are skipped
+    without creating a filter, see :meth:`ClassMixin.get_defining_contexts`.
+    """
+
+    def __init__(self, class_value, node_contexts, origin_scope=None, is_instance=False):
+        super().__init__(
+            class_value,
+            node_context=node_contexts[0],
+            origin_scope=origin_scope,
+            is_instance=is_instance,
+        )
+        self._node_contexts = node_contexts
+
+    def _get_class_filter(self, node_context):
+        return ClassFilter(
+            self._class_value,
+            node_context=node_context,
+            origin_scope=self._origin_scope,
+            is_instance=self._is_instance,
+        )
+
+    def get(self, name):
+        for node_context in self._class_value.get_defining_contexts(self._node_contexts, name):
+            names = self._get_class_filter(node_context).get(name)
+            if names:
+                return names
+        return []
+
+    def values(self):
+        return [
+            name
+            for node_context in self._node_contexts
+            for name in self._get_class_filter(node_context).values()
+        ]
+
+    def __repr__(self):
+        return '<%s: %s>' % (self.__class__.__name__, self._node_contexts)
+
 class ClassMixin:
-    pass
+    __slots__ = ()
+
+    def is_class(self):
+        return True
+
+    def is_class_mixin(self):
+        return True
+
+    @inference_state_method_generator_cache()
+    def py__mro__(self):
+        mro = [self]
+        yield self
+        # TODO Do a proper mro resolution. Currently we are just listing
+        # classes. However, it's a complicated algorithm.
+        for lazy_cls in self.py__bases__():
+            # TODO there's multiple different mro paths possible if this yields
+            # multiple possibilities. Could be changed to be more correct.
+            for cls in lazy_cls.infer():
+                try:
+                    mro_method = cls.py__mro__
+                except AttributeError:
+                    debug.warning('Super class of %s is not a class: %s', self, cls)
+                else:
+                    for cls_new in mro_method():
+                        if cls_new not in mro:
+                            mro.append(cls_new)
+                            yield cls_new
+
+    @inference_state_method_cache(default=())
+    def _get_mro_groups(self):
+        """
+        Returns the MRO as a tuple of groups. Consecutive tree classes are
+        grouped as a tuple of their contexts, compiled classes are returned
+        as they are.
+        """
+        groups = []
+        node_contexts = []
+        for cls in self.py__mro__():
+            if cls.is_compiled():
+                if node_contexts:
+                    groups.append(tuple(node_contexts))
+                    node_contexts = []
+                groups.append(cls)
+            else:
+                node_contexts.append(cls.as_context())
+        if node_contexts:
+            groups.append(tuple(node_contexts))
+        return tuple(groups)
+
+    @inference_state_method_cache(default=())
+    def get_defining_contexts(self, node_contexts, name):
+        """
+        Returns the class contexts of ``node_contexts`` that define ``name``
+        directly in their class body. The definitions come from the index of
+        the modules the classes are defined in, so no class body is searched.
+        """
+        return tuple(
+            node_context
+            for node_context in node_contexts
+            if node_context.tree_node in _get_definition_index(
+                node_context.tree_node.get_root_node().get_used_names(),
+                name,
+            )
+        )
+
+    def get_filters(self, origin_scope=None, is_instance=False,
+                    include_metaclasses=True, include_type_when_class=True):
+        if include_metaclasses:
+            metaclasses = self.get_metaclasses()
+            if metaclasses:
+                yield from self.get_metaclass_filters(metaclasses, is_instance)
+
+        for group in self._get_mro_groups():
+            if isinstance(group, tuple):
+                yield _MergedClassFilter(
+                    self, group,
+                    origin_scope=origin_scope,
+                    is_instance=is_instance
+                )
+            else:
+                yield from group.get_filters(is_instance=is_instance)
+        if not is_instance and include_type_when_class:
+            from jedi.inference.compiled import builtin_from_name
+            type_ = builtin_from_name(self.inference_state, 'type')
+            assert isinstance(type_, ClassValue)
+            if type_ != self:
+                # We are not using execute_with_values here, because the
+                # plugin function for type would get executed instead of an
+                # instance creation.
+                args = ValuesArguments([])
+                for instance in type_.py__call__(args):
+                    instance_filters = instance.get_filters()
+                    # Filter out self filters
+                    next(instance_filters, None)
+                    next(instance_filters, None)
+                    x = next(instance_filters, None)
+                    assert x is not None
+                    yield x
+
+    def py__getitem__(self, index_value_set, contextualized_node):
+        from jedi.inference.gradual.base import GenericClass
+        if not index_value_set:
+            debug.warning('Class indexes inferred to nothing. Returning class instead')
+            return ValueSet([self])
+        return ValueSet(
+            GenericClass.create_cached(
+                self,
+                LazyGenericManager(
+                    context_of_index=contextualized_node.context,
+                    index_value=index_value,
+                )
+            )
+            for index_value in index_value_set
+        )
+
+    def with_generics(self, generics_tuple):
+        from jedi.inference.gradual.base import GenericClass
+        return GenericClass.create_cached(
+            self,
+            TupleGenericManager(generics_tuple)
+        )
 
 class ClassValue(ClassMixin, FunctionAndClassBase, metaclass=CachedMetaClass):
-    api_type = 'class'
\ No newline at end of file
+    __slots__ = ()
+    api_type = 'class'
+
+    def _get_bases_arguments(self):
+        arglist = self.tree_node.get_super_arglist()
+        if arglist:
+            from jedi.inference import arguments
+            return arguments.TreeArguments(self.inference_state, self.parent_context, arglist)
+        return None
+
+    @inference_state_method_cache(default=())
+    def py__bases__(self):
+        args = self._get_bases_arguments()
+        if args is not None:
+            lst = [value for key, value in args.unpack() if key is None]
+            if lst:
+                return lst
+
+        if self.py__name__() == 'object' \
+                and self.parent_context.is_builtins_module():
+            return []
+        return [LazyKnownValues(
+            self.inference_state.builtins_module.py__getattribute__('object')
+        )]
@@ -115,20 +115,102 @@ def get_following_comment_same_line(node):
         pass
     return None
 
+def _get_parent_scope_cache(func):
+    cache = WeakKeyDictionary()
+
+    def wrapper(parso_cache_node, node, include_flows=False):
+        if parso_cache_node is None:
+            return func(node, include_flows)
+
+        try:
+            for_module = cache[parso_cache_node]
+        except KeyError:
+            for_module = cache[parso_cache_node] = {}
+
+        try:
+            return for_module[node]
+        except KeyError:
+            result = for_module[node] = func(node, include_flows)
+            return result
+    return wrapper
+
+def used_names_cache(func):
+    """
+    Caches ``func(used_names, *args)`` per module. The results are stored
+    with the used names mapping of a module, which parso recreates whenever
+    the module changes, so an outdated result is never returned and gets
+    garbage collected together with the old tree.
+    """
+    cache = WeakKeyDictionary()
+
+    def wrapper(used_names, *args):
+        try:
+            for_module = cache[used_names]
+        except KeyError:
+            for_module = cache[used_names] = {}
+
+        try:
+            return for_module[args]
+        except KeyError:
+            result = for_module[args] = func(used_names, *args)
+            return result
+    return wrapper
+
+
+def is_scope(node):
+    t = node.type
+    if t == 'comp_for':
+        # Starting with Python 3.8, async is outside of the statement.
+        return node.children[1].type != 'sync_comp_for'
+
+    return t in ('file_input', 'classdef', 'funcdef', 'lambdef', 'sync_comp_for')
+
 def get_parent_scope(node, include_flows=False):
     """
     Returns the underlying scope.
     """
     scope = node.parent
-    while scope is not None:
-        if scope.type in ('classdef', 'funcdef', 'file_input'):
-            return scope
-        if include_flows and scope.type in _FLOW_KEYWORDS:
+    if scope is None:
+        return None  # It's a module already.
+
+    while True:
+        if is_scope(scope):
+            if scope.type in ('classdef', 'funcdef', 'lambdef'):
+                index = scope.children.index(':')
+                if scope.children[index].start_pos >= node.start_pos:
+                    if node.parent.type == 'param' and node.parent.name == node:
+                        pass
+                    elif node.parent.type == 'tfpdef' and node.parent.children[0] == node:
+                        pass
+                    else:
+                        scope = scope.parent
+                        continue
             return scope
+        elif include_flows and isinstance(scope, tree.Flow):
+            # The cursor might be on `if foo`, so the parent scope will not be
+            # the if, but the parent of the if.
+            if not (scope.type == 'if_stmt'
+                    and any(n.start_pos <= node.start_pos < n.end_pos
+                            for n in scope.get_test_nodes())):
+                return scope
+
         scope = scope.parent
-    return None
 get_cached_parent_scope = _get_parent_scope_cache(get_parent_scope)
 
+def get_flow_branch_keyword(flow_node, node):
+    start_pos = node.start_pos
+    if not (flow_node.start_pos < start_pos <= flow_node.end_pos):
+        raise ValueError('The node is not part of the flow.')
+
+    keyword = None
+    for i, child in enumerate(flow_node.children):
+        if start_pos < child.start_pos:
+            return keyword
+        first_leaf = child.get_first_leaf()
+        if first_leaf in _FLOW_KEYWORDS:
+            keyword = first_leaf
+    return None
+
 def get_cached_code_lines(grammar, path):
     """
     Basically access the cached code lines in parso. This is not the nicest way
@@ -1,20 +1,35 @@
 from functools import wraps
 
+from jedi import profiler
+
 
 class _PluginManager:
     def __init__(self):
         self._registered_plugins = []
         self._cached_base_callbacks = {}
+        self._dispatch_key_getters = {}
         self._built_functions = {}
+        # Plugin callbacks are only wrapped in spans while profiling.
+        profiler.on_toggle(lambda enabled: self._build_functions())
 
     def register(self, *plugins):
         """
         Makes it possible to register your plugin.
+
+        A plugin may define a ``dispatch_keys`` dict of hook name to a set of
+        keys (see :meth:`decorate`). The plugin is then only called for those
+        keys, e.g. ``{'import_module': {'flask'}}``. Hooks without an entry
+        are always called.
         """
         self._registered_plugins.extend(plugins)
         self._build_functions()
 
-    def decorate(self, name=None):
+    def decorate(self, name=None, get_dispatch_key=None):
+        """
+        :param get_dispatch_key: Optional callable that receives the arguments
+            of the hook and returns a key, which decides which plugins are
+            called.
+        """
         def decorator(callback):
             @wraps(callback)
             def wrapper(*args, **kwargs):
@@ -26,22 +41,83 @@ class _PluginManager:
             built_functions = self._built_functions
             built_functions[public_name] = callback
             self._cached_base_callbacks[public_name] = callback
+            self._dispatch_key_getters[public_name] = get_dispatch_key
 
             return wrapper
 
         return decorator
 
+    def get_statistics(self):
+        """
+        Returns the number of calls and the total and self time of every
+        plugin hook and of the hooks' base implementations, as recorded by
+        :mod:`jedi.profiler` while it was enabled.
+        """
+        return {
+            name: entry
+            for (category, name), entry in profiler.get_statistics().items()
+            if category == 'plugin'
+        }
+
+    def _build_chain(self, name, plugins):
+        callback = self._cached_base_callbacks[name]
+        if profiler.enabled:
+            callback = profiler.instrument(
+                callback,
+                'plugin',
+                name='%s.%s' % (getattr(callback, '__module__', 'jedi'), name),
+            )
+        for plugin in reversed(plugins):
+            # Need to reverse so the first plugin is run first.
+            try:
+                func = getattr(plugin, name)
+            except AttributeError:
+                pass
+            else:
+                callback = func(callback)
+                if profiler.enabled:
+                    callback = profiler.instrument(
+                        callback,
+                        'plugin',
+                        name='%s.%s' % (plugin.__name__, name),
+                    )
+        return callback
+
     def _build_functions(self):
-        for name, callback in self._cached_base_callbacks.items():
-            for plugin in reversed(self._registered_plugins):
-                # Need to reverse so the first plugin is run first.
-                try:
-                    func = getattr(plugin, name)
-                except AttributeError:
-                    pass
-                else:
-                    callback = func(callback)
-            self._built_functions[name] = callback
+        for name in self._cached_base_callbacks:
+            get_dispatch_key = self._dispatch_key_getters[name]
+            plugin_keys = [
+                getattr(plugin, 'dispatch_keys', {}).get(name)
+                for plugin in self._registered_plugins
+            ]
+            if get_dispatch_key is None or all(keys is None for keys in plugin_keys):
+                self._built_functions[name] = self._build_chain(name, self._registered_plugins)
+                continue
+
+            # Build one chain per key with only the plugins that care about
+            # it, calls with other keys skip those plugins completely.
+            def get_plugins(key):
+                return [
+                    plugin
+                    for plugin, keys in zip(self._registered_plugins, plugin_keys)
+                    if keys is None or key in keys
+                ]
+
+            all_keys = set().union(*(keys for keys in plugin_keys if keys is not None))
+            chains = {key: self._build_chain(name, get_plugins(key)) for key in all_keys}
+            default_chain = self._build_chain(name, get_plugins(_NO_KEY))
+            self._built_functions[name] = _create_dispatcher(
+                get_dispatch_key, chains, default_chain)
+
+
+_NO_KEY = object()
+
+
+def _create_dispatcher(get_dispatch_key, chains, default_chain):
+    def dispatch(*args, **kwargs):
+        chain = chains.get(get_dispatch_key(*args, **kwargs), default_chain)
+        return chain(*args, **kwargs)
+    return dispatch
 
 
 plugin_manager = _PluginManager()
@@ -1,3 +1,6 @@
+dispatch_keys = {'import_module': {'flask'}}
+
+
 def import_module(callback):
     """
     Handle "magic" Flask extension imports:
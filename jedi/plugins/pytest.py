@@ -1,14 +1,121 @@
+import os
 import sys
-from typing import List
+from collections import namedtuple
+from typing import Dict, List, Tuple
 from pathlib import Path
 from parso.tree import search_ancestor
+from jedi import settings
 from jedi.inference.cache import inference_state_method_cache
 from jedi.inference.imports import goto_import, load_module_from_path
 from jedi.inference.filters import ParserTreeFilter
 from jedi.inference.base_value import NO_VALUES, ValueSet
 from jedi.inference.helpers import infer_call_of_leaf
+from jedi.inference.utils import to_list
 _PYTEST_FIXTURE_MODULES = [('_pytest', 'monkeypatch'), ('_pytest', 'capture'), ('_pytest', 'logging'), ('_pytest', 'tmpdir'), ('_pytest', 'pytester')]
 
+# The names that might be fixtures in a file: functions with a decorator that
+# looks like a fixture and names imported from other modules. Only files that
+# contain a name (or use ``pytest_plugins``) need to be inferred.
+_FixtureFileIndex = namedtuple('_FixtureFileIndex', 'fixture_names has_plugins')
+_fixture_file_index_cache: Dict[str, Tuple[Tuple[int, int], _FixtureFileIndex]] = {}
+_plugin_modules_cache: Dict[Tuple[str, Tuple[str, ...]], List[List[str]]] = {}
+
+dispatch_keys = {'execute': {'fixture'}}
+
+
+def execute(callback):
+    def wrapper(value, arguments):
+        # This might not be necessary anymore in pytest 4/5, definitely needed
+        # for pytest 3.
+        if value.py__name__() == 'fixture' \
+                and value.parent_context.py__name__() == '_pytest.fixtures':
+            return NO_VALUES
+
+        return callback(value, arguments)
+    return wrapper
+
+
+def infer_anonymous_param(func):
+    def get_returns(value):
+        if value.tree_node.annotation is not None:
+            result = value.execute_with_values()
+            if any(v.name.get_qualified_names(include_module_names=True)
+                   == ('typing', 'Generator')
+                   for v in value.py__class__()):
+                return ValueSet.from_sets(
+                    v.py__getattribute__('__next__').execute_annotation()
+                    for v in result
+                )
+            return result
+
+        function_context = value.as_context()
+        if function_context.is_generator():
+            return function_context.merge_yield_values()
+        else:
+            return function_context.get_return_values()
+
+    def wrapper(param_name):
+        # parameters with an annotation do not need special handling
+        if param_name.annotation_node:
+            return func(param_name)
+        is_pytest_param, param_name_is_function_name = \
+            _is_a_pytest_param_and_inherited(param_name)
+        if is_pytest_param:
+            module = param_name.get_root_context()
+            fixtures = _goto_pytest_fixture(
+                module,
+                param_name.string_name,
+                # This skips the current module, because we are basically
+                # inheriting a fixture from somewhere else.
+                skip_own_module=param_name_is_function_name,
+            )
+            if fixtures:
+                return ValueSet.from_sets(
+                    get_returns(value)
+                    for fixture in fixtures
+                    for value in fixture.infer()
+                )
+        return func(param_name)
+    return wrapper
+
+
+def goto_anonymous_param(func):
+    def wrapper(param_name):
+        is_pytest_param, param_name_is_function_name = \
+            _is_a_pytest_param_and_inherited(param_name)
+        if is_pytest_param:
+            names = _goto_pytest_fixture(
+                param_name.get_root_context(),
+                param_name.string_name,
+                skip_own_module=param_name_is_function_name,
+            )
+            if names:
+                return names
+        return func(param_name)
+    return wrapper
+
+
+def complete_param_names(func):
+    def wrapper(context, func_name, decorator_nodes):
+        module_context = context.get_root_context()
+        if _is_pytest_func(func_name, decorator_nodes):
+            names = []
+            for module_context in _iter_pytest_modules(module_context):
+                names += FixtureFilter(module_context).values()
+            if names:
+                return names
+        return func(context, func_name, decorator_nodes)
+    return wrapper
+
+
+def _goto_pytest_fixture(module_context, name, skip_own_module):
+    for module_context in _iter_pytest_modules(
+            module_context, skip_own_module=skip_own_module, fixture_name=name):
+        names = FixtureFilter(module_context).get(name)
+        if names:
+            return names
+
+
 def _is_a_pytest_param_and_inherited(param_name):
     """
     Pytest params are either in a `test_*` function or have a pytest fixture
@@ -16,23 +123,18 @@ def _is_a_pytest_param_and_inherited(param_name):
 
     This is a heuristic and will work in most cases.
     """
-    def is_pytest_param(node):
-        if node.type == 'funcdef':
-            # Check if it's a test function
-            if node.name.value.startswith('test_'):
-                return True
-            # Check for pytest.fixture decorator
-            for decorator in node.get_decorators():
-                if decorator.children[1].value == 'pytest' and decorator.children[3].value == 'fixture':
-                    return True
-        return False
+    funcdef = search_ancestor(param_name.tree_name, 'funcdef')
+    if funcdef is None:  # A lambda
+        return False, False
+    decorators = funcdef.get_decorators()
+    return _is_pytest_func(funcdef.name.value, decorators), \
+        funcdef.name.value == param_name.string_name
+
+
+def _is_pytest_func(func_name, decorator_nodes):
+    return func_name.startswith('test') \
+        or any('fixture' in n.get_code() for n in decorator_nodes)
 
-    parent = param_name.parent
-    while parent:
-        if is_pytest_param(parent):
-            return True
-        parent = parent.parent
-    return False
 
 def _find_pytest_plugin_modules() -> List[List[str]]:
     """
@@ -40,22 +142,201 @@ def _find_pytest_plugin_modules() -> List[List[str]]:
 
     See https://docs.pytest.org/en/stable/how-to/writing_plugins.html#setuptools-entry-points
     """
+    if sys.version_info >= (3, 8):
+        from importlib.metadata import entry_points
+
+        if sys.version_info >= (3, 10):
+            pytest_entry_points = entry_points(group="pytest11")
+        else:
+            pytest_entry_points = entry_points().get("pytest11", ())
+
+        if sys.version_info >= (3, 9):
+            return [ep.module.split(".") for ep in pytest_entry_points]
+        else:
+            # Python 3.8 doesn't have `EntryPoint.module`. Implement equivalent
+            # to what Python 3.9 does (with additional None check to placate `mypy`)
+            matches = [
+                ep.pattern.match(ep.value)
+                for ep in pytest_entry_points
+            ]
+            return [x.group('module').split(".") for x in matches if x]
+
+    else:
+        from pkg_resources import iter_entry_points
+        return [ep.module_name.split(".") for ep in iter_entry_points(group="pytest11")]
+
+
+def _get_pytest_plugin_modules(inference_state):
+    """
+    Scanning the entry points is slow, so it's only done once per environment
+    and sys path.
+    """
+    key = inference_state.environment.executable, tuple(inference_state.get_sys_path())
     try:
-        import pkg_resources
-    except ImportError:
-        return []
-
-    plugin_modules = []
-    for entry_point in pkg_resources.iter_entry_points('pytest11'):
-        try:
-            module_name = entry_point.module_name
-            if module_name:
-                plugin_modules.append(module_name.split('.'))
-        except Exception:
-            # Skip any entry points that cause errors
-            continue
-
-    return plugin_modules
+        return _plugin_modules_cache[key]
+    except KeyError:
+        result = _plugin_modules_cache[key] = _find_pytest_plugin_modules()
+        return result
+
+
+def _get_fixture_file_index(inference_state, path):
+    """
+    Returns the :class:`_FixtureFileIndex` of a file or None if it doesn't
+    exist. The index is cached until the file is modified.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    stamp = stat.st_mtime_ns, stat.st_size
+    try:
+        cached_stamp, index = _fixture_file_index_cache[path]
+    except KeyError:
+        pass
+    else:
+        if cached_stamp == stamp:
+            return index
+
+    # Uses the same cache as loading the module, so the file is not parsed
+    # twice.
+    module_node = inference_state.parse(
+        path=path,
+        cache=True,
+        cache_path=settings.cache_directory,
+    )
+    fixture_names = set()
+    for funcdef in module_node.iter_funcdefs():
+        # The same heuristic as _is_pytest_func, without inferring anything.
+        # It also finds aliased decorators like ``@pytest_fixture``.
+        if any('fixture' in d.get_code() for d in funcdef.get_decorators()):
+            fixture_names.add(funcdef.name.value)
+    for import_ in module_node.iter_imports():
+        if import_.type == 'import_from':
+            fixture_names.update(n.value for n in import_.get_defined_names())
+    index = _FixtureFileIndex(
+        frozenset(fixture_names),
+        'pytest_plugins' in module_node.get_used_names(),
+    )
+    _fixture_file_index_cache[path] = stamp, index
+    return index
+
+
+def _might_define_fixture(inference_state, path, fixture_name):
+    if fixture_name is None or path is None:
+        return True
+    index = _get_fixture_file_index(inference_state, str(path))
+    return index is None or index.has_plugins or fixture_name in index.fixture_names
+
+
+@inference_state_method_cache()
+@to_list
+def _iter_pytest_modules(module_context, skip_own_module=False, fixture_name=None):
+    """
+    Returns the modules fixtures are searched in. If ``fixture_name`` is
+    given, conftest and plugin modules that cannot define it are left out.
+    """
+    inference_state = module_context.inference_state
+    if not skip_own_module:
+        yield module_context
+
+    file_io = module_context.get_value().file_io
+    if file_io is not None:
+        folder = file_io.get_parent_folder()
+        sys_path = inference_state.get_sys_path()
+
+        # prevent an infinite loop when reaching the root of the current drive
+        last_folder = None
+
+        while any(folder.path.startswith(p) for p in sys_path):
+            file_io = folder.get_file_io('conftest.py')
+            if Path(file_io.path) != module_context.py__file__() \
+                    and _might_define_fixture(inference_state, file_io.path, fixture_name):
+                try:
+                    m = load_module_from_path(inference_state, file_io)
+                    conftest_module = m.as_context()
+                    yield conftest_module
+
+                    plugins_list = m.tree_node.get_used_names().get("pytest_plugins")
+                    if plugins_list:
+                        name = conftest_module.create_name(plugins_list[0])
+                        yield from _load_pytest_plugins(module_context, name)
+                except FileNotFoundError:
+                    pass
+            folder = folder.get_parent_folder()
+
+            # prevent an infinite loop if the same parent folder is returned twice
+            if last_folder is not None and folder.path == last_folder.path:
+                break
+            last_folder = folder  # keep track of the last found parent name
+
+    for names in _PYTEST_FIXTURE_MODULES + _get_pytest_plugin_modules(inference_state):
+        for module_value in inference_state.import_module(names):
+            if _might_define_fixture(inference_state, module_value.py__file__(), fixture_name):
+                yield module_value.as_context()
+
+
+def _load_pytest_plugins(module_context, name):
+    from jedi.inference.helpers import get_str_or_none
+
+    for inferred in name.infer():
+        for seq_value in inferred.py__iter__():
+            for value in seq_value.infer():
+                fq_name = get_str_or_none(value)
+                if fq_name:
+                    names = fq_name.split(".")
+                    for module_value in module_context.inference_state.import_module(names):
+                        yield module_value.as_context()
+
 
 class FixtureFilter(ParserTreeFilter):
-    pass
+    def _filter(self, names):
+        for name in super()._filter(names):
+            # look for fixture definitions of imported names
+            if name.parent.type == "import_from":
+                imported_names = goto_import(self.parent_context, name)
+                if any(
+                    self._is_fixture(iname.parent_context, iname.tree_name)
+                    for iname in imported_names
+                    # discard imports of whole modules, that have no tree_name
+                    if iname.tree_name
+                ):
+                    yield name
+
+            elif self._is_fixture(self.parent_context, name):
+                yield name
+
+    def _is_fixture(self, context, name):
+        funcdef = name.parent
+        # Class fixtures are not supported
+        if funcdef.type != "funcdef":
+            return False
+        decorated = funcdef.parent
+        if decorated.type != "decorated":
+            return False
+        decorators = decorated.children[0]
+        if decorators.type == "decorators":
+            decorators = decorators.children
+        else:
+            decorators = [decorators]
+        for decorator in decorators:
+            dotted_name = decorator.children[1]
+            # A heavily simplified version of
+            if "fixture" in dotted_name.get_code():
+                if dotted_name.type == "atom_expr":
+                    # Since Python3.9 a decorator does not have dotted names
+                    # anymore.
+                    last_trailer = dotted_name.children[-1]
+                    last_leaf = last_trailer.get_last_leaf()
+                    if last_leaf == ')':
+                        values = infer_call_of_leaf(
+                            context, last_leaf, cut_own_trailer=True
+                        )
+                    else:
+                        values = context.infer_node(dotted_name)
+                else:
+                    values = context.infer_node(dotted_name)
+                for value in values:
+                    if value.name.get_qualified_names(include_module_names=True) \
+                            == ('_pytest', 'fixtures', 'fixture'):
+                        return True
+        return False
@@ -13,6 +13,7 @@ import parso
 import os
 from inspect import Parameter
 from jedi import debug
+from jedi.cache import LRUCache
 from jedi.inference.utils import safe_property
 from jedi.inference.helpers import get_str_or_none
 from jedi.inference.arguments import iterate_argument_clinic, ParamIssue, repack_with_argument_clinic, AbstractArguments, TreeArgumentsWrapper
@@ -30,6 +31,41 @@ from jedi.inference.filters import AttributeOverwrite, publish_method, ParserTre
 from jedi.inference.signature import AbstractSignature, SignatureWrapper
 _NAMEDTUPLE_CLASS_TEMPLATE = "_property = property\n_tuple = tuple\nfrom operator import itemgetter as _itemgetter\nfrom collections import OrderedDict\n\nclass {typename}(tuple):\n    __slots__ = ()\n\n    _fields = {field_names!r}\n\n    def __new__(_cls, {arg_list}):\n        'Create new instance of {typename}({arg_list})'\n        return _tuple.__new__(_cls, ({arg_list}))\n\n    @classmethod\n    def _make(cls, iterable, new=tuple.__new__, len=len):\n        'Make a new {typename} object from a sequence or iterable'\n        result = new(cls, iterable)\n        if len(result) != {num_fields:d}:\n            raise TypeError('Expected {num_fields:d} arguments, got %d' % len(result))\n        return result\n\n    def _replace(_self, **kwds):\n        'Return a new {typename} object replacing specified fields with new values'\n        result = _self._make(map(kwds.pop, {field_names!r}, _self))\n        if kwds:\n            raise ValueError('Got unexpected field names: %r' % list(kwds))\n        return result\n\n    def __repr__(self):\n        'Return a nicely formatted representation string'\n        return self.__class__.__name__ + '({repr_fmt})' % self\n\n    def _asdict(self):\n        'Return a new OrderedDict which maps field names to their values.'\n        return OrderedDict(zip(self._fields, self))\n\n    def __getnewargs__(self):\n        'Return self as a plain tuple.  Used by copy and pickle.'\n        return tuple(self)\n\n    # These methods were added by Jedi.\n    # __new__ doesn't really work with Jedi. So adding this to nametuples seems\n    # like the easiest way.\n    def __init__(self, {arg_list}):\n        'A helper function for namedtuple.'\n        self.__iterable = ({arg_list})\n\n    def __iter__(self):\n        for i in self.__iterable:\n            yield i\n\n    def __getitem__(self, y):\n        return self.__iterable[y]\n\n{field_defs}\n"
 _NAMEDTUPLE_FIELD_TEMPLATE = "    {name} = _property(_itemgetter({index:d}), doc='Alias for field number {index:d}')\n"
+_namedtuple_module_cache = LRUCache(1000)
+
+def execute(callback):
+    def wrapper(value, arguments):
+        def call():
+            return callback(value, arguments=arguments)
+
+        try:
+            obj_name = value.name.string_name
+        except AttributeError:
+            pass
+        else:
+            p = value.parent_context
+            if p is not None and p.is_builtins_module():
+                module_name = 'builtins'
+            elif p is not None and p.is_module():
+                module_name = p.py__name__()
+            else:
+                return call()
+
+            if value.is_bound_method() or value.is_instance():
+                # value can be an instance for example if it is a partial
+                # object.
+                return call()
+
+            # for now we just support builtin functions.
+            try:
+                func = _implemented[module_name][obj_name]
+            except KeyError:
+                pass
+            else:
+                return func(value, arguments=arguments, callback=call)
+        return call()
+
+    return wrapper
 
 def argument_clinic(clinic_string, want_value=False, want_context=False, want_arguments=False, want_inference_state=False, want_callback=False):
     """
@@ -119,6 +155,42 @@ class PropertyObject(AttributeOverwrite, ValueWrapper):
         super().__init__(property_obj)
         self._function = function
 
+def _follow_param(inference_state, arguments, index):
+    try:
+        key, lazy_value = list(arguments.unpack())[index]
+    except IndexError:
+        return NO_VALUES
+    else:
+        return lazy_value.infer()
+
+def _get_namedtuple_module(typename, fields):
+    """
+    Returns the parsed module and the code lines of a namedtuple class. They
+    only depend on the name and the fields, so they are shared between
+    inference states and only parsed once.
+    """
+    key = typename, fields
+    try:
+        return _namedtuple_module_cache.get(key)
+    except KeyError:
+        pass
+
+    code = _NAMEDTUPLE_CLASS_TEMPLATE.format(
+        typename=typename,
+        field_names=fields,
+        num_fields=len(fields),
+        arg_list=repr(fields).replace("'", "")[1:-1],
+        repr_fmt='',
+        field_defs='\n'.join(_NAMEDTUPLE_FIELD_TEMPLATE.format(index=index, name=name)
+                             for index, name in enumerate(fields))
+    )
+    # The grammar is not important for this code, using the default one
+    # makes the result independent of the environment.
+    module = parso.parse(code)
+    result = module, parso.split_lines(code, keepends=True)
+    _namedtuple_module_cache.set(key, result)
+    return result
+
 def collections_namedtuple(value, arguments, callback):
     """
     Implementation of the namedtuple function.
@@ -126,36 +198,42 @@ def collections_namedtuple(value, arguments, callback):
     This has to be done by processing the namedtuple class template and
     inferring the result.
     """
-    from jedi.inference.value import FakeTypedDict
-
-    def execute(params):
-        try:
-            typename, field_names = params
-            if not isinstance(typename, str):
-                return NO_VALUES
-            if isinstance(field_names, str):
-                field_names = field_names.replace(',', ' ').split()
-            elif isinstance(field_names, (list, tuple)):
-                field_names = [str(v) for v in field_names]
-            else:
-                return NO_VALUES
-            
-            class_template = _NAMEDTUPLE_CLASS_TEMPLATE.format(
-                typename=typename,
-                field_names=repr(tuple(field_names)),
-                num_fields=len(field_names),
-                arg_list=repr(tuple(field_names)).replace("'", "")[1:-1],
-                repr_fmt='(' + ', '.join(f'{name}=%r' for name in field_names) + ')',
-                field_defs='\n'.join(_NAMEDTUPLE_FIELD_TEMPLATE.format(index=index, name=name)
-                                     for index, name in enumerate(field_names))
-            )
-            module = value.inference_state.grammar.parse(class_template)
-            generated_class = next(module.iter_classdefs())
-            return ValueSet([value.inference_state.compiled_subprocess.get_or_create_instance(generated_class)])
-        except Exception:
-            return NO_VALUES
-
-    return execute(arguments.unpack())
+    inference_state = value.inference_state
+
+    # Process arguments
+    name = 'jedi_unknown_namedtuple'
+    for c in _follow_param(inference_state, arguments, 0):
+        x = get_str_or_none(c)
+        if x is not None:
+            name = x
+            break
+
+    # TODO here we only use one of the types, we should use all.
+    param_values = _follow_param(inference_state, arguments, 1)
+    if not param_values:
+        return NO_VALUES
+    _fields = list(param_values)[0]
+    string = get_str_or_none(_fields)
+    if string is not None:
+        fields = string.replace(',', ' ').split()
+    elif isinstance(_fields, iterable.Sequence):
+        fields = [
+            get_str_or_none(v)
+            for lazy_value in _fields.py__iter__()
+            for v in lazy_value.infer()
+        ]
+        fields = [f for f in fields if f is not None]
+    else:
+        return NO_VALUES
+
+    module, code_lines = _get_namedtuple_module(name, tuple(fields))
+    generated_class = next(module.iter_classdefs())
+    parent_context = ModuleValue(
+        inference_state, module,
+        code_lines=code_lines,
+    ).as_context()
+
+    return ValueSet([ClassValue(inference_state, parent_context, generated_class)])
 
 class PartialObject(ValueWrapper):
 
@@ -221,6 +299,9 @@ class Wrapped(ValueWrapper, FunctionMixin):
         super().__init__(func)
         self._original_function = original_function
 _implemented = {'builtins': {'getattr': builtins_getattr, 'type': builtins_type, 'super': builtins_super, 'reversed': builtins_reversed, 'isinstance': builtins_isinstance, 'next': builtins_next, 'iter': builtins_iter, 'staticmethod': builtins_staticmethod, 'classmethod': builtins_classmethod, 'property': builtins_property}, 'copy': {'copy': _return_first_param, 'deepcopy': _return_first_param}, 'json': {'load': lambda value, arguments, callback: NO_VALUES, 'loads': lambda value, arguments, callback: NO_VALUES}, 'collections': {'namedtuple': collections_namedtuple}, 'functools': {'partial': functools_partial, 'partialmethod': functools_partialmethod, 'wraps': _functools_wraps}, '_weakref': {'proxy': _return_first_param}, 'random': {'choice': _random_choice}, 'operator': {'itemgetter': _operator_itemgetter}, 'abc': {'abstractmethod': _return_first_param}, 'typing': {'_alias': lambda value, arguments, callback: NO_VALUES, 'runtime_checkable': lambda value, arguments, callback: NO_VALUES}, 'dataclasses': {'dataclass': _dataclass}, 'attr': {'define': _dataclass, 'frozen': _dataclass}, 'attrs': {'define': _dataclass, 'frozen': _dataclass}, 'os.path': {'dirname': _create_string_input_function(os.path.dirname), 'abspath': _create_string_input_function(os.path.abspath), 'relpath': _create_string_input_function(os.path.relpath), 'join': _os_path_join}}
+# The execute hook only does something for the names in _implemented, values
+# with other names skip this plugin.
+dispatch_keys = {'execute': {name for functions in _implemented.values() for name in functions}}
 
 class EnumInstance(LazyValueWrapper):
 
@@ -0,0 +1,225 @@
+"""
+A profiler for Jedi's internals. Unlike :mod:`jedi.debug` it doesn't print
+anything, but records nested spans for API calls, inference, imports,
+parsing, plugin callbacks and subprocess round-trips. They can be aggregated
+with :func:`get_statistics` or written with :func:`export_chrome_trace` and
+opened in ``chrome://tracing`` or https://ui.perfetto.dev.
+
+Example usage::
+
+    from jedi import profiler
+    profiler.enable()
+    jedi.Script(code).complete()
+    profiler.disable()
+    with open('trace.json', 'w') as f:
+        profiler.export_chrome_trace(f)
+
+Functions decorated with :func:`profile` are left unchanged while the
+profiler is disabled. :func:`enable` replaces them with their instrumented
+versions and :func:`disable` puts the originals back, so disabled profiling
+costs nothing. At most ``max_events`` spans are kept, older ones are dropped.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+enabled = False
+_events = deque(maxlen=1000000)
+_toggle_callbacks = []
+_local = threading.local()
+_start_time = time.perf_counter()
+
+
+class _Span:
+    __slots__ = ('name', 'category', 'args', 'start', 'child_duration')
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.child_duration = 0.0
+
+    def __enter__(self):
+        try:
+            stack = _local.stack
+        except AttributeError:
+            stack = _local.stack = []
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        duration = time.perf_counter() - self.start
+        stack = _local.stack
+        stack.pop()
+        if stack:
+            stack[-1].child_duration += duration
+        _events.append((
+            self.category,
+            self.name,
+            self.start,
+            duration,
+            duration - self.child_duration,
+            threading.get_ident(),
+            self.args,
+        ))
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def enable(max_events=1000000):
+    """
+    Starts recording spans. Only the latest ``max_events`` spans are kept.
+    """
+    global _events
+    if max_events != _events.maxlen:
+        _events = deque(_events, maxlen=max_events)
+    _set_enabled(True)
+
+
+def disable():
+    _set_enabled(False)
+
+
+def _set_enabled(value):
+    global enabled
+    if enabled != value:
+        enabled = value
+        for callback in _toggle_callbacks:
+            callback(value)
+
+
+def on_toggle(callback):
+    """
+    Registers a callback that is called with the new state whenever the
+    profiler is enabled or disabled. Used to swap instrumented code in and
+    out.
+    """
+    _toggle_callbacks.append(callback)
+
+
+def reset():
+    """Forgets all recorded spans."""
+    global _start_time
+    _events.clear()
+    _start_time = time.perf_counter()
+
+
+def span(name, category='inference', **args):
+    """
+    A context manager that records a span if the profiler is enabled.
+    """
+    if not enabled:
+        return _NO_SPAN
+    return _Span(name, category, args or None)
+
+
+def profile(category, name=None, get_args=None):
+    """
+    Decorator that records a span for every call of the function.
+
+    The function is returned as it is and only replaced by an instrumented
+    version while the profiler is enabled. It is therefore looked up by its
+    ``__qualname__`` in its module, which means that this decorator has to be
+    the outermost one (``staticmethod`` is fine). Nested functions are only
+    instrumented if the profiler is enabled when they are defined.
+
+    :param get_args: Optional callable that receives the arguments of the call
+        and returns a dict that is attached to the span.
+    """
+    def decorator(func):
+        wrapper = instrument(func, category, name, get_args)
+        on_toggle(lambda value: _replace_function(func, wrapper, value))
+        return wrapper if enabled else func
+    return decorator
+
+
+def instrument(func, category, name=None, get_args=None):
+    """
+    Returns a version of ``func`` that always records a span, see
+    :func:`profile` for the arguments.
+    """
+    span_name = name or func.__qualname__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        span_args = None if get_args is None else get_args(*args, **kwargs)
+        with _Span(span_name, category, span_args):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _replace_function(func, wrapper, use_wrapper):
+    if '<locals>' in func.__qualname__:
+        return
+    *owner_names, attribute_name = func.__qualname__.split('.')
+    owner = sys.modules[func.__module__]
+    for owner_name in owner_names:
+        owner = getattr(owner, owner_name)
+
+    current = vars(owner).get(attribute_name)
+    is_staticmethod = isinstance(current, staticmethod)
+    if is_staticmethod:
+        current = current.__func__
+    if current is not func and current is not wrapper:
+        # Something else has been put there, leave it alone.
+        return
+
+    new = wrapper if use_wrapper else func
+    setattr(owner, attribute_name, staticmethod(new) if is_staticmethod else new)
+
+
+def get_statistics():
+    """
+    Returns a dict of ``(category, name)`` to a dict with the number of
+    calls, the total time and the time spent in the span itself (without its
+    children) in seconds.
+    """
+    statistics = {}
+    for category, name, start, duration, self_duration, thread_id, args in list(_events):
+        try:
+            entry = statistics[category, name]
+        except KeyError:
+            entry = statistics[category, name] = {'count': 0, 'total': 0.0, 'self': 0.0}
+        entry['count'] += 1
+        entry['total'] += duration
+        entry['self'] += self_duration
+    return statistics
+
+
+def export_chrome_trace(file):
+    """
+    Writes the recorded spans in the Chrome trace event format (JSON) to a
+    file object.
+    """
+    pid = os.getpid()
+    trace_events = []
+    for category, name, start, duration, self_duration, thread_id, args in list(_events):
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': (start - _start_time) * 1e6,
+            'dur': duration * 1e6,
+            'pid': pid,
+            'tid': thread_id,
+        }
+        if args:
+            event['args'] = {key: str(value) for key, value in args.items()}
+        trace_events.append(event)
+    json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, file)
@@ -38,12 +38,20 @@ Dynamic stuff
 .. autodata:: dynamic_params
 .. autodata:: dynamic_params_for_other_modules
 .. autodata:: auto_import_modules
+.. autodata:: literal_iteration_sample_size
 
 
 Caching
 ~~~~~~~
 
 .. autodata:: call_signatures_validity
+.. autodata:: access_result_cache_size
+
+
+Environment subprocess
+~~~~~~~~~~~~~~~~~~~~~~
+
+.. autodata:: compiled_subprocess_max_rss
 
 
 """
@@ -75,7 +83,13 @@ dynamic_flow_information = True
 '\nCheck for `isinstance` and other information to infer a type.\n'
 auto_import_modules = ['gi']
 '\nModules that will not be analyzed but imported, if they contain Python code.\nThis improves autocompletion for libraries that use ``setattr`` or\n``globals()`` modifications a lot.\n'
+literal_iteration_sample_size = 500
+'\nThe maximum number of entries that are inferred when the types of all entries\nof a list, set, tuple or dict literal are merged (e.g. in a for loop). Larger\nliterals are sampled evenly and entries with the same code are only inferred\nonce. Unpacking always sees every entry. Set it to ``None`` to always infer\nall entries.\n'
 allow_unsafe_interpreter_executions = True
 '\nControls whether descriptors are evaluated when using an Interpreter. This is\nsomething you might want to control when using Jedi from a Repl (e.g. IPython)\n\nGenerally this setting allows Jedi to execute __getitem__ and descriptors like\n`property`.\n'
 call_signatures_validity = 3.0
-'\nFinding function calls might be slow (0.1-0.5s). This is not acceptible for\nnormal writing. Therefore cache it for a short time.\n'
\ No newline at end of file
+'\nFinding function calls might be slow (0.1-0.5s). This is not acceptible for\nnormal writing. Therefore cache it for a short time.\n'
+access_result_cache_size = 10000
+'\nThe maximum number of results of compiled object accesses (e.g. ``dir()`` or\n``repr()`` of a C extension object) that are cached per inference state.\n'
+compiled_subprocess_max_rss = None
+'\nThe environment subprocess keeps all modules it imported alive. If its\nresident memory exceeds this many bytes, it is restarted between two requests.\n``None`` means that there is no limit.\n'
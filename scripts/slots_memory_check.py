@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Shows how much memory the names, lazy values, values and contexts created by
+a completion use and how much they would use with a ``__dict__`` per instance
+instead of ``__slots__``.
+
+Usage:
+  slots_memory_check.py [-p <path>] [<code>]
+  slots_memory_check.py -h | --help
+
+Options:
+  -h --help     Show this screen.
+  -p <path>     Project path, e.g. the root of a large Django project.
+"""
+import gc
+import os
+import sys
+import tracemalloc
+from collections import Counter
+
+from docopt import docopt
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__) + '/..'))
+import jedi  # noqa: E402
+from jedi.inference.base_value import Value, ValueWrapper, LazyValueWrapper  # noqa: E402
+from jedi.inference.context import AbstractContext  # noqa: E402
+from jedi.inference.lazy_value import AbstractLazyValue  # noqa: E402
+from jedi.inference.names import AbstractNameDefinition  # noqa: E402
+
+_CLASSES = (AbstractNameDefinition, AbstractLazyValue, AbstractContext,
+            Value, ValueWrapper, LazyValueWrapper)
+
+
+def _slot_values(obj):
+    for cls in type(obj).__mro__:
+        for slot in cls.__dict__.get('__slots__', ()):
+            try:
+                yield slot, getattr(obj, slot)
+            except AttributeError:
+                pass
+
+
+def main(args):
+    code = args['<code>'] or 'from django.db import models\nmodels.Model.objects.'
+    project = jedi.Project(args['-p']) if args['-p'] else None
+
+    tracemalloc.start()
+    jedi.Script(code, project=project).complete()
+    # Keep the objects alive by completing again on a fresh script.
+    script = jedi.Script(code, project=project)
+    script.complete()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    counts = Counter()
+    slotted_bytes = Counter()
+    dict_bytes = Counter()
+    for obj in gc.get_objects():
+        if not isinstance(obj, _CLASSES):
+            continue
+        name = type(obj).__name__
+        counts[name] += 1
+        size = sys.getsizeof(obj)
+        if hasattr(obj, '__dict__'):
+            slotted_bytes[name] += size + sys.getsizeof(obj.__dict__)
+            dict_bytes[name] += size + sys.getsizeof(obj.__dict__)
+        else:
+            slotted_bytes[name] += size
+            # What the instance would cost without slots: The base object and
+            # a dict with the same attributes.
+            dict_bytes[name] += sys.getsizeof(object()) + 16 \
+                + sys.getsizeof(dict(_slot_values(obj)))
+
+    print('Instances | With slots (KB) | With dicts (KB) | Class')
+    print('-' * 70)
+    for name, count in counts.most_common(25):
+        print('%9d | %15.1f | %15.1f | %s' % (
+            count, slotted_bytes[name] / 1024, dict_bytes[name] / 1024, name))
+    print('-' * 70)
+    print('%9d | %15.1f | %15.1f | Total' % (
+        sum(counts.values()),
+        sum(slotted_bytes.values()) / 1024,
+        sum(dict_bytes.values()) / 1024,
+    ))
+    print('Traced memory: current %.1f MB, peak %.1f MB' % (current / 2 ** 20, peak / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main(docopt(__doc__))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks for ``ValueSet``, the most frequently created object during
+inference. Compares the current implementation with a plain frozenset based
+one (how ``ValueSet`` used to work) and measures a few completions.
+
+Usage:
+  value_set_benchmark.py [-n <number>] [<code>...]
+  value_set_benchmark.py -h | --help
+
+Options:
+  -h --help     Show this screen.
+  -n <number>   Number of repetitions per operation [default: 100000].
+"""
+import os
+import sys
+import time
+import timeit
+import tracemalloc
+
+from docopt import docopt
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__) + '/..'))
+import jedi  # noqa: E402
+from jedi.inference.base_value import ValueSet, NO_VALUES  # noqa: E402
+
+
+class FrozenSetValueSet:
+    """The old implementation: Every operation creates a new frozenset."""
+    def __init__(self, iterable):
+        self._set = frozenset(iterable)
+        for value in iterable:
+            assert not isinstance(value, FrozenSetValueSet)
+
+    @classmethod
+    def from_sets(cls, sets):
+        return cls(set().union(*sets))
+
+    def __or__(self, other):
+        return FrozenSetValueSet(self._set | other._set)
+
+    def __iter__(self):
+        return iter(self._set)
+
+
+class Value:
+    pass
+
+
+def _operations(cls, empty):
+    a, b = Value(), Value()
+    single = cls([a])
+    double = cls([a, b])
+    return {
+        'create empty': lambda: cls([]),
+        'create single': lambda: cls([a]),
+        'union with empty': lambda: single | empty,
+        'union with itself': lambda: double | double,
+        'from_sets one non-empty': lambda: cls.from_sets([empty, single, empty]),
+        'from_sets many': lambda: cls.from_sets([single, double, single]),
+    }
+
+
+def _count_allocations(func, number):
+    tracemalloc.start()
+    snapshot = tracemalloc.take_snapshot()
+    results = [func() for _ in range(number)]
+    stats = tracemalloc.take_snapshot().compare_to(snapshot, 'filename')
+    tracemalloc.stop()
+    del results
+    return sum(stat.count_diff for stat in stats)
+
+
+def main(args):
+    number = int(args['-n'])
+    old = _operations(FrozenSetValueSet, FrozenSetValueSet([]))
+    new = _operations(ValueSet, NO_VALUES)
+
+    print('Operation                 | old (µs) | new (µs) | old allocs | new allocs')
+    print('-' * 76)
+    for name in old:
+        times = [timeit.timeit(ops[name], number=number) / number * 1e6 for ops in (old, new)]
+        allocs = [_count_allocations(ops[name], number) for ops in (old, new)]
+        print('%-25s | %8.3f | %8.3f | %10d | %10d' % (name, *times, *allocs))
+
+    print()
+    print('Time (s) | Code')
+    print('-' * 40)
+    for code in args['<code>'] or ['import os; os.path.', 'import json; json.loads("").']:
+        start = time.time()
+        jedi.Script(code).complete()
+        print('%8.3f | %s' % (time.time() - start, code))
+
+
+if __name__ == '__main__':
+    main(docopt(__doc__))
@@ -1,6 +1,7 @@
 # Exists only for completion/pytest.py
 
 import pytest
+from pytest import fixture as pytest_fixture
 
 
 @pytest.fixture()
@@ -17,6 +18,11 @@ def my_not_existing_fixture():
     return 3  # Just a normal function
 
 
+@pytest_fixture
+def aliased_conftest_fixture():
+    return b''
+
+
 @pytest.fixture()
 def inheritance_fixture():
     return ''
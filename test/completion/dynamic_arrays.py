@@ -90,6 +90,23 @@ arr2 = arr
 arr2.append('')
 #? str()
 arr2[0]
+#? str()
+arr[0]
+
+def add_float(param_arr):
+    param_arr.append(1.0)
+
+passed_arr = ['']
+add_float(passed_arr)
+#? str() float()
+passed_arr[0]
+
+# Mutations of other receivers with the same name are ignored.
+same_name_arr = [1]
+unrelated.same_name_arr.append('')
+same_name_arr.append()
+#? int()
+same_name_arr[0]
 
 
 lst = [1]
@@ -157,3 +157,30 @@ class X():
 
 
 X().x_method('')
+
+# -----------------
+# calls of other functions with the same name
+# -----------------
+
+def same_name(x):
+    #? int()
+    x
+
+class OtherSameName():
+    def same_name(self, x):
+        #? str()
+        x
+
+same_name(1)
+OtherSameName().same_name('')
+
+# -----------------
+# calls nested in other expressions
+# -----------------
+
+def nested_call(x):
+    #? int() str()
+    x
+
+str(nested_call(1))
+[nested_call('')]
@@ -97,6 +97,10 @@ def test_x(my_con
 def test_x(my_conftest_fixture):
     return
 
+def test_x(aliased_conftest_fixture):
+    #? bytes()
+    aliased_conftest_fixture
+
 #? []
 def lala(my_con
     return
@@ -152,3 +152,109 @@ def test_changing_venv(venv_path, monkeypatch):
     get_cached_default_environment()
     monkeypatch.setitem(os.environ, 'VIRTUAL_ENV', sys.executable)
     assert get_cached_default_environment().executable == sys.executable
+
+
+def test_persisted_environment_info(environment, monkeypatch):
+    if isinstance(environment, InterpreterEnvironment):
+        pytest.skip("The interpreter environment doesn't use a subprocess.")
+
+    from jedi.api import environment as environment_module
+    executable = environment.executable
+    sys_path = create_environment(executable).get_sys_path()
+
+    # The second environment is served from disk without a subprocess.
+    def fail(*args, **kwargs):
+        raise AssertionError("Should not start a subprocess")
+    monkeypatch.setattr(environment_module.CompiledSubprocess, '_send', fail)
+    env = create_environment(executable)
+    assert env.get_sys_path() == sys_path
+    assert env.version_info == environment.version_info
+    assert env.get_grammar().version_info[:2] == env.version_info[:2]
+
+
+def test_site_packages_stamp(tmpdir):
+    from jedi.api.environment import _get_site_packages_stamp
+    site_packages = tmpdir.mkdir('site-packages')
+    sys_path = [str(tmpdir), str(site_packages)]
+    stamp = _get_site_packages_stamp(sys_path)
+    assert stamp == _get_site_packages_stamp(sys_path)
+
+    # Installing a package adds a .pth file.
+    site_packages.join('foo.pth').write('/foo\n')
+    assert _get_site_packages_stamp(sys_path) != stamp
+
+
+def test_concurrent_subprocess_requests(environment):
+    if isinstance(environment, InterpreterEnvironment):
+        pytest.skip("The interpreter environment doesn't use a subprocess.")
+
+    from concurrent.futures import ThreadPoolExecutor
+    compiled_subprocess = environment._get_subprocess()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: compiled_subprocess.get_sys_path(), range(20)))
+    assert all(result == results[0] for result in results)
+
+
+def test_concurrent_load_module(environment, tmpdir):
+    if isinstance(environment, InterpreterEnvironment):
+        pytest.skip("The interpreter environment doesn't use a subprocess.")
+
+    from concurrent.futures import ThreadPoolExecutor
+    from jedi.api.project import Project
+    from jedi.inference import InferenceState
+    compiled_subprocess = environment._get_subprocess()
+    sys_path = compiled_subprocess.get_sys_path()
+
+    def load(i):
+        inference_state = InferenceState(Project(str(tmpdir)), environment)
+        # Every request replaces sys.path with a different one.
+        return inference_state.compiled_subprocess.load_module(
+            dotted_name='json',
+            sys_path=sys_path + [str(tmpdir.join(str(i)))],
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        access_paths = list(executor.map(load, range(20)))
+    assert all(access_path is not None for access_path in access_paths)
+    assert compiled_subprocess.get_sys_path() == sys_path
+
+
+def test_subprocess_memory_restart(Script, environment, monkeypatch):
+    if isinstance(environment, InterpreterEnvironment):
+        pytest.skip("The interpreter environment doesn't use a subprocess.")
+
+    compiled_subprocess = environment._get_subprocess()
+    script = Script('import math; math.sqrt', environment=environment)
+    assert script.infer()
+    restart_count = compiled_subprocess.restart_count
+
+    # Every new inference state now restarts the subprocess.
+    monkeypatch.setattr(jedi.settings, 'compiled_subprocess_max_rss', 1)
+    monkeypatch.setattr(compiled_subprocess, 'memory_check_interval', 0)
+    def_, = Script('import math; math.sqrt', environment=environment).infer()
+    assert def_.name == 'sqrt'
+    statistics = compiled_subprocess.get_statistics()
+    assert statistics['restart_count'] > restart_count
+    assert statistics['peak_memory'] > 0
+
+    # The handles of the old inference state are recreated lazily.
+    monkeypatch.setattr(jedi.settings, 'compiled_subprocess_max_rss', None)
+    assert script.complete(1, len('import math; math.sq'))
+
+
+def test_subprocess_memory_check_is_throttled(environment, monkeypatch):
+    if isinstance(environment, InterpreterEnvironment):
+        pytest.skip("The interpreter environment doesn't use a subprocess.")
+
+    compiled_subprocess = environment._get_subprocess()
+    monkeypatch.setattr(jedi.settings, 'compiled_subprocess_max_rss', 1 << 60)
+    monkeypatch.setattr(compiled_subprocess, 'memory_check_interval', 60)
+    monkeypatch.setattr(compiled_subprocess, '_last_memory_check', float('-inf'))
+    monkeypatch.setattr(compiled_subprocess, 'peak_memory', 0)
+    compiled_subprocess.check_memory()
+    assert compiled_subprocess.peak_memory > 0
+
+    # A second check within the interval doesn't ask the process.
+    compiled_subprocess.peak_memory = 0
+    compiled_subprocess.check_memory()
+    assert compiled_subprocess.peak_memory == 0
@@ -1,6 +1,9 @@
 """
 Test all things related to the ``jedi.cache`` module.
 """
+import pytest
+
+from jedi import cache
 
 
 def test_cache_get_signatures(Script):
@@ -27,3 +30,54 @@ def test_cache_get_signatures(Script):
 def test_cache_line_split_issues(Script):
     """Should still work even if there's a newline."""
     assert Script('int(\n').get_signatures()[0].name == 'int'
+
+
+def test_lru_cache():
+    from jedi.cache import LRUCache
+
+    cache = LRUCache(2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    # b was the least recently used entry.
+    with pytest.raises(KeyError):
+        cache.get('b')
+    assert cache.get('c') == 3
+
+    cache.new_generation()
+    with pytest.raises(KeyError):
+        cache.get('a')
+    assert cache.get_statistics() == {
+        'size': 0, 'max_size': 2, 'generation': 1, 'hits': 2, 'misses': 2,
+    }
+
+
+def test_cache_statistics(Script):
+    script = Script('import os\nos.path.join')
+    cache.enable_statistics()
+    try:
+        script.infer()
+        script.infer()
+    finally:
+        cache.disable_statistics()
+
+    statistics = script.get_cache_statistics()
+    for name in ('parser_cache', 'memoize_cache', 'module_cache', 'access_result_cache'):
+        entry = statistics[name]
+        assert set(entry) == {'entries', 'bytes', 'hits', 'misses'}
+    assert statistics['memoize_cache']['entries'] > 0
+    assert statistics['memoize_cache']['bytes'] > 0
+    assert statistics['memoize_cache']['hits'] > 0
+    # The parser cache doesn't count its lookups.
+    assert statistics['parser_cache']['hits'] is None
+
+    assert 'memoize_cache' not in cache.get_statistics()
+
+    # Nothing is counted while statistics are disabled, and other inference
+    # states have their own counters.
+    hits = statistics['memoize_cache']['hits']
+    script.infer()
+    assert script.get_cache_statistics()['memoize_cache']['hits'] == hits
+    other = Script('import os\nos.path.join')
+    assert other.get_cache_statistics()['memoize_cache']['hits'] == 0
@@ -53,3 +53,31 @@ def test_lambda_forward_references(Script, environment):
     # For now just receiving the 3 is ok. I'm doubting that this is what we
     # want. We also execute functions. Should we only execute classes?
     assert Script(source).infer()
+
+
+def test_forward_references_are_cached(Script):
+    from jedi.inference.gradual.annotation import _get_forward_reference_node
+
+    source = 'def foo(bar: "int", baz: "int"): bar'
+    script = Script(source)
+    assert [d.name for d in script.infer()] == ['int']
+
+    module_context = script._get_module_context()
+    node = _get_forward_reference_node(module_context, 'int')
+    assert node is _get_forward_reference_node(module_context, 'int')
+    assert node.parent is module_context.tree_node
+    assert _get_forward_reference_node(module_context, 'assert 1') is None
+
+    # A changed module is parsed again and doesn't use the old nodes.
+    new_context = Script(source + '\n')._get_module_context()
+    assert _get_forward_reference_node(new_context, 'int') is not node
+
+
+def test_type_vars_of_execution(Script):
+    source = (
+        'from typing import TypeVar, List\n'
+        'T = TypeVar("T")\n'
+        'def foo(a: T, b: "List[T]", c: int) -> T: ...\n'
+        'foo(1, [""], 1.0)'
+    )
+    assert {d.name for d in Script(source).infer()} == {'int', 'str'}
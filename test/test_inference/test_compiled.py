@@ -1,6 +1,8 @@
 from textwrap import dedent
 import sys
 import math
+import pickle
+import datetime as datetime_module
 from collections import Counter
 from datetime import datetime
 
@@ -171,3 +173,49 @@ def test_operation(Script, inference_state, create_compiled_object):
     )
     assert false.py__name__() == 'bool'
     assert true.py__name__() == 'bool'
+
+
+def test_compiled_module_snapshot(inference_state):
+    from jedi.inference.compiled.snapshot import record_module, SnapshotAccessHandle
+
+    def load_real_handle():
+        raise AssertionError("The snapshot should have been used")
+
+    snapshot = record_module(inference_state, math, 'math')
+    handle = SnapshotAccessHandle(load_real_handle, snapshot['root'])
+    assert 'sqrt' in handle.dir()
+    assert handle.get_api_type() == 'module'
+    module, sqrt = handle.getattr_paths('sqrt')
+    assert module is handle
+    assert sqrt.get_api_type() == 'function'
+    assert handle.getattr_paths('sqrt')[1] is sqrt
+    param, = sqrt.get_signature_params()
+    assert param.name == 'x'
+
+    # Members of classes have the full path from the module.
+    snapshot = record_module(inference_state, datetime_module, 'datetime')
+    handle = SnapshotAccessHandle(load_real_handle, snapshot['root'])
+    module, cls = handle.getattr_paths('datetime')
+    assert cls.get_api_type() == 'class'
+    module, cls_, now = cls.getattr_paths('now')
+    assert (module, cls_) == (handle, cls)
+    assert now.get_api_type() == 'function'
+
+    # The subprocess gets the real handle.
+    handle = SnapshotAccessHandle(lambda: 'real', snapshot['root'])
+    assert pickle.loads(pickle.dumps(handle)) == 'real'
+
+
+def test_compiled_module_snapshot_is_kept_in_memory(inference_state, monkeypatch, tmpdir):
+    from jedi import settings
+    from jedi.inference.compiled import snapshot as snapshot_module
+
+    monkeypatch.setattr(settings, 'cache_directory', str(tmpdir))
+    monkeypatch.setattr(snapshot_module, '_loaded_snapshots', {})
+    snapshot = snapshot_module.record_module(inference_state, math, 'math')
+    snapshot_module.save_snapshot(inference_state, 'math', None, snapshot)
+    tmpdir.remove()
+
+    # Other inference states don't read the file again.
+    assert snapshot_module.load_snapshot(inference_state, 'math', None) is snapshot
+    assert snapshot_module.load_snapshot(inference_state, 'math', ['foo']) is None
@@ -83,3 +83,18 @@ def test_os_stat_result(Script):
     n = d._name
     # This should not be a different stub name
     assert convert_names([n]) == [n]
+
+
+def test_conversion_is_cached(Script):
+    script = Script('import json; json.dumps')
+    d, = script.infer()
+    stub_names = convert_names([d._name], only_stubs=True)
+    python_names = convert_names(stub_names)
+    assert [n.string_name for n in python_names] == ['dumps']
+    assert not python_names[0].get_root_context().is_stub()
+
+    # Converting the same names again doesn't resolve anything new.
+    cache_size = len(script._inference_state.memoize_cache)
+    assert convert_names([d._name], only_stubs=True) == stub_names
+    assert convert_names(stub_names) == python_names
+    assert len(script._inference_state.memoize_cache) == cache_size
@@ -4,6 +4,7 @@ import pytest
 from parso.utils import PythonVersionInfo
 
 from jedi.inference.gradual import typeshed
+from jedi.inference.gradual.base import GenericClass
 from jedi.inference.value import TreeInstance, BoundMethod, FunctionValue, \
     MethodValue, ClassValue
 from jedi.inference.names import StubName
@@ -240,3 +241,21 @@ def test_django_exists_only_as_stub(Script):
     else:
         pytest.skip('django is already installed, it should only exist as a stub for this test')
     assert not Script('import django').infer()
+
+
+def test_generic_class_is_cached(Script):
+    script = Script('from typing import Dict, List\nx: Dict[str, List[int]]\n')
+    module_context = script._get_module_context()
+    expr_stmt = script._module_node.children[1].children[0]
+    annotation = expr_stmt.children[1].children[1]
+
+    dict_of_lists, = module_context.infer_node(annotation)
+    assert isinstance(dict_of_lists, GenericClass)
+    again, = module_context.infer_node(annotation)
+    assert again is dict_of_lists
+
+    # ``List[int]``, the nested annotation.
+    nested = annotation.children[1].children[1].children[2]
+    list_of_int, = module_context.infer_node(nested)
+    again, = module_context.infer_node(nested)
+    assert again is list_of_int
@@ -34,3 +34,46 @@ def test_thousand_separators(Script):
     assert _infer_literal(Script, '0x3_4') == 52
     assert _infer_literal(Script, '0b1_0') == 2
     assert _infer_literal(Script, '0o1_0') == 8
+
+
+def test_large_dict_literal_lookup(Script):
+    entries = ', '.join('"key%s": %s' % (i, i) for i in range(2000))
+    code = 'x = {%s, 1: "", True: b"", None: 1.0, "key5": ""}\n' % entries
+    assert _infer_literal(Script, code + 'x["key1999"]') == 1999
+    # The last key wins, like in Python.
+    assert _infer_literal(Script, code + 'x["key5"]') == ''
+    # 1 == True, so it's the same key.
+    assert _infer_literal(Script, code + 'x[True]') == b''
+    assert _infer_literal(Script, code + 'x[1]') == b''
+    assert _infer_literal(Script, code + 'x[None]') == 1.0
+
+
+def test_dict_literal_lookup_inferred_keys(Script):
+    code = 'k = "a"\nx = {"a": 1, k: "", "b": 1.0}\n'
+    assert _infer_literal(Script, code + 'x["a"]') == ''
+    code = 'k = "a"\nx = {k: "", "a": 1}\n'
+    assert _infer_literal(Script, code + 'x["a"]') == 1
+
+
+def test_large_sequence_literal_lookup(Script):
+    code = 'x = (%s)\n' % ', '.join(str(i) for i in range(2000))
+    assert _infer_literal(Script, code + 'x[1234]') == 1234
+    assert _infer_literal(Script, code + 'x[-1]') == 1999
+
+
+def test_sampled_literal_iteration(Script, monkeypatch):
+    from jedi import settings
+    monkeypatch.setattr(settings, 'literal_iteration_sample_size', 10)
+
+    code = 'for x in [%s, ""]: x' % ', '.join(['1'] * 5000)
+    names = Script(code).infer()
+    assert sorted(n.name for n in names) == ['int', 'str']
+
+    code = 'for x in {%s}: x' % ', '.join('%s: 1' % i for i in range(5000))
+    assert [n.name for n in Script(code).infer()] == ['int']
+
+    # Unpacking needs the entries at their positions, it's never sampled.
+    monkeypatch.setattr(settings, 'literal_iteration_sample_size', 2)
+    assert [n.name for n in Script('a, b, c = (1, 1, "")\nc').infer()] == ['str']
+    code = 'def f(a, b, c): return c\nf(*[1, 1, ""])'
+    assert [n.name for n in Script(code).infer()] == ['str']
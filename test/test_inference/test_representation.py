@@ -24,6 +24,34 @@ def test_function_execution(Script):
     assert len(func.execute_with_values()) == 1
 
 
+def test_return_values_are_shared_between_executions(Script):
+    s = """
+    class A: pass
+    def f(a):
+        return a()
+    f"""
+    func, inference_state = get_definition_and_inference_state(Script, s)
+    cls, = func.parent_context.py__getattribute__('A')
+    # Executions with the same known argument values share their result.
+    instance, = func.execute_with_values(cls)
+    again, = func.execute_with_values(cls)
+    assert again is instance
+
+    # Arguments from the syntax tree are not part of a key, the executions
+    # still work.
+    code = 'class A: pass\ndef f(a):\n    return a()\nf(A)\ndef g(b):\n    return b\ng(1)'
+    script = Script(code)
+    a, = script.infer(4, 0)
+    assert a.name == 'A'
+    i, = script.infer(7, 0)
+    assert i.name == 'int'
+
+
+def test_bound_method_execution(Script):
+    code = 'class A:\n    def m(self, v):\n        return v\nr = A().m(1)\nr'
+    assert [d.name for d in Script(code).infer()] == ['int']
+
+
 def test_class_mro(Script):
     s = """
     class X(object):
@@ -32,3 +60,120 @@ def test_class_mro(Script):
     cls, inference_state = get_definition_and_inference_state(Script, s)
     mro = cls.py__mro__()
     assert [c.name.string_name for c in mro] == ['X', 'object']
+
+
+def test_merged_class_filter(Script):
+    code = (
+        'class A:\n'
+        '    a = 1\n'
+        'class B(A):\n'
+        '    def b(self): pass\n'
+        'class C(B):\n'
+        '    a = 2\n'
+    )
+    script = Script(code + 'C().')
+    names = [c.name for c in script.complete()]
+    assert {'a', 'b', '__init__'} <= set(names)
+
+    cls, = script._get_module_context().py__getattribute__('C')
+    # ``object`` is inferred from the typeshed stubs, so the whole MRO ends
+    # up in a single merged filter.
+    merged, = cls.get_filters(
+        is_instance=True,
+        include_metaclasses=False,
+    )
+    a_name, = merged.get('a')
+    assert a_name.tree_name.line == 6
+    b_name, = merged.get('b')
+    assert b_name.tree_name.line == 4
+    init_name, = merged.get('__init__')
+    assert init_name.parent_context.is_stub()
+    assert merged.get('c') == []
+    assert {'a', 'b', '__init__'} <= {n.string_name for n in merged.values()}
+
+    node_contexts = [c.as_context() for c in cls.py__mro__() if not c.is_compiled()]
+    assert [c.tree_node.name.value for c in cls.get_defining_contexts(tuple(node_contexts), 'a')] \
+        == ['C', 'A']
+
+
+def test_value_set_reuses_objects():
+    from jedi.inference.base_value import ValueSet, NO_VALUES
+
+    one = ValueSet([1])
+    both = ValueSet([1, 2])
+    assert ValueSet([]) is NO_VALUES
+    assert one | NO_VALUES is one
+    assert NO_VALUES | one is one
+    assert one | one is one
+    assert ValueSet.from_sets([NO_VALUES, one, NO_VALUES]) is one
+    assert ValueSet.from_sets([one, both]) == both
+    assert ValueSet.from_sets([]) is NO_VALUES
+
+
+def test_value_set_copies_keep_no_values_empty():
+    import copy
+    import pickle
+    from jedi.inference.base_value import ValueSet, NO_VALUES
+
+    one = ValueSet([1])
+    assert copy.copy(one) is one
+    assert copy.deepcopy(one) is one
+    assert pickle.loads(pickle.dumps(one)) == one
+    assert pickle.loads(pickle.dumps(NO_VALUES)) is NO_VALUES
+    assert not NO_VALUES
+
+
+def test_tree_names_are_interned(Script):
+    from jedi.inference.filters import ParserTreeFilter
+
+    script = Script('x = 1\nx = 2\ny = x')
+    module_context = script._get_module_context()
+    # Flow analysis only keeps the last reachable definition.
+    first, = ParserTreeFilter(module_context).get('x')
+    second, = ParserTreeFilter(module_context).get('x')
+    assert first.tree_name.start_pos == (2, 0)
+    assert first is second
+
+    earlier, = ParserTreeFilter(module_context, until_position=(2, 0)).get('x')
+    assert earlier.tree_name.start_pos == (1, 0)
+    assert earlier is ParserTreeFilter(module_context, until_position=(2, 0)).get('x')[0]
+
+
+def test_definition_index(Script):
+    from jedi.inference.filters import _get_definition_index
+
+    code = 'x = 1\ndef f():\n    x = 2\n    x.y = 3\nx = 3\n'
+    module_node = Script(code)._module_node
+    index = _get_definition_index(module_node.get_used_names(), 'x')
+    funcdef = next(module_node.iter_funcdefs())
+    assert index[module_node][0] == [(1, 0), (5, 0)]
+    assert index[funcdef][0] == [(3, 4)]
+
+    names = Script(code + 'x').goto(6, 0)
+    assert [n.line for n in names] == [5]
+
+
+def test_self_attribute_index(Script):
+    from jedi.inference.value.instance import _get_self_attribute_index
+
+    code = (
+        'class A:\n'
+        '    def f(self):\n'
+        '        self.x = 1\n'
+        '        self.y.z = 2\n'
+        '        other.x = 3\n'
+        '    class B:\n'
+        '        def g(self):\n'
+        '            self.w = 3\n'
+    )
+    script = Script(code)
+    index = _get_self_attribute_index(script._module_node.get_used_names())
+    class_a, = script._module_node.iter_classdefs()
+    class_b = class_a.get_suite().children[-1]
+    assert {name: [n.line for n in names] for name, names in index[class_a].items()} \
+        == {'x': [3, 5], 'w': [8]}
+    assert list(index[class_b]) == ['w']
+
+    names = [c.name for c in Script(code + 'A().').complete()]
+    assert 'x' in names
+    assert 'w' not in names
@@ -33,6 +33,26 @@ def test_namedtuple_list(Script):
     assert completions == {'legs', 'length', 'large'}
 
 
+def test_namedtuple_module_is_shared(Script, monkeypatch):
+    from jedi.cache import LRUCache
+    from jedi.plugins import stdlib
+
+    cache = LRUCache(1000)
+    monkeypatch.setattr(stdlib, '_namedtuple_module_cache', cache)
+    source = dedent("""\
+        import collections
+        Cat = collections.namedtuple('Cat', ['legs', 'length'])
+        Cat(4, '').le""")
+    assert {c.name for c in Script(source).complete()} == {'legs', 'length'}
+    assert (len(cache), cache.misses) == (1, 1)
+    hits = cache.hits
+
+    # The second script doesn't parse the class again.
+    assert {c.name for c in Script(source).complete()} == {'legs', 'length'}
+    assert (len(cache), cache.misses) == (1, 1)
+    assert cache.hits > hits
+
+
 def test_namedtuple_content(Script):
     source = dedent("""\
         import collections
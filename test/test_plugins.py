@@ -0,0 +1,169 @@
+import os
+from types import SimpleNamespace
+
+from jedi import profiler
+from jedi.plugins import _PluginManager
+
+
+def _create_plugin(name, calls, dispatch_keys=None):
+    def hook(callback):
+        def wrapper(key):
+            calls.append(name)
+            return callback(key)
+        return wrapper
+
+    plugin = SimpleNamespace(__name__=name, hook=hook)
+    if dispatch_keys is not None:
+        plugin.dispatch_keys = dispatch_keys
+    return plugin
+
+
+def test_dispatch_keys():
+    calls = []
+    manager = _PluginManager()
+
+    @manager.decorate(get_dispatch_key=lambda key: key)
+    def hook(key):
+        calls.append('base')
+        return key
+
+    manager.register(
+        _create_plugin('always', calls),
+        _create_plugin('foo', calls, {'hook': {'foo'}}),
+        _create_plugin('bar', calls, {'hook': {'bar', 'foo'}}),
+    )
+
+    assert hook('foo') == 'foo'
+    assert calls == ['always', 'foo', 'bar', 'base']
+    del calls[:]
+    hook('bar')
+    assert calls == ['always', 'bar', 'base']
+    del calls[:]
+    hook('other')
+    assert calls == ['always', 'base']
+
+
+def test_execute_dispatch_key(Script):
+    from jedi.inference import _get_execute_dispatch_key
+
+    script = Script('def foo(): pass\nclass Bar: pass\nfoo\nBar\nlen')
+    for line, name in ((3, 'foo'), (4, 'Bar'), (5, 'len')):
+        value = script.infer(line, 0)[0]._name._value
+        assert _get_execute_dispatch_key(value, None) == name
+
+
+def test_builtin_plugin_dispatch_keys():
+    from jedi.plugins import stdlib, django
+
+    assert {'namedtuple', 'getattr', 'join', 'partial'} <= stdlib.dispatch_keys['execute']
+    assert 'foo' not in stdlib.dispatch_keys['execute']
+    assert {'filter', 'BaseManager'} <= django.dispatch_keys['tree_name_to_values']
+
+
+def test_plugin_statistics():
+    calls = []
+    manager = _PluginManager()
+
+    @manager.decorate()
+    def hook(key):
+        return key
+
+    manager.register(_create_plugin('plugin', calls))
+
+    profiler.reset()
+    profiler.enable()
+    try:
+        hook(1)
+        hook(2)
+    finally:
+        profiler.disable()
+    statistics = manager.get_statistics()
+    profiler.reset()
+    assert statistics['plugin.hook']['count'] == 2
+    assert statistics[__name__ + '.hook']['count'] == 2
+    assert calls == ['plugin', 'plugin']
+
+
+def test_pytest_fixture_file_index(Script, tmp_path):
+    from jedi.plugins.pytest import _get_fixture_file_index
+
+    inference_state = Script('')._inference_state
+    path = tmp_path / 'conftest.py'
+    path.write_text(
+        'import pytest\nfrom foo import imported\n\n'
+        '@pytest.fixture\ndef my_fixture():\n    pass\n\n'
+        'def no_fixture():\n    pass\n'
+    )
+    index = _get_fixture_file_index(inference_state, str(path))
+    assert index.fixture_names == {'my_fixture', 'imported'}
+    assert not index.has_plugins
+    assert _get_fixture_file_index(inference_state, str(path)) is index
+
+    # Make sure the modification is visible even on file systems with a
+    # coarse mtime resolution.
+    mtime = os.stat(path).st_mtime_ns + 2 * 10 ** 9
+    path.write_text('pytest_plugins = ["foo"]\n')
+    os.utime(path, ns=(mtime, mtime))
+    index = _get_fixture_file_index(inference_state, str(path))
+    assert index.fixture_names == frozenset()
+    assert index.has_plugins
+
+    assert _get_fixture_file_index(inference_state, str(tmp_path / 'missing.py')) is None
+
+    # Decorators are not inferred, aliases of pytest.fixture are found, too.
+    path = tmp_path / 'aliased.py'
+    path.write_text(
+        'from pytest import fixture as pytest_fixture\n\n'
+        '@pytest_fixture\ndef db():\n    pass\n'
+    )
+    index = _get_fixture_file_index(inference_state, str(path))
+    assert 'db' in index.fixture_names
+
+
+def test_django_model_field_index():
+    import parso
+    from jedi.plugins.django import _get_model_field_index
+
+    module = parso.parse(
+        'class Book(models.Model):\n'
+        '    title = models.CharField(max_length=100)\n'
+        '    author = models.ForeignKey("Author", on_delete=CASCADE)\n'
+        '    tags = ManyToManyField(Tag)\n'
+        '    price = MoneyField()\n'
+        '    objects = BookManager()\n'
+        '    def get_title(self):\n'
+        '        pass\n'
+    )
+    class_node = next(module.iter_classdefs())
+    index = _get_model_field_index(module.get_used_names(), class_node)
+    assert index == {
+        'title': ('CharField', None),
+        'author': ('ForeignKey', 'Author'),
+        'tags': ('ManyToManyField', 'Tag'),
+        'price': ('MoneyField', None),
+    }
+    assert _get_model_field_index(module.get_used_names(), class_node) is index
+
+
+def test_django_inherited_related_field(Script, tmp_path):
+    from jedi import Project
+
+    (tmp_path / 'base_models.py').write_text(
+        'from django.db import models\n\n'
+        'class Tag(models.Model):\n    tag_name = models.CharField()\n\n'
+        'class Base(models.Model):\n'
+        '    tag = models.ForeignKey(Tag, on_delete=models.CASCADE)\n'
+    )
+    code = (
+        'from django.db import models\n'
+        'from base_models import Base\n\n'
+        'class Tag(models.Model):\n    other_name = models.CharField()\n\n'
+        'class Child(Base):\n    pass\n\n'
+        'Child().tag.'
+    )
+    path = tmp_path / 'child_models.py'
+    path.write_text(code)
+    script = Script(code, path=path, project=Project(tmp_path))
+    names = {c.name for c in script.complete()}
+    assert 'tag_name' in names
+    assert 'other_name' not in names
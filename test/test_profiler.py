@@ -0,0 +1,72 @@
+import json
+from io import StringIO
+
+from jedi import profiler
+
+
+def test_profiler(Script):
+    profiler.reset()
+    profiler.enable()
+    try:
+        Script('import json\njson.dumps').infer()
+    finally:
+        profiler.disable()
+
+    statistics = profiler.get_statistics()
+    assert statistics['api', 'Script.infer']['count'] == 1
+    assert ('import', 'import_module') in statistics
+    for entry in statistics.values():
+        assert 0 <= entry['self'] <= entry['total'] + 1e-9
+
+    f = StringIO()
+    profiler.export_chrome_trace(f)
+    events = json.loads(f.getvalue())['traceEvents']
+    assert {'api', 'inference', 'import'} <= {e['cat'] for e in events}
+    assert all(e['ph'] == 'X' for e in events)
+    profiler.reset()
+
+
+def _double(x):
+    return x * 2
+
+
+_profiled_double = profiler.profile('test')(_double)
+
+
+def test_profiler_disabled():
+    # While disabled the function is not wrapped at all.
+    assert _profiled_double is _double
+
+    profiler.reset()
+    assert _double(2) == 4
+    with profiler.span('foo'):
+        pass
+    assert profiler.get_statistics() == {}
+
+    profiler.enable()
+    try:
+        assert _double is not _profiled_double
+        with profiler.span('outer', category='test'):
+            _double(3)
+    finally:
+        profiler.disable()
+    assert _double is _profiled_double
+    statistics = profiler.get_statistics()
+    assert statistics['test', 'outer']['count'] == 1
+    assert statistics['test', '_double']['count'] == 1
+    profiler.reset()
+
+
+def test_profiler_max_events():
+    profiler.reset()
+    profiler.enable(max_events=2)
+    try:
+        for i in range(5):
+            with profiler.span('span%s' % i, category='test'):
+                pass
+    finally:
+        profiler.disable()
+        profiler.enable()
+        profiler.disable()
+    assert set(profiler.get_statistics()) == {('test', 'span3'), ('test', 'span4')}
+    profiler.reset()